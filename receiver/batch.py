@@ -0,0 +1,133 @@
+"""Module defining the :class:`~receiver.batch.BatchExecution` class."""
+
+import logging
+from typing import Callable, List, Optional, Set
+from .server_command import ServerCommand
+from .command_queue import PriorityCommandQueue, priority_class, command_destination
+
+class BatchExecution:
+    """Execution of a `batch` request, which contains an ordered list of commands.
+
+    The commands (steps) are executed one after another. Each step is put into the command queue
+    when the previous one has succeeded, so the device thread executes it like any other command
+    and doesn't wait for the responses of the remote nodes. The first failed step stops the batch.
+
+    The steps inherit the priority class, the deadline and the creation time of the batch, and each step is put
+    at the front of its sub-queue, so a batch which has already started isn't delayed by the commands which arrived later.
+    While the batch runs, the device connection doesn't execute any other commands to the destinations of its steps
+    (see :attr:`destinations`), so the steps of the batch are never interleaved with the commands of other clients
+    to the same nodes, e.g. a `set_parameter` with `apply_changes` can't apply a half-written configuration.
+
+    The response contains the results of the executed steps in the `results` list, in the order of the steps.
+    Each result contains the `name` and the `status` of the step and either `data` (on success) or `message` (on error).
+    If a step fails, the response has the `error` status and the results of the remaining steps are missing.
+
+    Attributes:
+        destinations (Set[str]): 64-bit addresses of the nodes to which the steps are sent.
+    """
+
+    ALLOWED_COMMANDS = ("send", "get_parameter", "set_parameter", "execute_command", "wait")
+    """Names of the commands which may be the steps of a batch."""
+
+    def __init__(self, command : ServerCommand, command_queue : PriorityCommandQueue,
+            on_finish : Optional[Callable[["BatchExecution"], None]] = None) -> None:
+        """Prepares the execution of the batch.
+
+        Args:
+            command: the `batch` command. Its `data` field must contain the list of steps under the key `commands`.
+                Each step is a dict with the `name` and the `data` fields, like in a normal request.
+            command_queue: the queue of the device into which the steps are put.
+            on_finish: a function called with the batch when it finishes, before the response is sent.
+                If set to None, nothing is called.
+
+        Raises:
+            ValueError: when the list of steps is invalid.
+        """
+        self.command = command
+        self.command_queue = command_queue
+        self.on_finish = on_finish
+        self.steps = self._parse_steps(command.description)
+        self.destinations : Set[str] = self.step_destinations(command.description)
+        self.results : List[dict] = []
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def step_destinations(description : dict) -> Set[str]:
+        """Returns the destinations of the steps of a batch request.
+
+        Args:
+            description: the `batch` request.
+
+        Returns:
+            64-bit addresses of the nodes to which the steps are sent, as upper-case hexadecimal strings.
+        """
+        steps = (description.get("data") or {}).get("commands")
+        if not isinstance(steps, list):
+            return set()
+        destinations = {command_destination(step) for step in steps if isinstance(step, dict)}
+        destinations.discard(None)
+        return destinations
+
+    def is_step(self, command : ServerCommand) -> bool:
+        """Checks if a command is a step of this batch.
+
+        Args:
+            command: the checked command.
+        """
+        return isinstance(command.response_queue, _StepResponseQueue) and command.response_queue._batch is self
+
+    def start(self) -> None:
+        """Puts the first step into the command queue."""
+        self._put_step(0)
+
+    def _parse_steps(self, description : dict) -> List[dict]:
+        data = description.get("data") or {}
+        steps = data.get("commands")
+        if not isinstance(steps, list) or len(steps) == 0:
+            raise ValueError("The batch must contain a non-empty list of commands")
+        for index, step in enumerate(steps):
+            if not isinstance(step, dict) or step.get("name") not in self.ALLOWED_COMMANDS:
+                raise ValueError(f"Invalid command at position {index} of the batch")
+        return steps
+
+    def _put_step(self, index : int):
+        step = self.steps[index]
+        description = {"type":"request", "name":step["name"], "data":step.get("data"), "priority":priority_class(self.command.description)}
+        if "timeout" in step:
+            description["timeout"] = step["timeout"]
+        self.command_queue.put(ServerCommand(
+            description=description,
+            response_queue=_StepResponseQueue(self, index),
+            time_created=self.command.time_created,
+            deadline=self.command.deadline
+        ), front=True)
+
+    def _step_finished(self, index : int, response : dict):
+        result = {key: value for key, value in response.items() if key != "type"}
+        self.results.append(result)
+        if response["status"] != "ok":
+            self.logger.debug("Batch stopped at step %d: %s", index, response.get("message"))
+            self._finish(f"Step {index} ({result.get('name')}) failed: {response.get('message')}")
+        elif index + 1 < len(self.steps):
+            self._put_step(index + 1)
+        else:
+            self._finish(None)
+
+    def _finish(self, error : Optional[str]):
+        response = {"type":"response", "status":"ok", "name":"batch", "data":{"results":self.results}}
+        if error is not None:
+            response["status"] = "error"
+            response["message"] = error
+        if self.on_finish is not None:
+            self.on_finish(self)
+        self.command.response_queue.put(response)
+
+class _StepResponseQueue:
+    """A response queue of a step, which passes the response to the batch."""
+
+    def __init__(self, batch : BatchExecution, index : int) -> None:
+        self._batch = batch
+        self._index = index
+
+    def put(self, response : dict) -> None:
+        self._batch._step_finished(self._index, response)
@@ -0,0 +1,95 @@
+"""Module defining the :class:`~receiver.coalescing.CoalescingCommandQueue` class."""
+
+import threading, logging
+from queue import Queue
+from typing import Dict, List, Optional, Tuple
+from .server_command import ServerCommand
+from .metrics import Metrics
+from .command_queue import priority_class
+
+class CoalescingCommandQueue:
+    """A wrapper of the command queue which merges identical read-only commands.
+
+    When a read-only command arrives while an identical command of the same priority class
+    is waiting in the queue or is being executed,
+    the new command is not put into the queue. Instead, the response to the command which is already in the queue
+    is sent to the response queues of both commands.
+
+    The object can be used in place of the command queue by the servers, as it provides the `put` method.
+
+    Attributes:
+        command_queue (queue.Queue): the queue of the device into which the commands are put.
+        metrics (Metrics): the counters of executed and merged commands.
+    """
+
+    COALESCED_COMMANDS = ("get_parameter",)
+    """Names of the commands which may be merged."""
+
+    def __init__(self, command_queue : Queue, metrics : Optional[Metrics] = None) -> None:
+        """Creates the wrapper.
+
+        Args:
+            command_queue: the queue of the device into which the commands are put.
+            metrics: the counters of executed and merged commands. If set to None, they will be created automatically.
+        """
+        self.command_queue = command_queue
+        self.metrics = Metrics() if metrics is None else metrics
+        self._waiting : Dict[Tuple, Tuple[ServerCommand, List[Queue]]] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def put(self, command : ServerCommand) -> None:
+        """Puts the command into the queue or merges it with an identical command which is already there.
+
+        Args:
+            command: the command to execute.
+        """
+        key = self._coalescing_key(command.description)
+        if key is None:
+            self.command_queue.put(command)
+            return
+        with self._lock:
+            if key in self._waiting:
+                shared_command, waiting = self._waiting[key]
+                waiting.append(command.response_queue)
+                shared_command.deadline = _later_deadline(shared_command.deadline, command.deadline)
+                self.metrics.increment("radio_operations_saved")
+                self.logger.debug("Command %s merged with an identical command.", key)
+                return
+            shared_command = ServerCommand(
+                description=command.description,
+                response_queue=_FanOutQueue(self, key),
+                time_created=command.time_created,
+                deadline=command.deadline
+            )
+            self._waiting[key] = (shared_command, [command.response_queue])
+        self.metrics.increment("coalescable_commands_executed")
+        self.command_queue.put(shared_command)
+
+    def _complete(self, key : Tuple, response : dict) -> None:
+        with self._lock:
+            _, waiting = self._waiting.pop(key)
+        for response_queue in waiting:
+            response_queue.put(response)
+
+    def _coalescing_key(self, description : dict) -> Optional[Tuple]:
+        name = description.get("name")
+        if name not in self.COALESCED_COMMANDS:
+            return None
+        data = description.get("data") or {}
+        return (name, priority_class(description), (data.get("address64") or "").upper(), (data.get("at_command") or "").upper(), data.get("value"))
+
+def _later_deadline(deadline1 : Optional[float], deadline2 : Optional[float]) -> Optional[float]:
+    if deadline1 is None or deadline2 is None:
+        return None
+    return max(deadline1, deadline2)
+
+class _FanOutQueue:
+    """A response queue of a merged command. Every response put into it is sent to all merged commands."""
+
+    def __init__(self, owner : CoalescingCommandQueue, key : Tuple) -> None:
+        self._owner = owner
+        self._key = key
+
+    def put(self, response : dict) -> None:
+        self._owner._complete(self._key, response)
@@ -0,0 +1,186 @@
+"""Module defining the :class:`~receiver.command_queue.PriorityCommandQueue` class."""
+
+import threading, time
+from collections import deque, OrderedDict
+from queue import Empty
+from typing import Callable, Deque, Dict, Optional
+from .server_command import ServerCommand
+from .metrics import Metrics
+from . import config
+
+#: Priority classes of the commands, from the most to the least important.
+PRIORITY_CLASSES = ("interactive", "polling", "background")
+
+#: Priority classes of the commands which don't specify the `priority` field.
+DEFAULT_PRIORITIES = {"discover": "background"}
+
+#: Priority class of the commands which don't specify the `priority` field and are not present in `DEFAULT_PRIORITIES`.
+DEFAULT_PRIORITY = "interactive"
+
+class PriorityCommandQueue:
+    """A queue of commands for the device which serves the more important commands first
+    and shares the device fairly between the destination nodes.
+
+    The priority class of a command is given by the `priority` field of the request
+    (one of :data:`~receiver.command_queue.PRIORITY_CLASSES`).
+    Inside each class, every destination node has its own FIFO sub-queue and the sub-queues are served in round-robin order,
+    so a node with many commands (or a slow node) doesn't delay the commands to other nodes.
+    The commands without a destination (e.g. `discover`) share one sub-queue.
+
+    To prevent starvation, a command which has waited longer than `starvation_time`
+    is served before the commands of higher classes. If there are several such commands, the one waiting longest goes first.
+
+    The queue provides the `put` and `get` methods compatible with :class:`queue.Queue`.
+    Additionally, `get` accepts a function which tells if a command may be executed now.
+    The commands which may not be executed are skipped, but they keep their place in the queue.
+
+    Attributes:
+        starvation_time (float): time (in seconds) after which a waiting command is served regardless of its priority.
+    """
+
+    def __init__(self, metrics : Optional[Metrics] = None) -> None:
+        """Creates the queue.
+
+        Args:
+            metrics: the counters to which the queue adds its statistics (as the `command_queue` source).
+                If set to None, the statistics are not published.
+        """
+        self.starvation_time = config.COMMAND_STARVATION_TIME
+        self._queues : Dict[str, "OrderedDict[Optional[str], Deque[ServerCommand]]"] = {cls: OrderedDict() for cls in PRIORITY_CLASSES}
+        self._depths = {cls: 0 for cls in PRIORITY_CLASSES}
+        self._stats = {cls: {"dequeued": 0, "wait_time_total": 0.0, "wait_time_max": 0.0} for cls in PRIORITY_CLASSES}
+        self._condition = threading.Condition()
+        if metrics is not None:
+            metrics.add_source("command_queue", self.stats)
+
+    def put(self, command : ServerCommand, front : bool = False) -> None:
+        """Puts a command into the queue.
+
+        Args:
+            command: the command to put.
+            front: if True, the command is put before the commands already waiting in its sub-queue
+                (used for the steps of a batch, which continue the batch that was already taken from the queue).
+        """
+        cls = priority_class(command.description)
+        destination = command_destination(command.description)
+        with self._condition:
+            sub_queue = self._queues[cls].setdefault(destination, deque())
+            if front:
+                sub_queue.appendleft(command)
+            else:
+                sub_queue.append(command)
+            self._depths[cls] += 1
+            self._condition.notify()
+
+    def get(self, block : bool = True, timeout : Optional[float] = None,
+            ready : Optional[Callable[[ServerCommand], bool]] = None) -> ServerCommand:
+        """Removes the next command from the queue and returns it.
+
+        Args:
+            block: if True, the method waits until a command is available.
+            timeout: maximum waiting time (in seconds). None means no limit.
+            ready: a function which tells if a command may be executed now. If None, all commands may be executed.
+                When the function starts returning True for a skipped command, :meth:`wake` should be called.
+
+        Returns:
+            The command which should be executed next.
+
+        Raises:
+            queue.Empty: when there is no command available.
+        """
+        ready = ready if ready is not None else (lambda command: True)
+        end_time = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            selected = self._select(ready)
+            while not selected:
+                remaining = None if end_time is None else end_time - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise Empty
+                self._condition.wait(remaining)
+                selected = self._select(ready)
+            return self._pop(*selected)
+
+    def wake(self) -> None:
+        """Wakes up the threads waiting in :meth:`get`, so they check again which commands may be executed."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def qsize(self) -> int:
+        """Returns the number of commands in the queue."""
+        with self._condition:
+            return sum(self._depths.values())
+
+    def stats(self) -> dict:
+        """Returns the statistics of each priority class.
+
+        Returns:
+            A dict with the priority classes as keys. For each class there is the current queue depth,
+            the number of destinations with waiting commands, the number of commands taken from the queue
+            and the total and maximum waiting time of these commands.
+        """
+        with self._condition:
+            return {cls: {"depth": self._depths[cls], "destinations": len(self._queues[cls]), **self._stats[cls]}
+                for cls in PRIORITY_CLASSES}
+
+    def _select(self, ready : Callable[[ServerCommand], bool]) -> tuple:
+        now = time.monotonic()
+        best = None
+        best_time = now - self.starvation_time
+        for cls in PRIORITY_CLASSES:
+            for destination, commands in self._queues[cls].items():
+                if commands[0].time_created <= best_time and ready(commands[0]):
+                    best = (cls, destination)
+                    best_time = commands[0].time_created
+        if best is not None:
+            return best
+        for cls in PRIORITY_CLASSES:
+            for destination, commands in self._queues[cls].items():
+                if ready(commands[0]):
+                    return (cls, destination)
+        return ()
+
+    def _pop(self, cls : str, destination : Optional[str]) -> ServerCommand:
+        sub_queues = self._queues[cls]
+        command = sub_queues[destination].popleft()
+        if sub_queues[destination]:
+            sub_queues.move_to_end(destination)
+        else:
+            del sub_queues[destination]
+        self._depths[cls] -= 1
+        self._record_wait(cls, time.monotonic() - command.time_created)
+        return command
+
+    def _record_wait(self, cls : str, wait_time : float) -> None:
+        stats = self._stats[cls]
+        stats["dequeued"] += 1
+        stats["wait_time_total"] += wait_time
+        stats["wait_time_max"] = max(stats["wait_time_max"], wait_time)
+
+def priority_class(description : dict) -> str:
+    """Returns the priority class of a request.
+
+    Args:
+        description: the request.
+
+    Returns:
+        The value of the `priority` field if it's a valid priority class, otherwise the default class of the request.
+    """
+    priority = description.get("priority")
+    if priority in PRIORITY_CLASSES:
+        return priority
+    return DEFAULT_PRIORITIES.get(description.get("name"), DEFAULT_PRIORITY)
+
+def command_destination(description : dict) -> Optional[str]:
+    """Returns the destination node of a request.
+
+    Args:
+        description: the request.
+
+    Returns:
+        The 64-bit address of the destination node as an upper-case hexadecimal string
+        or None if the request isn't sent to a node.
+    """
+    data = description.get("data")
+    if not isinstance(data, dict) or not isinstance(data.get("address64"), str):
+        return None
+    return data["address64"].upper()
@@ -17,6 +17,15 @@ TCP_PORT_NOTIFY = 9021
 #: IP address on which the sockets are listening.
 IP_ADDRESS = '127.0.0.1'
 
+#: Path of the Unix domain socket used for making requests to the coordinator handler, e.g. `/run/zigbee-monitor/request.sock`.
+#: If set, the request-response server listens on it instead of `TCP_PORT_REQUEST`. It's faster than TCP over loopback
+#: when the webserver runs on the same machine. The default (None) means TCP. Not available on Windows.
+UNIX_SOCKET_REQUEST = None
+
+#: Path of the Unix domain socket used for sending notifications from coordinator handler.
+#: If set, the notification server listens on it instead of `TCP_PORT_NOTIFY`. The default (None) means TCP.
+UNIX_SOCKET_NOTIFY = None
+
 #: Serial port used for communication with the coordinator.
 #: This value must be set in the custom_config.py.
 #: The default value (None) will cause an error on the startup of coordinator handler.
@@ -28,6 +37,67 @@ DEVICE_BAUD_RATE = 9600
 #: Timeout for processing requests arriving at the TCP_PORT_REQUEST port.
 REQUEST_TIMEOUT = 25
 
+#: Time (in seconds) for which the result of the last network discovery is reused.
+#: Discovery requests may override it with the `max_age` field. Set to 0 to disable the cache.
+DISCOVERY_CACHE_TTL = 60
+
+#: Time (in seconds) after which a command waiting in the queue is executed regardless of its priority class.
+COMMAND_STARVATION_TIME = 10
+
+#: Maximum number of remote commands sent to one node which may wait for the response at the same time.
+PIPELINE_WINDOW_PER_DESTINATION = 2
+
+#: Maximum number of remote commands which may wait for the response at the same time.
+#: The default (None) means a limit matched to `DEVICE_BAUD_RATE`, see :func:`~receiver.frame_pipeline.max_in_flight_for_baud_rate`.
+PIPELINE_MAX_IN_FLIGHT = None
+
+#: Time (in seconds) after which a remote command without a response fails.
+REMOTE_COMMAND_TIMEOUT = 10
+
+#: Number of the frames in flight reserved for the nodes which have no frames in flight, so the nodes with several
+#: frames waiting for the response (e.g. unreachable nodes) can't take all of them. The default (None) means a quarter of the limit.
+PIPELINE_RESERVED_SLOTS = None
+
+#: Time (in seconds) after which a frame without a response stops counting into `PIPELINE_MAX_IN_FLIGHT`,
+#: so the frames to unreachable nodes don't block the other nodes until `REMOTE_COMMAND_TIMEOUT`.
+PIPELINE_STALE_FRAME_AGE = 2
+
+#: Default time (in seconds) for which a fan-out request collects the responses of the nodes.
+FAN_OUT_TIMEOUT = 5
+
+#: Time (in seconds) after which the command of a fan-out request to one node fails, about one round trip to a distant node.
+FAN_OUT_NODE_TIMEOUT = 1
+
+#: Maximum number of the commands of one fan-out request which are executed at once.
+#: The default (None) means a half of the frames in flight allowed by the pipeline.
+FAN_OUT_MAX_IN_FLIGHT = None
+
+#: Maximum number of notifications waiting to be sent to one client of the notification server.
+NOTIFY_BUFFER_SIZE = 1000
+
+#: What happens when the buffer of a client of the notification server is full.
+#: `drop_oldest` drops the oldest notification waiting in the buffer, `disconnect` closes the connection of the client.
+NOTIFY_OVERFLOW_POLICY = "drop_oldest"
+
+#: Maximum number of the last notifications retained for the clients which resume their subscription after reconnecting.
+NOTIFY_HISTORY_SIZE = 10000
+
+#: Maximum age (in seconds) of the notifications retained for the clients which resume their subscription.
+NOTIFY_HISTORY_AGE = 300
+
+#: Maximum time (in seconds) for which the notification server waits for the first message (`subscribe` or `resume`)
+#: of a new client before it starts sending all notifications to the client.
+NOTIFY_FIRST_MESSAGE_WAIT = 1.0
+
+#: Time (in seconds) without any data after which a TCP keepalive probe is sent to a client.
+TCP_KEEPALIVE_IDLE = 10
+
+#: Time (in seconds) between the TCP keepalive probes.
+TCP_KEEPALIVE_INTERVAL = 5
+
+#: Number of unanswered TCP keepalive probes after which the connection of a client is considered dead.
+TCP_KEEPALIVE_COUNT = 3
+
 try:
     from .custom_config import *
 except ImportError:
@@ -0,0 +1,77 @@
+"""Module defining the event loop on which the servers of the coordinator handler run."""
+
+import asyncio, threading, logging
+from concurrent.futures import Future
+from typing import Coroutine
+
+class ServerEventLoop:
+    """An asyncio event loop running in a daemon thread.
+
+    All connections of the request-response and notification servers are handled by the coroutines on this loop,
+    so an idle or slow client costs only a few buffers instead of a thread.
+
+    Attributes:
+        loop (asyncio.AbstractEventLoop): the event loop.
+    """
+
+    def __init__(self) -> None:
+        """Creates the event loop. The loop doesn't run until :meth:`start` is called."""
+        self.loop = asyncio.new_event_loop()
+        self._thread = None
+        self.logger = logging.getLogger(__name__)
+
+    def start(self) -> None:
+        """Starts the event loop in a daemon thread. Calling the method when the loop is already running has no effect."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._thread_func, daemon=True)
+        self._thread.start()
+
+    def run_coroutine(self, coroutine : Coroutine) -> Future:
+        """Schedules a coroutine on the event loop. The method is thread-safe.
+
+        Args:
+            coroutine: the coroutine to run.
+
+        Returns:
+            A future with the result of the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def _thread_func(self):
+        asyncio.set_event_loop(self.loop)
+        self.logger.debug("Server event loop started.")
+        try:
+            self.loop.run_forever()
+        finally:
+            self.logger.debug("Server event loop stopped.")
+
+class FutureResponseQueue:
+    """A response queue which resolves an asyncio future on the event loop.
+
+    It's used as the `response_queue` of a :class:`~receiver.server_command.ServerCommand`,
+    so the device thread (or any other thread) can send the response to a coroutine waiting on the event loop.
+    Only the first response is delivered, the following ones are ignored.
+    """
+
+    def __init__(self, loop : asyncio.AbstractEventLoop) -> None:
+        """Creates the queue and its future.
+
+        Args:
+            loop: the event loop on which the response is awaited.
+        """
+        self._loop = loop
+        self.future = loop.create_future()
+        """The future resolved with the response."""
+
+    def put(self, response : dict) -> None:
+        """Sends the response to the event loop. The method is thread-safe.
+
+        Args:
+            response: the response to the command.
+        """
+        self._loop.call_soon_threadsafe(self._set_result, response)
+
+    def _set_result(self, response : dict):
+        if not self.future.done():
+            self.future.set_result(response)
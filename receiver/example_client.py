@@ -6,7 +6,7 @@ At the end -p switch may be added. If it's present the script will execute reque
 otherwise it will execute the requests from :func:`~receiver.example_client.prepare_sequential_requests`.
 """
 
-import socket, base64, threading, time, sys
+import base64, threading, time, sys
 from . import socket_common, config
 
 
@@ -60,13 +60,13 @@ def execute_sequential_requests(requests : list[dict]) -> None:
     Args:
         requests: the requests to execute
     """
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.connect((config.IP_ADDRESS, config.TCP_PORT_REQUEST))
-        remaining = ""
+    with socket_common.connect(config.IP_ADDRESS, config.TCP_PORT_REQUEST, config.UNIX_SOCKET_REQUEST) as s:
+        reader = socket_common.SocketReader(s)
+        writer = socket_common.SocketWriter(s)
         for request in requests:
             print("Request:", request)
-            socket_common.send_json(s, request)
-            response, remaining = socket_common.recv_json(s, remaining)
+            writer.send_message(request)
+            response = reader.recv_message()
             print("Response:", response)
         s.close()
 
@@ -99,8 +99,7 @@ def execute_one_request(request : dict, id : int) -> None:
         request: the request to execute.
         id: id of the request.
     """
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.connect((config.IP_ADDRESS, config.TCP_PORT_REQUEST))
+    with socket_common.connect(config.IP_ADDRESS, config.TCP_PORT_REQUEST, config.UNIX_SOCKET_REQUEST) as s:
         remaining = ""
         print(f"Request ({id}):", request)
         socket_common.send_json(s, request)
@@ -113,11 +112,10 @@ def notifications_thread_func() -> None:
     It should run in a separate thread.
 
     """
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.connect((config.IP_ADDRESS, config.TCP_PORT_NOTIFY))
-        remaining = ""
+    with socket_common.connect(config.IP_ADDRESS, config.TCP_PORT_NOTIFY, config.UNIX_SOCKET_NOTIFY) as s:
+        reader = socket_common.SocketReader(s)
         while True:
-            notification, remaining = socket_common.recv_json(s, remaining)
+            notification = reader.recv_message()
             print("Notification:", notification)
 
 
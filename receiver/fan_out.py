@@ -0,0 +1,136 @@
+"""Module defining the :class:`~receiver.fan_out.FanOutExecution` class."""
+
+import threading, time, logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
+from .server_command import ServerCommand
+from .command_queue import PriorityCommandQueue, priority_class
+from . import config
+
+#: Time (in seconds) reserved before the deadline of the request for sending the partial results.
+RESPONSE_MARGIN = 0.5
+
+class FanOutExecution:
+    """Execution of a `fan_out` request, which reads one AT parameter from many nodes at once.
+
+    A `get_parameter` command to every node is put into the command queue, at most `max_in_flight` at once,
+    so the frames are sent back to back through the pipeline, but the fan-out doesn't take the whole pipeline.
+    Each command times out after `FAN_OUT_NODE_TIMEOUT` seconds, so a node which doesn't respond doesn't hold
+    its place for the whole collection time. The responses are collected until all nodes respond or the collection
+    time ends. Then the response with the results received so far is sent.
+
+    The response contains the `results` dict, with the 64-bit addresses of the nodes as keys.
+    Each result contains the `status` and either `result` (base64-encoded value) or `message` (error description).
+    The nodes which didn't respond (their command timed out or wasn't sent before the end of the collection)
+    are listed in `missing`.
+
+    Attributes:
+        addresses (List[str]): 64-bit addresses of the nodes as upper-case hexadecimal strings.
+        deadline (float): the time (from :func:`time.monotonic`) when the collection of the responses ends.
+        max_in_flight (int): maximum number of the commands to the nodes which are executed at once.
+    """
+
+    def __init__(self, command : ServerCommand, command_queue : PriorityCommandQueue, addresses : List[str], max_in_flight : int) -> None:
+        """Prepares the execution of the fan-out command.
+
+        Args:
+            command: the `fan_out` command. Its `data` field must contain `at_command` and may contain `value`
+                and `timeout` (collection time in seconds, `FAN_OUT_TIMEOUT` by default).
+            command_queue: the queue of the device into which the commands to the nodes are put.
+            addresses: 64-bit addresses of the nodes to query.
+            max_in_flight: maximum number of the commands to the nodes which are executed at once.
+
+        Raises:
+            ValueError: when the request is invalid.
+        """
+        self.command = command
+        self.command_queue = command_queue
+        data = command.description.get("data") or {}
+        if not isinstance(data.get("at_command"), str):
+            raise ValueError("The AT command is missing")
+        self.addresses = list(dict.fromkeys(address.upper() for address in addresses))
+        self.deadline = self._collection_deadline(data.get("timeout"))
+        self.max_in_flight = max(1, max_in_flight)
+        self._results : Dict[str, dict] = {}
+        self._missing : Set[str] = set()
+        self._waiting : Deque[str] = deque(self.addresses)
+        self._finished = False
+        self._lock = threading.Lock()
+        self._timer : Optional[threading.Timer] = None
+        self.logger = logging.getLogger(__name__)
+
+    def start(self) -> None:
+        """Puts the first commands into the command queue and starts measuring the collection time."""
+        if not self.addresses:
+            self._finish()
+            return
+        self._timer = threading.Timer(max(0, self.deadline - time.monotonic()), self._finish)
+        self._timer.daemon = True
+        self._timer.start()
+        with self._lock:
+            first = [self._waiting.popleft() for _ in range(min(self.max_in_flight, len(self._waiting)))]
+        for address in first:
+            self._put_command(address)
+
+    def _collection_deadline(self, timeout : Optional[float]) -> float:
+        timeout = timeout if isinstance(timeout, (int, float)) and timeout > 0 else config.FAN_OUT_TIMEOUT
+        deadline = time.monotonic() + timeout
+        if self.command.deadline is not None:
+            deadline = min(deadline, self.command.deadline - RESPONSE_MARGIN)
+        return deadline
+
+    def _put_command(self, address : str):
+        data = self.command.description["data"]
+        description = {
+            "type":"request",
+            "name":"get_parameter",
+            "data":{"address64":address, "at_command":data["at_command"], "value":data.get("value")},
+            "priority":priority_class(self.command.description),
+            "timeout":config.FAN_OUT_NODE_TIMEOUT
+        }
+        self.command_queue.put(ServerCommand(
+            description=description,
+            response_queue=_NodeResponseQueue(self, address),
+            time_created=self.command.time_created,
+            deadline=self.deadline
+        ))
+
+    def _node_finished(self, address : str, response : dict):
+        with self._lock:
+            if self._finished:
+                return
+            if response["status"] == "ok":
+                self._results[address] = {"status":"ok", "result":response["data"]["result"]}
+            elif response.get("timeout"):
+                # The command timed out (in the pipeline or still in the queue), so the node didn't respond.
+                self._missing.add(address)
+            else:
+                self._results[address] = {"status":"error", "message":response.get("message")}
+            all_finished = len(self._results) + len(self._missing) == len(self.addresses)
+            next_address = self._waiting.popleft() if self._waiting else None
+        if next_address is not None:
+            self._put_command(next_address)
+        if all_finished:
+            self._finish()
+
+    def _finish(self):
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+            results = dict(self._results)
+        if self._timer is not None:
+            self._timer.cancel()
+        missing = [address for address in self.addresses if address not in results]
+        self.logger.debug("Fan-out finished: %d responses, %d missing.", len(results), len(missing))
+        self.command.response_queue.put({"type":"response", "status":"ok", "name":"fan_out", "data":{"results":results, "missing":missing}})
+
+class _NodeResponseQueue:
+    """A response queue of the command to one node, which passes the response to the fan-out execution."""
+
+    def __init__(self, fan_out : FanOutExecution, address : str) -> None:
+        self._fan_out = fan_out
+        self._address = address
+
+    def put(self, response : dict) -> None:
+        self._fan_out._node_finished(self._address, response)
@@ -0,0 +1,238 @@
+"""Module defining the :class:`~receiver.frame_pipeline.FramePipeline` class."""
+
+import threading, time, logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set
+from digi.xbee.devices import XBeeDevice
+from digi.xbee.packets.base import XBeePacket
+from .server_command import ServerCommand
+from .metrics import Metrics
+from . import config
+
+#: Signature of the function called when a command sent through the pipeline is completed.
+#: The arguments are the command, its result (None on error) and the error (None on success).
+CompletionCallback = Callable[[ServerCommand, Optional[dict], Optional[Exception]], None]
+
+def max_in_flight_for_baud_rate(baud_rate : int) -> int:
+    """Returns the default limit of frames in flight for the given baud rate of the serial port.
+
+    One frame is allowed per 2400 bit/s of the serial link, but no less than 4 and no more than 64.
+
+    Args:
+        baud_rate: baud rate of the serial port used for communication with the coordinator.
+
+    Returns:
+        The maximum number of frames in flight.
+    """
+    return max(4, min(64, baud_rate // 2400))
+
+@dataclass
+class _InFlightFrame:
+    command : ServerCommand
+    destination : str
+    response_type : type
+    handle_response : Callable[[XBeePacket], dict]
+    deadline : float
+    stale_time : float
+    stale : bool = False
+
+class FramePipeline:
+    """Sends API frames to remote nodes without waiting for the responses.
+
+    Each frame gets its own frame ID. The responses of the nodes are correlated with the sent frames by the frame ID,
+    so several frames may be in flight at once. The number of frames in flight is limited per destination node
+    and for the whole pipeline. A frame without a response after `timeout` seconds is completed with an error.
+
+    Unreachable nodes mustn't take the whole pipeline, so:
+    - `reserved_slots` of the frames in flight may be used only by the nodes which have no frames in flight,
+    - a frame without a response after `stale_age` seconds stops counting into `max_in_flight`,
+    - after a frame to a node times out, the node may have only one frame in flight until it responds again.
+
+    The frames must be sent from one thread (the device thread). The responses are handled on the threads of the XBee library.
+
+    Attributes:
+        device (digi.xbee.devices.XBeeDevice): the local device through which the frames are sent.
+        window_per_destination (int): maximum number of frames in flight to one destination node.
+        max_in_flight (int): maximum number of frames in flight in total.
+        reserved_slots (int): number of the frames in flight reserved for the nodes which have no frames in flight.
+        stale_age (float): time (in seconds) after which a frame without a response stops counting into `max_in_flight`.
+        timeout (float): time (in seconds) after which a frame without a response is completed with an error.
+    """
+
+    def __init__(self, device : XBeeDevice, on_complete : CompletionCallback, metrics : Optional[Metrics] = None,
+            on_capacity : Optional[Callable[[], None]] = None) -> None:
+        """Creates the pipeline.
+
+        Args:
+            device: the local device through which the frames are sent.
+            on_complete: the function called when a command is completed, either by a response or by an error.
+            metrics: the counters to which the pipeline adds its statistics. If set to None, they will be created automatically.
+            on_capacity: the function called whenever a frame stops being in flight, so another frame may be sent.
+        """
+        self.device = device
+        self.window_per_destination = config.PIPELINE_WINDOW_PER_DESTINATION
+        self.max_in_flight = config.PIPELINE_MAX_IN_FLIGHT
+        if self.max_in_flight is None:
+            self.max_in_flight = max_in_flight_for_baud_rate(config.DEVICE_BAUD_RATE)
+        self.reserved_slots = config.PIPELINE_RESERVED_SLOTS
+        if self.reserved_slots is None:
+            self.reserved_slots = max(1, self.max_in_flight // 4)
+        self.stale_age = config.PIPELINE_STALE_FRAME_AGE
+        self.timeout = config.REMOTE_COMMAND_TIMEOUT
+        self.metrics = Metrics() if metrics is None else metrics
+        self._on_complete = on_complete
+        self._on_capacity = on_capacity
+        self._in_flight : Dict[int, _InFlightFrame] = {}
+        self._per_destination : Dict[str, int] = {}
+        self._counted = 0
+        self._suspects : Set[str] = set()
+        self._condition = threading.Condition()
+        self.logger = logging.getLogger(__name__)
+        self.metrics.add_source("pipeline", self.stats)
+
+    def start(self) -> None:
+        """Starts receiving the responses and checking the timeouts. The device must be open."""
+        self.device.add_packet_received_callback(self._packet_received_callback)
+        threading.Thread(target=self._expiry_thread_func, daemon=True).start()
+
+    def has_capacity(self, destination : str) -> bool:
+        """Checks if a frame to the destination may be sent now.
+
+        Args:
+            destination: 64-bit address of the destination node as a hexadecimal string.
+        """
+        with self._condition:
+            return self._has_capacity_no_lock(destination)
+
+    def wait_for_capacity(self, destination : str) -> None:
+        """Waits until a frame to the destination may be sent.
+
+        Args:
+            destination: 64-bit address of the destination node as a hexadecimal string.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._has_capacity_no_lock(destination))
+
+    def send(self, command : ServerCommand, destination : str, make_packet : Callable[[int], XBeePacket],
+            response_type : type, handle_response : Callable[[XBeePacket], dict], timeout : Optional[float] = None) -> None:
+        """Sends a frame without waiting for the response.
+
+        The method doesn't check the limits of frames in flight, :meth:`wait_for_capacity` should be called before.
+
+        Args:
+            command: the command which is executed by sending the frame.
+            destination: 64-bit address of the destination node as a hexadecimal string.
+            make_packet: a function creating the packet with the given frame ID.
+            response_type: the class of the response packet.
+            handle_response: a function which converts the response packet to the result of the command.
+                It may raise an exception, which is then the error of the command.
+            timeout: time (in seconds) after which the frame without a response fails. If None, `self.timeout` is used.
+
+        Raises:
+            Exception: when the packet couldn't be created or sent.
+        """
+        with self._condition:
+            frame_id = self._allocate_frame_id()
+            packet = make_packet(frame_id)
+            timeout = self.timeout if timeout is None else timeout
+            now = time.monotonic()
+            frame = _InFlightFrame(command, destination, response_type, handle_response, now + timeout, now + self.stale_age)
+            self._in_flight[frame_id] = frame
+            self._per_destination[destination] = self._per_destination.get(destination, 0) + 1
+            self._counted += 1
+            self._condition.notify_all()
+        try:
+            self.device.send_packet(packet, sync=False)
+            self.metrics.increment("frames_sent")
+        except Exception:
+            self._pop_frame(frame_id)
+            raise
+
+    def stats(self) -> dict:
+        """Returns the current number of frames in flight and the limits."""
+        with self._condition:
+            return {
+                "in_flight": len(self._in_flight),
+                "stale": len(self._in_flight) - self._counted,
+                "destinations": len(self._per_destination),
+                "suspect_destinations": len(self._suspects),
+                "max_in_flight": self.max_in_flight,
+                "window_per_destination": self.window_per_destination
+            }
+
+    def _has_capacity_no_lock(self, destination : str) -> bool:
+        in_flight = self._per_destination.get(destination, 0)
+        window = 1 if destination in self._suspects else self.window_per_destination
+        limit = self.max_in_flight if in_flight == 0 else self.max_in_flight - self.reserved_slots
+        return in_flight < window and self._counted < limit
+
+    def _allocate_frame_id(self) -> int:
+        for _ in range(255):
+            frame_id = self.device.get_next_frame_id()
+            if frame_id != 0 and frame_id not in self._in_flight:
+                return frame_id
+        raise RuntimeError("No free frame ID")
+
+    def _pop_frame(self, frame_id : int) -> Optional[_InFlightFrame]:
+        with self._condition:
+            frame = self._in_flight.pop(frame_id, None)
+            if frame is not None:
+                self._per_destination[frame.destination] -= 1
+                if self._per_destination[frame.destination] == 0:
+                    del self._per_destination[frame.destination]
+                if not frame.stale:
+                    self._counted -= 1
+                self._condition.notify_all()
+        if frame is not None and self._on_capacity is not None:
+            self._on_capacity()
+        return frame
+
+    def _packet_received_callback(self, packet : XBeePacket):
+        frame_id = getattr(packet, "frame_id", None)
+        with self._condition:
+            frame = self._in_flight.get(frame_id)
+            if frame is None or not isinstance(packet, frame.response_type):
+                return
+        frame = self._pop_frame(frame_id)
+        if frame is None:
+            return
+        with self._condition:
+            self._suspects.discard(frame.destination)
+        try:
+            result = frame.handle_response(packet)
+        except Exception as err:
+            self._on_complete(frame.command, None, err)
+        else:
+            self._on_complete(frame.command, result, None)
+        self.metrics.increment("frames_completed")
+
+    def _expiry_thread_func(self):
+        while True:
+            with self._condition:
+                times = [frame.deadline if frame.stale else min(frame.deadline, frame.stale_time) for frame in self._in_flight.values()]
+                timeout = None if not times else max(0, min(times) - time.monotonic())
+                self._condition.wait(timeout)
+            self._mark_stale_frames()
+            self._expire_frames()
+
+    def _mark_stale_frames(self):
+        now = time.monotonic()
+        with self._condition:
+            stale = [frame for frame in self._in_flight.values() if not frame.stale and frame.stale_time <= now]
+            for frame in stale:
+                frame.stale = True
+                self._counted -= 1
+        if stale and self._on_capacity is not None:
+            self._on_capacity()
+
+    def _expire_frames(self):
+        now = time.monotonic()
+        with self._condition:
+            expired = [frame_id for frame_id, frame in self._in_flight.items() if frame.deadline <= now]
+        for frame_id in expired:
+            frame = self._pop_frame(frame_id)
+            if frame is not None:
+                with self._condition:
+                    self._suspects.add(frame.destination)
+                self.metrics.increment("frames_timed_out")
+                self._on_complete(frame.command, None, TimeoutError(f"No response from {frame.destination}"))
@@ -0,0 +1,51 @@
+"""Module defining the :class:`~receiver.metrics.Metrics` class."""
+
+import threading
+from typing import Callable, Dict
+
+class Metrics:
+    """Thread-safe collection of counters describing the work of the coordinator handler.
+
+    The counters are created on the first increment. Besides the counters, other objects may register
+    sources of values computed on demand (e.g. current queue lengths).
+    A snapshot of all values is returned to the clients in response to the `stats` request.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty collection of counters."""
+        self._lock = threading.Lock()
+        self._counters : Dict[str, float] = {}
+        self._sources : Dict[str, Callable[[], dict]] = {}
+
+    def increment(self, name : str, value : float = 1) -> None:
+        """Increments a counter.
+
+        Args:
+            name: name of the counter.
+            value: the value which will be added to the counter.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def add_source(self, name : str, source : Callable[[], dict]) -> None:
+        """Registers a source of values computed when a snapshot is made.
+
+        Args:
+            name: the key under which the values will be present in the snapshot.
+            source: a function returning the values. It must be thread-safe.
+        """
+        with self._lock:
+            self._sources[name] = source
+
+    def snapshot(self) -> dict:
+        """Returns the current values of all counters and sources.
+
+        Returns:
+            A dict with the counters under the key `counters` and the values of each source under its name.
+        """
+        with self._lock:
+            result = {"counters": dict(self._counters)}
+            sources = list(self._sources.items())
+        for name, source in sources:
+            result[name] = source()
+        return result
@@ -0,0 +1,91 @@
+"""Module defining the :class:`~receiver.notification_history.NotificationHistory` class."""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional, Tuple
+
+@dataclass
+class HistoryEntry:
+    """A notification retained in the history."""
+
+    seq: int
+    """Sequence number of the notification."""
+
+    time_added: float
+    """The time (from :func:`time.monotonic`) when the notification was added to the history."""
+
+    notification: dict
+    """The notification."""
+
+    message: bytes
+    """The notification serialized for sending."""
+
+class NotificationHistory:
+    """A ring buffer of the last notifications, which lets the subscribers catch up after reconnecting.
+
+    The history is bounded by the number of notifications and by their age, whichever is reached first.
+    It's not thread-safe, it should be used only on the event loop of the notification server.
+
+    Attributes:
+        max_size (int): maximum number of retained notifications.
+        max_age (float): maximum age (in seconds) of a retained notification.
+    """
+
+    def __init__(self, max_size : int, max_age : float) -> None:
+        """Creates an empty history.
+
+        Args:
+            max_size: maximum number of retained notifications.
+            max_age: maximum age (in seconds) of a retained notification.
+        """
+        self.max_size = max_size
+        self.max_age = max_age
+        self._entries : Deque[HistoryEntry] = deque()
+        self._last_seq : Optional[int] = None
+
+    def add(self, seq : int, notification : dict, message : bytes) -> None:
+        """Adds a notification to the history and removes the notifications which are too old.
+
+        Args:
+            seq: sequence number of the notification. It must be greater than the numbers of the previous notifications.
+            notification: the notification.
+            message: the notification serialized for sending.
+        """
+        self._entries.append(HistoryEntry(seq, time.monotonic(), notification, message))
+        self._last_seq = seq
+        while len(self._entries) > self.max_size:
+            self._entries.popleft()
+        self._remove_expired()
+
+    def since(self, seq : Optional[int]) -> Tuple[List[HistoryEntry], bool]:
+        """Returns the retained notifications with sequence numbers greater than `seq`.
+
+        Args:
+            seq: the sequence number of the last notification received by the subscriber.
+                None means that the subscriber wants all retained notifications.
+
+        Returns:
+            A tuple with two elements
+                - The notifications, from the oldest.
+                - True if some notifications after `seq` are not retained anymore, so the subscriber has missed them.
+        """
+        self._remove_expired()
+        entries = [entry for entry in self._entries if seq is None or entry.seq > seq]
+        if seq is None or self._last_seq is None or seq >= self._last_seq:
+            return entries, False
+        first_retained = entries[0].seq if entries else self._last_seq + 1
+        return entries, first_retained > seq + 1
+
+    @property
+    def last_seq(self) -> Optional[int]:
+        """The sequence number of the last added notification, or None if no notification was added."""
+        return self._last_seq
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove_expired(self):
+        oldest_allowed = time.monotonic() - self.max_age
+        while self._entries and self._entries[0].time_added < oldest_allowed:
+            self._entries.popleft()
@@ -1,25 +1,63 @@
 """The module defining the class used for sending notifications to the client.
 """
 
-import socket, threading, logging
+import asyncio, threading, logging
+from collections import deque
 from queue import Queue
-from . import socket_common
+from typing import Deque, Dict, List, Optional, Tuple
+from .event_loop import ServerEventLoop
+from .metrics import Metrics
+from .subscriptions import SubscriptionIndex, SubscriptionFilter
+from .notification_history import HistoryEntry, NotificationHistory
+from . import config, socket_common
 
 class SocketNotifyServer:
     """A server which sends notifications of the messages received from the coordinator.
-    
+
     It uses a publish-subscribe model.
     It opens a socket, to which the clients can connect.
     Whenever a message is received, the server sends a notification to all of the clients connected to the socket.
+    All connections are handled by coroutines on the server event loop, not by separate threads.
+
+    Each notification is serialized once and put into the outgoing buffer of every subscriber.
+    The buffers are bounded (`buffer_size` notifications), so a slow subscriber doesn't delay the others
+    and doesn't make the server use more and more memory. When the buffer of a subscriber is full,
+    `overflow_policy` decides what happens: `drop_oldest` drops the oldest notification from the buffer,
+    `disconnect` closes the connection of the subscriber.
+
+    By default, a subscriber gets all notifications. It may limit them by sending a subscription message, e.g.
+    `{"type":"subscribe", "filters":[{"address64":"0013A200418D05FC"}, {"prefix":"cG90"}]}`.
+    A notification is sent if any of the filters matches it. A filter matches the messages from the node `address64`
+    (any node if not present) which begin with `prefix` (base64-encoded, any message if not present).
+    Each subscription message replaces the previous filters, an empty list restores receiving all notifications.
+    The filters are kept in a :class:`~receiver.subscriptions.SubscriptionIndex`.
+
+    The last notifications are retained in a :class:`~receiver.notification_history.NotificationHistory`.
+    A subscriber which reconnects may get the notifications it has missed by sending
+    `{"type":"resume", "epoch":"...", "since":123}`, where `epoch` and `since` are the `epoch` and `seq` fields
+    of the last notification it has received. If the epoch is different (the coordinator handler has been restarted),
+    all retained notifications are sent. The server answers with `{"type":"resumed", "epoch":"...", "replayed":10, "gap":false}`,
+    followed by the replayed notifications matching the filters of the subscriber. `gap` is true if some notifications
+    are not retained anymore, so they can't be replayed.
+
+    A new subscriber doesn't get any notifications until it sends `subscribe` or `resume`, or until `NOTIFY_FIRST_MESSAGE_WAIT`
+    seconds pass. Then it gets the notifications which arrived since it connected (or since `since`), followed by the new ones,
+    so no notification is missed, sent twice or out of order. `resume` should therefore be the first message of the subscriber.
 
     Attributes:
         address (str): IP Address on which the socket will listen.
         port (str): TCP port on which the socket will listen.
+        unix_path (Optional[str]): path of the Unix domain socket on which the server listens instead of the TCP port.
+            None means that TCP is used.
         notify_queue (Queue): the queue from which the server gets the notifications (received messages),
             which will be sent to the clients.
+        metrics (Metrics): the counters to which the server adds the numbers of dropped notifications and disconnected subscribers.
+        buffer_size (int): maximum number of notifications waiting to be sent to one subscriber.
+        overflow_policy (str): what happens when the buffer of a subscriber is full (`drop_oldest` or `disconnect`).
     """
 
-    def __init__(self, address : str, port : int, notify_queue : Queue) -> None:
+    def __init__(self, address : str, port : int, notify_queue : Queue, metrics : Optional[Metrics] = None,
+            event_loop : Optional[ServerEventLoop] = None, unix_path : Optional[str] = None) -> None:
         """Creates a server.
 
         Args:
@@ -27,83 +65,208 @@ class SocketNotifyServer:
             port: TCP port on which the socket will listen.
             notify_queue: the queue from which the server gets the notifications,
                 which will be sent to the clients.
+            metrics: the counters of the coordinator handler. If set to None, they will be created automatically.
+            event_loop: the event loop on which the server runs. If set to None, it will be created automatically.
+            unix_path: path of the Unix domain socket on which the server listens instead of the TCP port.
+                If set to None, TCP is used.
         """
         self.address = address
         self.port = port
+        self.unix_path = unix_path
         self.notify_queue = notify_queue
-        self._connections = []
-        self._connection_list_lock = threading.Lock()
+        self.metrics = Metrics() if metrics is None else metrics
+        self.event_loop = ServerEventLoop() if event_loop is None else event_loop
+        self.buffer_size = config.NOTIFY_BUFFER_SIZE
+        self.overflow_policy = config.NOTIFY_OVERFLOW_POLICY
+        self._subscribers : Dict[asyncio.StreamWriter, "_Subscriber"] = {}
+        self._index = SubscriptionIndex()
+        self._history = NotificationHistory(config.NOTIFY_HISTORY_SIZE, config.NOTIFY_HISTORY_AGE)
+        self._epoch : Optional[str] = None
         self._configure_logger()
+        self.metrics.add_source("notify_server", self.stats)
 
     def run(self):
-        """Starts the server. The server is run in another daemon thread."""
+        """Starts the server. The server is run on the event loop, which is started if it's not running yet."""
+        self.event_loop.start()
+        self.event_loop.run_coroutine(self._serve())
+
+    def stats(self) -> dict:
+        """Returns the number of subscribers, the number of their filters and the total number of notifications waiting in their buffers."""
+        subscribers = list(self._subscribers.values())
+        return {"subscribers": len(subscribers), "filters": self._index.filter_count(),
+            "buffered": sum(len(subscriber.buffer) for subscriber in subscribers), "history": len(self._history)}
 
-        accepting_thread = threading.Thread(target=self._accepting_thread_func, daemon=True)
-        accepting_thread.start()
-    
-    def _accepting_thread_func(self):
+    async def _serve(self):
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind((self.address, self.port))
-                s.listen(5)
-                print(f"Coordinator handler: notification server listening on {self.address}:{self.port}.")
-                self.logger.info(f"Notification server started and is listening on {self.address}:{self.port}.")
-                notify_thread = threading.Thread(target=self._notify_thread_func, daemon=True)
-                notify_thread.start()
-                while True:
-                    conn, addr = s.accept()
-                    self.logger.debug(f"Accepted connection from {addr}.")
-                    self._add_connection(conn)
+            server = await socket_common.start_server(self._handle_connection, self.address, self.port, self.unix_path)
         except Exception as e:
             print(f"Coordinator handler: Notification server stopped because of an error: {e}")
             self.logger.error(f"Notification server stopped because of an error: {e}")
             raise
+        endpoint = socket_common.endpoint_name(self.address, self.port, self.unix_path)
+        print(f"Coordinator handler: notification server listening on {endpoint}.")
+        self.logger.info(f"Notification server started and is listening on {endpoint}.")
+        notify_thread = threading.Thread(target=self._notify_thread_func, args=(asyncio.get_running_loop(),), daemon=True)
+        notify_thread.start()
+        async with server:
+            await server.serve_forever()
 
-    def _notify_thread_func(self):
+    def _notify_thread_func(self, loop : asyncio.AbstractEventLoop):
+        # The notify queue is filled by the device thread, so it's read by a separate thread
+        # and the notifications are passed to the event loop.
         while True:
             notification = self.notify_queue.get()
-            self._notify_all(notification)
-
-    def _add_connection(self, connection):
-        with self._connection_list_lock:
-            self._connections.append(connection)
-
-    def _remove_connection(self, connection):
-        with self._connection_list_lock:
-            self._remove_connection_no_lock(connection)
-
-    def _remove_connections(self, connections):
-        with self._connection_list_lock:
-            self._remove_connections_no_lock(connections)
-
-    def _remove_connections_no_lock(self, connections):
-        for connection in connections:
-            self._remove_connection_no_lock(connection)
-    
-    def _remove_connection_no_lock(self, connection):
-        for i, conn in enumerate(self._connections):
-            if conn is connection:
-                self._connections.pop(i)
-                self.logger.debug(f"Removed connection {connection.getpeername()}.")
-    
+            loop.call_soon_threadsafe(self._notify_all, notification)
+
+    async def _handle_connection(self, reader : asyncio.StreamReader, writer : asyncio.StreamWriter):
+        addr = writer.get_extra_info("peername")
+        self.logger.debug(f"Accepted connection from {addr}.")
+        socket_common.enable_keepalive(writer.get_extra_info("socket"),
+            config.TCP_KEEPALIVE_IDLE, config.TCP_KEEPALIVE_INTERVAL, config.TCP_KEEPALIVE_COUNT)
+        subscriber = _Subscriber(writer, self.buffer_size, self._history.last_seq)
+        self._subscribers[writer] = subscriber
+        # The subscriber joins the index after its first message, so the live notifications don't get ahead of the replayed ones.
+        join_timer = asyncio.get_running_loop().call_later(config.NOTIFY_FIRST_MESSAGE_WAIT, self._join_all, subscriber)
+        sending_task = asyncio.create_task(self._send_loop(subscriber))
+        try:
+            while True:
+                message = await socket_common.async_recv_json(reader)
+                self._handle_client_message(subscriber, message)
+        except socket_common.ConnectionBrokenError:
+            pass
+        except Exception as err:
+            self.logger.debug(f"Invalid message from {addr}: {err}")
+        finally:
+            join_timer.cancel()
+            sending_task.cancel()
+            self._remove_connection(writer)
+
+    async def _send_loop(self, subscriber : "_Subscriber"):
+        writer = subscriber.writer
+        try:
+            while True:
+                await subscriber.ready.wait()
+                subscriber.ready.clear()
+                while subscriber.buffer:
+                    writer.write(subscriber.buffer.popleft()[0])
+                    subscriber.limit = max(self.buffer_size, min(subscriber.limit, len(subscriber.buffer) + self.buffer_size))
+                    await writer.drain()
+                    self.logger.debug(f"Notification sent to {writer.get_extra_info('peername')}")
+        except ConnectionError:
+            self.logger.debug(f"Error while sending notification to {writer.get_extra_info('peername')}")
+            self._remove_connection(writer)
+
+    def _handle_client_message(self, subscriber : "_Subscriber", message : dict):
+        if message.get("type") == "subscribe":
+            self._subscribe(subscriber, message)
+        elif message.get("type") == "resume":
+            self._resume(subscriber, message)
+        else:
+            raise ValueError(f"Unknown message type {message.get('type')}")
+
+    def _subscribe(self, subscriber : "_Subscriber", message : dict):
+        filters = message.get("filters") or []
+        if not isinstance(filters, list) or not all(isinstance(obj, dict) for obj in filters):
+            raise ValueError("Invalid list of filters")
+        self._index.set_filters(subscriber, [SubscriptionFilter.from_dict(obj) for obj in filters])
+        self.logger.debug(f"{subscriber.writer.get_extra_info('peername')} subscribed with {len(filters)} filters.")
+        if not subscriber.joined:
+            subscriber.joined = True
+            self._replay(subscriber, self._entries_since(subscriber, subscriber.connected_seq)[0])
+
+    def _resume(self, subscriber : "_Subscriber", message : dict):
+        since = message.get("since")
+        if message.get("epoch") != self._epoch or not isinstance(since, int):
+            since = None
+        if not subscriber.joined:
+            subscriber.joined = True
+            self._index.add(subscriber)
+        entries, gap = self._entries_since(subscriber, since)
+        response = {"type":"resumed", "epoch":self._epoch, "replayed":len(entries), "gap":gap}
+        subscriber.buffer.append((socket_common.encode_json(response), True))
+        self._replay(subscriber, entries)
+
+    def _join_all(self, subscriber : "_Subscriber"):
+        # The subscriber hasn't sent subscribe or resume in time, so it gets all notifications since it connected.
+        if subscriber.joined or subscriber.writer not in self._subscribers:
+            return
+        subscriber.joined = True
+        self._index.add(subscriber)
+        self._replay(subscriber, self._entries_since(subscriber, subscriber.connected_seq)[0])
+
+    def _entries_since(self, subscriber : "_Subscriber", since : Optional[int]) -> Tuple[List[HistoryEntry], bool]:
+        entries, gap = self._history.since(since)
+        return [entry for entry in entries if subscriber in self._interested_subscribers(entry.notification)], gap
+
+    def _replay(self, subscriber : "_Subscriber", entries : List[HistoryEntry]):
+        # The replayed notifications don't count into the limit of the buffer, so they aren't dropped.
+        subscriber.buffer.extend((entry.message, False) for entry in entries)
+        subscriber.limit = len(subscriber.buffer) + self.buffer_size
+        subscriber.ready.set()
+        self.metrics.increment("notifications_replayed", len(entries))
+        self.logger.debug(f"Replayed {len(entries)} notifications to {subscriber.writer.get_extra_info('peername')}.")
+
+    def _remove_connection(self, connection : asyncio.StreamWriter):
+        if connection in self._subscribers:
+            self._index.remove(self._subscribers.pop(connection))
+            connection.close()
+            self.logger.debug(f"Removed connection {connection.get_extra_info('peername')}.")
+
     def _notify_all(self, notification):
         self.logger.debug(f"New notification arrived.")
-        with self._connection_list_lock:
-            connections_to_remove = []
-            for conn in self._connections:
-                success = self._send_notification_to_connection(notification, conn)
-                if not success:
-                    connections_to_remove.append(conn)
-            self._remove_connections_no_lock(connections_to_remove)
-
-    def _send_notification_to_connection(self, notification, connection) -> bool:
+        message = socket_common.encode_json(notification)
+        if "seq" in notification:
+            self._epoch = notification.get("epoch")
+            self._history.add(notification["seq"], notification, message)
+        connections_to_remove = []
+        for subscriber in self._interested_subscribers(notification):
+            success = self._buffer_notification(message, subscriber)
+            if not success:
+                connections_to_remove.append(subscriber.writer)
+        for conn in connections_to_remove:
+            self.metrics.increment("subscribers_disconnected")
+            self._remove_connection(conn)
+
+    def _interested_subscribers(self, notification : dict) -> set:
+        data = notification.get("data") or {}
         try:
-            socket_common.send_json(connection, notification)
-            self.logger.debug(f"Notification sent to {connection.getpeername()}")
-            return True
-        except Exception as err:
-            self.logger.debug(f"Error while sending notification to {connection.getpeername()}")
-            return False
+            return self._index.match(data["address64"], socket_common.payload_bytes(data["message"]))
+        except (KeyError, TypeError, ValueError):
+            return {subscriber for subscriber in self._subscribers.values() if subscriber.joined}
+
+    def _buffer_notification(self, message : bytes, subscriber : "_Subscriber") -> bool:
+        if len(subscriber.buffer) >= subscriber.limit:
+            if self.overflow_policy == "disconnect":
+                self.logger.debug(f"Buffer of {subscriber.writer.get_extra_info('peername')} is full, disconnecting.")
+                return False
+            self._drop_oldest_notification(subscriber)
+            self.metrics.increment("notifications_dropped")
+        subscriber.buffer.append((message, False))
+        subscriber.ready.set()
+        return True
+
+    def _drop_oldest_notification(self, subscriber : "_Subscriber"):
+        # The answer to resume is never dropped, the client waits for it.
+        for index, (_, control) in enumerate(subscriber.buffer):
+            if not control:
+                del subscriber.buffer[index]
+                return
 
     def _configure_logger(self):
-        self.logger = logging.getLogger(__name__)
\ No newline at end of file
+        self.logger = logging.getLogger(__name__)
+
+class _Subscriber:
+    """A connected client of the notification server with its buffer of notifications waiting to be sent.
+
+    The buffer contains the encoded messages with a flag which is True for the answers to the client messages (`resume`).
+    """
+
+    def __init__(self, writer : asyncio.StreamWriter, limit : int, connected_seq : Optional[int]) -> None:
+        self.writer = writer
+        self.buffer : Deque[Tuple[bytes, bool]] = deque()
+        self.limit = limit
+        self.ready = asyncio.Event()
+        # The sequence number of the last notification before the subscriber connected,
+        # and whether the subscriber gets the live notifications already.
+        self.connected_seq = connected_seq
+        self.joined = False
@@ -1,10 +1,13 @@
 """The module defining the class used for handling requests and sending responses to the client.
 """
 
-from queue import Queue, Empty
+from queue import Queue
+from typing import Optional
 from .server_command import ServerCommand
+from .metrics import Metrics
+from .event_loop import ServerEventLoop, FutureResponseQueue
 from . import config, socket_common
-import socket, threading, logging
+import asyncio, logging, time
 
 class SocketRequestResponseServer:
     """A server which receives requests form the client and sends the responses.
@@ -14,79 +17,131 @@ class SocketRequestResponseServer:
     After the clients connect they can send a request to the server.
     The server processes the requests ands sends a response to the client.
 
+    A request may contain the `id` field. Such requests are executed concurrently, so a client may send many of them
+    over one connection without waiting for the responses. The responses contain the `id` of the request
+    and are sent as soon as they are ready, so their order may differ from the order of the requests.
+    A request without the `id` field is executed before the next request is read from the connection.
+
+    The `ping` request is answered immediately, without involving the device. Clients use it to check their connections.
+
+    All connections are handled by coroutines on the server event loop, not by separate threads.
+    The responses of the device thread are passed to the event loop by :class:`~receiver.event_loop.FutureResponseQueue`.
+
     Attributes:
         address (str): IP Address on which the socket will listen.
         port (str): TCP port on which the socket will listen.
+        unix_path (Optional[str]): Path of the Unix domain socket on which the server listens instead of the TCP port.
+            None means that TCP is used.
         command_queue (Queue): The queue into which the server puts the commands for the device.
             The commands are objects of the class :class:`~receiver.server_command.ServerCommand`.
-        queue_timeout (float): Maximum processing time of the request. It depends
+        metrics (Metrics): The counters of the coordinator handler, which are sent in response to the `stats` request.
+        event_loop (ServerEventLoop): The event loop on which the server runs.
+        queue_timeout (float): Maximum processing time of the request.
+            A request may shorten it with the `deadline` field, which contains a Unix timestamp.
     """
 
-    def __init__(self, address : str, port : int, command_queue : Queue) -> None:
+    def __init__(self, address : str, port : int, command_queue : Queue, metrics : Optional[Metrics] = None,
+            event_loop : Optional[ServerEventLoop] = None, unix_path : Optional[str] = None) -> None:
         """Creates a server.
 
         Args:
             address: IP Address on which the socket will listen.
             port: TCP port on which the socket will listen.
             notify_queue:  The queue into which the server puts the commands for the device.
+            metrics: The counters of the coordinator handler. If set to None, they will be created automatically.
+            event_loop: The event loop on which the server runs. If set to None, it will be created automatically.
+            unix_path: Path of the Unix domain socket on which the server listens instead of the TCP port.
+                If set to None, TCP is used.
         """
         self.address = address
         self.port = port
+        self.unix_path = unix_path
         self.command_queue = command_queue
+        self.metrics = Metrics() if metrics is None else metrics
+        self.event_loop = ServerEventLoop() if event_loop is None else event_loop
         self.queue_timeout = config.REQUEST_TIMEOUT
         self._configure_logger()
 
     def run(self):
-        """Starts the server. The server is run in another daemon thread."""
+        """Starts the server. The server is run on the event loop, which is started if it's not running yet."""
+        self.event_loop.start()
+        self.event_loop.run_coroutine(self._serve())
 
-        accepting_thread = threading.Thread(target=self._accepting_thread_func, daemon=True)
-        accepting_thread.start()
-
-    def _accepting_thread_func(self):
+    async def _serve(self):
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind((self.address, self.port))
-                s.listen(5)
-                self.logger.info(f"Request-response server started and is listening on {self.address}:{self.port}.")
-                print(f"Coordinator handler: request-response server listening on {self.address}:{self.port}.")
-                while True:
-                    conn, addr = s.accept()
-                    conn_thread = threading.Thread(target=self._conn_thread_func, args=(conn, addr), daemon=True)
-                    conn_thread.start()
+            server = await socket_common.start_server(self._handle_connection, self.address, self.port, self.unix_path)
         except Exception as e:
             print(f"Coordinator handler: Request-response server stopped because of an error: {e}")
             self.logger.error(f"Request-response server stopped because of an error: {e}")
             raise
+        endpoint = socket_common.endpoint_name(self.address, self.port, self.unix_path)
+        self.logger.info(f"Request-response server started and is listening on {endpoint}.")
+        print(f"Coordinator handler: request-response server listening on {endpoint}.")
+        async with server:
+            await server.serve_forever()
     
-    def _conn_thread_func(self, conn, addr):
+    async def _handle_connection(self, reader : asyncio.StreamReader, writer : asyncio.StreamWriter):
+        addr = writer.get_extra_info("peername")
+        socket_common.enable_keepalive(writer.get_extra_info("socket"),
+            config.TCP_KEEPALIVE_IDLE, config.TCP_KEEPALIVE_INTERVAL, config.TCP_KEEPALIVE_COUNT)
+        connection = _Connection(writer)
         try:
-            with conn:
-                self._connection_loop(conn, addr)
+            await self._connection_loop(reader, connection, addr)
         except socket_common.ConnectionBrokenError as err:
             self.logger.debug(f"Connection from {addr} broken")
         except Exception as err:
             self.logger.error(f"Error while handling request from {addr}: {err}")
+        finally:
+            for task in connection.tasks:
+                task.cancel()
+            writer.close()
     
-    def _connection_loop(self, conn, addr):
+    async def _connection_loop(self, reader : asyncio.StreamReader, connection : "_Connection", addr):
         self.logger.debug(f"Accepted connection from {addr}")
-        remaining = ""
         while True:
-            obj, remaining = socket_common.recv_json(conn, remaining)
+            obj = await socket_common.async_recv_json(reader)
             self.logger.debug(f"Received request from {addr}")
-            response = self._execute_command(obj)
-            socket_common.send_json(conn, response)
-            self.logger.debug(f"Sent response to {addr}")
+            if "id" in obj:
+                task = asyncio.create_task(self._execute_and_respond(obj, connection, addr))
+                connection.tasks.add(task)
+                task.add_done_callback(connection.tasks.discard)
+            else:
+                await self._execute_and_respond(obj, connection, addr)
 
-    def _execute_command(self, obj):
+    async def _execute_and_respond(self, obj : dict, connection : "_Connection", addr):
+        response = await self._execute_command(obj)
+        if "id" in obj:
+            response = {**response, "id": obj["id"]}
         try:
-            command = ServerCommand(description=obj, response_queue=Queue())
-            self.command_queue.put(command)
-            response = command.response_queue.get(timeout=self.queue_timeout)
-            return response
-        except Empty:
-            self.logger.error(f"Request timeout: processing request took longer than {self.queue_timeout} s.")
+            await connection.send(response)
+        except socket_common.ConnectionBrokenError:
+            if "id" not in obj:
+                raise
+            self.logger.debug(f"Connection from {addr} broken")
+            return
+        self.logger.debug(f"Sent response to {addr}")
+
+    async def _execute_command(self, obj):
+        if obj.get("name") == "stats":
+            return {"type":"response","status":"ok","name":"stats","data":self.metrics.snapshot()}
+        if obj.get("name") == "ping":
+            return {"type":"response","status":"ok","name":"ping"}
+        timeout = self._request_timeout(obj)
+        response_queue = FutureResponseQueue(asyncio.get_running_loop())
+        command = ServerCommand(description=obj, response_queue=response_queue, deadline=time.monotonic() + timeout)
+        self.command_queue.put(command)
+        try:
+            return await asyncio.wait_for(response_queue.future, timeout=timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(f"Request timeout: processing request took longer than {timeout:.3f} s.")
             return self._timeout_error_response(command)
 
+    def _request_timeout(self, obj : dict) -> float:
+        deadline = obj.get("deadline")
+        if not isinstance(deadline, (int, float)):
+            return self.queue_timeout
+        return max(0, min(self.queue_timeout, deadline - time.time()))
+
     def _timeout_error_response(self, command : ServerCommand):
         response = {"type":"response","status":"error", "message":"Operation timed out"}
         if "name" in command.description:
@@ -95,3 +150,15 @@ class SocketRequestResponseServer:
 
     def _configure_logger(self):
         self.logger = logging.getLogger(__name__)
+
+class _Connection:
+    """The sending side of a client connection shared by the requests executed concurrently."""
+
+    def __init__(self, writer : asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.tasks = set()
+        self._send_lock = asyncio.Lock()
+
+    async def send(self, response : dict) -> None:
+        async with self._send_lock:
+            await socket_common.async_send_json(self.writer, response)
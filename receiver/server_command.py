@@ -1,6 +1,8 @@
 """Module defining the :class:`~receiver.server_command.ServerCommand` class."""
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from queue import Queue
+from typing import Optional
 
 @dataclass
 class ServerCommand:
@@ -10,4 +12,15 @@ class ServerCommand:
     """The actual request to the controller."""
     
     response_queue: Queue
-    """The queue into which a response to the request sould be put."""
\ No newline at end of file
+    """The queue into which a response to the request sould be put."""
+
+    time_created: float = field(default_factory=time.monotonic)
+    """The time (from :func:`time.monotonic`) when the command was created."""
+
+    deadline: Optional[float] = None
+    """The time (from :func:`time.monotonic`) after which nobody waits for the response, so the command shouldn't be executed.
+    None means no deadline."""
+
+    def is_expired(self) -> bool:
+        """Checks if the deadline of the command has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
\ No newline at end of file
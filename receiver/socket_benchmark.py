@@ -0,0 +1,90 @@
+"""Microbenchmarks of receiving the messages with the functions from :mod:`receiver.socket_common`.
+
+Usage: From the main directory of the project activate the venv and call
+`py -m receiver.socket_benchmark` (Windows) or `python3 -m receiver.socket_benchmark` (Linux).
+
+For each scenario the script sends the messages through a pair of connected sockets and prints
+the throughput of the receiving side: the previous implementation of `recv_json` (concatenation of strings),
+the current :func:`~receiver.socket_common.recv_json` and :class:`~receiver.socket_common.SocketReader`.
+"""
+
+import socket, threading, time, json, base64
+from typing import Callable, List
+from . import socket_common
+
+def make_small_messages(count : int = 20000) -> List[dict]:
+    """Returns notifications with short messages, like the ones sent by the sensors.
+
+    Args:
+        count: number of the messages.
+    """
+    return [{"type":"notify", "name":"receive", "seq":i, "data":{"address64":"0013A200418D05FC", "message":b"temp=21.5;hum=40"}}
+        for i in range(count)]
+
+def make_large_messages(count : int = 5, devices : int = 30000) -> List[dict]:
+    """Returns large responses, like the result of a discovery of a big network (a few megabytes each).
+
+    Args:
+        count: number of the messages.
+        devices: number of the devices in each message.
+    """
+    result = {"devices": [{"address64":f"0013A2{i:010X}", "address16":f"{i % 65536:04X}", "id":f"Sensor ąę {i}", "role":"Router"}
+        for i in range(devices)]}
+    return [{"type":"response", "status":"ok", "name":"discover", "data":result} for _ in range(count)]
+
+def _legacy_recv_json(sock : socket.socket, prev_data : str = ""):
+    # The implementation of recv_json before the buffered reader was introduced.
+    CHUNK_SIZE = 4096
+    data = prev_data
+    while not '\n' in data:
+        chunk = sock.recv(CHUNK_SIZE)
+        if len(chunk) == 0:
+            raise socket_common.ConnectionBrokenError("Socket connection broken")
+        data += chunk.decode('utf-8')
+    pos = data.find('\n')
+    return json.loads(data[:pos]), data[pos+1:]
+
+def _receive_legacy(sock : socket.socket, count : int):
+    remaining = ""
+    for _ in range(count):
+        _, remaining = _legacy_recv_json(sock, remaining)
+
+def _receive_recv_json(sock : socket.socket, count : int):
+    remaining = ""
+    for _ in range(count):
+        _, remaining = socket_common.recv_json(sock, remaining)
+
+def _receive_reader(sock : socket.socket, count : int):
+    reader = socket_common.SocketReader(sock)
+    for _ in range(count):
+        reader.recv_message()
+
+def run_scenario(name : str, messages : List[dict], receive : Callable[[socket.socket, int], None]) -> None:
+    """Sends the messages through a pair of sockets and prints the throughput of the receiving side.
+
+    Args:
+        name: name of the scenario printed with the results.
+        messages: the messages to send.
+        receive: the function receiving the given number of messages from the socket.
+    """
+    data = b"".join(socket_common.encode_json(message) for message in messages)
+    sender_sock, receiver_sock = socket.socketpair()
+    sender = threading.Thread(target=socket_common.send_all, args=(sender_sock, data), daemon=True)
+    with sender_sock, receiver_sock:
+        start = time.perf_counter()
+        sender.start()
+        receive(receiver_sock, len(messages))
+        elapsed = time.perf_counter() - start
+        sender.join()
+    print(f"{name:<40} {len(messages) / elapsed:>12.0f} msg/s {len(data) / elapsed / 2**20:>10.1f} MiB/s")
+
+def main() -> None:
+    """Runs all scenarios."""
+    scenarios = [("small", make_small_messages()), ("large", make_large_messages())]
+    for scenario_name, messages in scenarios:
+        run_scenario(f"{scenario_name}: legacy recv_json", messages, _receive_legacy)
+        run_scenario(f"{scenario_name}: recv_json", messages, _receive_recv_json)
+        run_scenario(f"{scenario_name}: SocketReader", messages, _receive_reader)
+
+if __name__ == "__main__":
+    main()
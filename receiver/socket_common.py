@@ -1,6 +1,17 @@
-"""Module defining various utilities used by other modules"""
-import socket, json
-from typing import Tuple
+"""Module defining various utilities used by other modules
+
+Every message is a JSON object terminated with a newline character. The binary data (e.g. the received messages)
+is base64-encoded. Inside the coordinator handler the binary data is kept as `bytes`, which are base64-encoded
+by :func:`json_default` when the message is sent.
+
+Both servers listen either on a TCP port or, when the coordinator handler and its clients run on the same machine,
+on a Unix domain socket (see :func:`start_server` and :func:`connect`). The protocol is the same on both transports.
+"""
+import socket, json, asyncio, base64, os, stat
+from typing import Awaitable, Callable, Optional, Tuple
+
+#: Maximum length (in bytes) of one JSON message received by the asyncio streams of the servers.
+STREAM_LIMIT = 16 * 1024 * 1024
 
 class ConnectionBrokenError(Exception):
     """An exception raised when a connection from socket is broken
@@ -22,21 +33,33 @@ def send_json(sock : socket.socket, obj : dict) -> None:
             when the connection with the socket is broken while trying to send the data.
         
     """
-    msg_str = json.dumps(obj) + "\n"
-    msg = msg_str.encode('utf-8')
-    msglen = len(msg)
-    totalsent = 0
-    while totalsent < msglen:
-        sent = sock.send(msg[totalsent:])
-        if sent == 0:
-            raise ConnectionBrokenError("Socket connection broken")
-        totalsent += sent
+    send_all(sock, encode_json(obj))
+
+def send_all(sock : socket.socket, data : bytes) -> None:
+    """Sends all data to the socket. The unsent part of the data is not copied after a partial send.
+
+    Args:
+        sock: socket to which the data should be sent.
+        data: the data to send.
+
+    Raises:
+        :class:`~receiver.socket_common.ConnectionBrokenError`:
+            when the connection with the socket is broken while trying to send the data.
+    """
+    with memoryview(data) as view:
+        while view:
+            sent = sock.send(view)
+            if sent == 0:
+                raise ConnectionBrokenError("Socket connection broken")
+            view = view[sent:]
 
 def recv_json(sock : socket.socket, prev_data : str = "") -> Tuple[dict, str]:
     """Receives a JSON object from the socket and parses it into a dict. The JSON data from the socket must be terminated by a newline character. 
 
     Based on: https://docs.python.org/3/howto/sockets.html
 
+    For receiving many messages from one socket, :class:`~receiver.socket_common.SocketReader` is more efficient.
+
     Args:
         sock: socket from which the JSON will be received.
         prev_data: the remaining parts of a message previously received from the socket.
@@ -56,14 +79,270 @@ def recv_json(sock : socket.socket, prev_data : str = "") -> Tuple[dict, str]:
         
     """
     CHUNK_SIZE = 4096
-    data = prev_data
-    while not '\n' in data:
+    pos = prev_data.find('\n')
+    if pos != -1:
+        return json.loads(prev_data[:pos]), prev_data[pos+1:]
+    # The remaining data may end in the middle of a UTF-8 character, so it's decoded with surrogateescape.
+    data = bytearray(prev_data.encode('utf-8', 'surrogateescape'))
+    while pos == -1:
+        scanned = len(data)
         chunk = sock.recv(CHUNK_SIZE)
         if len(chunk) == 0:
             raise ConnectionBrokenError("Socket connection broken")
-        data += chunk.decode('utf-8')
-    pos = data.find('\n')
-    data_json = data[:pos]
-    loaded_obj = json.loads(data_json)
-    remaining_data = data[pos+1:]
+        data += chunk
+        pos = data.find(b'\n', scanned)
+    loaded_obj = json.loads(data[:pos])
+    remaining_data = data[pos+1:].decode('utf-8', 'surrogateescape')
     return loaded_obj, remaining_data
+
+class SocketReader:
+    """A buffered reader of the messages from a blocking socket.
+
+    The data is received directly into one growing `bytearray` by :meth:`socket.socket.recv_into`,
+    so receiving a message doesn't create a new object per chunk and the received data is scanned for the end
+    of the message only once. The buffer grows to the size of the largest message and is reused for the next messages.
+
+    Attributes:
+        sock (socket.socket): the socket from which the messages are received.
+    """
+
+    def __init__(self, sock : socket.socket, buffer_size : int = 65536) -> None:
+        """Creates the reader.
+
+        Args:
+            sock: the socket from which the messages are received.
+            buffer_size: initial size of the buffer.
+        """
+        self.sock = sock
+        self._buffer = bytearray(buffer_size)
+        self._start = 0
+        self._end = 0
+
+    def recv_message(self) -> dict:
+        """Receives one message and parses it into a dict.
+
+        Returns:
+            The message parsed into a dict.
+
+        Raises:
+            :class:`~receiver.socket_common.ConnectionBrokenError`:
+                when the connection with the socket is broken while trying to receive the data.
+
+            ValueError: when the data received is not a valid message.
+        """
+        return json.loads(self._read_line())
+
+    def _read_line(self) -> str:
+        pos = self._buffer.find(b'\n', self._start, self._end)
+        while pos == -1:
+            scanned = self._end - self._start
+            self._fill()
+            pos = self._buffer.find(b'\n', self._start + scanned, self._end)
+        line = self._buffer[self._start:pos].decode('utf-8')
+        self._consume(pos + 1 - self._start)
+        return line
+
+    def _consume(self, length : int):
+        self._start += length
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def _fill(self):
+        # Makes space at the end of the buffer (by moving the unread data to the beginning or by growing the buffer)
+        # and receives the data into it.
+        unread = self._end - self._start
+        if self._end == len(self._buffer):
+            if self._start > 0:
+                self._buffer[:unread] = self._buffer[self._start:self._end]
+                self._start, self._end = 0, unread
+            if self._end == len(self._buffer):
+                self._buffer.extend(bytes(len(self._buffer)))
+        with memoryview(self._buffer) as view:
+            received = self.sock.recv_into(view[self._end:])
+        if received == 0:
+            raise ConnectionBrokenError("Socket connection broken")
+        self._end += received
+
+class SocketWriter:
+    """A writer of the messages to a blocking socket, which doesn't copy the unsent data after a partial send.
+
+    Attributes:
+        sock (socket.socket): the socket to which the messages are sent.
+    """
+
+    def __init__(self, sock : socket.socket) -> None:
+        """Creates the writer.
+
+        Args:
+            sock: the socket to which the messages are sent.
+        """
+        self.sock = sock
+
+    def send_message(self, obj : dict) -> None:
+        """Sends a dict to the socket.
+
+        Args:
+            obj: the dict to send.
+
+        Raises:
+            :class:`~receiver.socket_common.ConnectionBrokenError`:
+                when the connection with the socket is broken while trying to send the data.
+        """
+        send_all(self.sock, encode_json(obj))
+
+async def start_server(client_connected_cb : Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]],
+        address : str, port : int, unix_path : Optional[str] = None, limit : int = STREAM_LIMIT) -> asyncio.AbstractServer:
+    """Starts an asyncio server listening on a TCP port or on a Unix domain socket.
+
+    A file left at `unix_path` by a previous run of the server is removed, if it is a socket.
+
+    Args:
+        client_connected_cb: the coroutine function called for every accepted connection.
+        address: IP address on which the server listens, used when `unix_path` is None.
+        port: TCP port on which the server listens, used when `unix_path` is None.
+        unix_path: path of the Unix domain socket. If set, the server listens on it instead of the TCP port.
+        limit: maximum length (in bytes) of one message received by the stream reader.
+
+    Returns:
+        The started server.
+    """
+    if unix_path is None:
+        return await asyncio.start_server(client_connected_cb, address, port, limit=limit)
+    try:
+        if stat.S_ISSOCK(os.stat(unix_path).st_mode):
+            os.remove(unix_path)
+    except FileNotFoundError:
+        pass
+    return await asyncio.start_unix_server(client_connected_cb, unix_path, limit=limit)
+
+def endpoint_name(address : str, port : int, unix_path : Optional[str] = None) -> str:
+    """Returns a description of the endpoint of a server, used in the log messages.
+
+    Args:
+        address: IP address of the server.
+        port: TCP port of the server.
+        unix_path: path of the Unix domain socket of the server, if it's used instead of TCP.
+    """
+    return f"{address}:{port}" if unix_path is None else f"unix:{unix_path}"
+
+def connect(address : str, port : int, unix_path : Optional[str] = None) -> socket.socket:
+    """Opens a blocking connection to a server of the coordinator handler.
+
+    Args:
+        address: IP address of the server, used when `unix_path` is None.
+        port: TCP port of the server, used when `unix_path` is None.
+        unix_path: path of the Unix domain socket of the server. If set, it's used instead of TCP.
+
+    Returns:
+        The connected socket.
+    """
+    if unix_path is None:
+        return socket.create_connection((address, port))
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(unix_path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+def enable_keepalive(sock : socket.socket, idle : float, interval : float, count : int) -> None:
+    """Enables TCP keepalive on the socket, so a dead peer is detected even if no data is sent.
+
+    The timing options are set only on the platforms which support them.
+    Nothing is done for the sockets other than TCP (e.g. Unix domain sockets).
+
+    Args:
+        sock: the socket of the connection.
+        idle: time (in seconds) without any data after which the first probe is sent.
+        interval: time (in seconds) between the probes.
+        count: number of unanswered probes after which the connection is closed.
+    """
+    if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+        return
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, int(idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, int(interval))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count)
+
+def json_default(obj):
+    """The `default` function for :func:`json.dumps` which base64-encodes the binary data.
+
+    Args:
+        obj: the object which can't be serialized by :mod:`json`.
+
+    Returns:
+        The base64-encoded data if `obj` is `bytes`, `bytearray` or `memoryview`.
+
+    Raises:
+        TypeError: for any other type.
+    """
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(obj).decode()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def payload_bytes(value) -> bytes:
+    """Returns the binary data of a field of a request.
+
+    Args:
+        value: a base64-encoded string (as received from the clients) or the binary data.
+
+    Returns:
+        The binary data.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    return base64.b64decode(value)
+
+def encode_json(obj : dict) -> bytes:
+    """Serializes a dict into a JSON message terminated with a newline character.
+
+    Args:
+        obj: the dict to serialize.
+
+    Returns:
+        The message encoded in UTF-8.
+    """
+    return (json.dumps(obj, default=json_default) + "\n").encode('utf-8')
+
+async def async_send_json(writer : asyncio.StreamWriter, obj : dict) -> None:
+    """Sends a dict to the asyncio stream. The format is the same as in :func:`send_json`.
+
+    Args:
+        writer: the stream to which the dict should be sent.
+        obj: the dict to send.
+
+    Raises:
+        :class:`~receiver.socket_common.ConnectionBrokenError`:
+            when the connection is broken while trying to send the data.
+    """
+    try:
+        writer.write(encode_json(obj))
+        await writer.drain()
+    except ConnectionError as err:
+        raise ConnectionBrokenError("Socket connection broken") from err
+
+async def async_recv_json(reader : asyncio.StreamReader) -> dict:
+    """Receives a JSON object terminated by a newline character from the asyncio stream and parses it into a dict.
+
+    Args:
+        reader: the stream from which the JSON will be received.
+
+    Returns:
+        The message parsed into a dict.
+
+    Raises:
+        :class:`~receiver.socket_common.ConnectionBrokenError`:
+            when the connection is broken while trying to receive the data.
+
+        :py:class:`json.JSONDecodeError`:
+            when the data received is not a valid JSON.
+    """
+    try:
+        line = await reader.readuntil(b'\n')
+    except (asyncio.IncompleteReadError, ConnectionError) as err:
+        raise ConnectionBrokenError("Socket connection broken") from err
+    return json.loads(line.decode('utf-8'))
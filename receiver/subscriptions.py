@@ -0,0 +1,134 @@
+"""Module defining the :class:`~receiver.subscriptions.SubscriptionIndex` class."""
+
+import base64
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+class SubscriptionFilter:
+    """A filter of the received messages which a subscriber of the notification server wants to get.
+
+    Attributes:
+        address64 (Optional[str]): 64-bit address of the sender as an upper-case hexadecimal string. None means any sender.
+        prefix (bytes): the beginning of the message. An empty prefix matches every message.
+    """
+
+    def __init__(self, address64 : Optional[str] = None, prefix : bytes = b"") -> None:
+        """Creates the filter.
+
+        Args:
+            address64: 64-bit address of the sender as a hexadecimal string. None means any sender.
+            prefix: the beginning of the message. An empty prefix matches every message.
+        """
+        self.address64 = None if address64 is None else address64.upper()
+        self.prefix = prefix
+
+    @classmethod
+    def from_dict(cls, obj : dict) -> "SubscriptionFilter":
+        """Creates the filter from its JSON representation.
+
+        Args:
+            obj: a dict with the optional fields `address64` and `prefix` (base64-encoded).
+
+        Raises:
+            ValueError: when the fields are invalid.
+        """
+        address64 = obj.get("address64")
+        prefix = obj.get("prefix")
+        if address64 is not None and not isinstance(address64, str):
+            raise ValueError("Invalid address64 in the subscription filter")
+        if prefix is not None and not isinstance(prefix, str):
+            raise ValueError("Invalid prefix in the subscription filter")
+        return cls(address64, base64.b64decode(prefix, validate=True) if prefix else b"")
+
+    def key(self) -> Tuple[Optional[str], bytes]:
+        """Returns the key under which the filter is stored in the index."""
+        return (self.address64, self.prefix)
+
+class SubscriptionIndex:
+    """An index of the subscription filters, which finds the subscribers interested in a message.
+
+    The filters are stored in a dict under the keys (address, prefix). For a message, only the keys built from its sender
+    (or None) and the beginnings of the message with the lengths of the prefixes present in the index are looked up.
+    So the time of matching depends on the number of distinct prefix lengths, not on the number of filters.
+
+    A subscriber without filters gets all messages.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty index."""
+        self._all : Set[Hashable] = set()
+        self._by_key : Dict[Tuple[Optional[str], bytes], Set[Hashable]] = {}
+        self._filters : Dict[Hashable, List[SubscriptionFilter]] = {}
+        self._prefix_lengths : Counter = Counter()
+
+    def add(self, subscriber : Hashable) -> None:
+        """Adds a subscriber which gets all messages.
+
+        Args:
+            subscriber: the subscriber.
+        """
+        self._all.add(subscriber)
+
+    def set_filters(self, subscriber : Hashable, filters : Iterable[SubscriptionFilter]) -> None:
+        """Replaces the filters of a subscriber.
+
+        Args:
+            subscriber: the subscriber.
+            filters: the new filters. An empty list means all messages.
+        """
+        self.remove(subscriber)
+        filters = list(filters)
+        if not filters:
+            self._all.add(subscriber)
+            return
+        self._filters[subscriber] = filters
+        for subscription_filter in filters:
+            key = subscription_filter.key()
+            subscribers = self._by_key.setdefault(key, set())
+            if not subscribers:
+                self._prefix_lengths[len(subscription_filter.prefix)] += 1
+            subscribers.add(subscriber)
+
+    def remove(self, subscriber : Hashable) -> None:
+        """Removes a subscriber and its filters from the index.
+
+        Args:
+            subscriber: the subscriber.
+        """
+        self._all.discard(subscriber)
+        for subscription_filter in self._filters.pop(subscriber, []):
+            key = subscription_filter.key()
+            subscribers = self._by_key.get(key)
+            if subscribers is None or subscriber not in subscribers:
+                continue
+            subscribers.remove(subscriber)
+            if not subscribers:
+                del self._by_key[key]
+                length = len(subscription_filter.prefix)
+                self._prefix_lengths[length] -= 1
+                if self._prefix_lengths[length] == 0:
+                    del self._prefix_lengths[length]
+
+    def match(self, address64 : str, message : bytes) -> Set[Hashable]:
+        """Finds the subscribers interested in a message.
+
+        Args:
+            address64: 64-bit address of the sender as a hexadecimal string.
+            message: the received message.
+
+        Returns:
+            The set of the subscribers.
+        """
+        result = set(self._all)
+        address64 = address64.upper()
+        for length in self._prefix_lengths:
+            if length > len(message):
+                continue
+            prefix = message[:length]
+            result.update(self._by_key.get((address64, prefix), ()))
+            result.update(self._by_key.get((None, prefix), ()))
+        return result
+
+    def filter_count(self) -> int:
+        """Returns the number of distinct filters in the index."""
+        return len(self._by_key)
@@ -1,27 +1,55 @@
 """Module defining the class communicating with the device."""
 
-import threading, time, base64, logging, json
+import threading, time, logging, json, uuid
 from queue import Queue
-from typing import Callable, Optional
+from typing import Dict, Optional
 from .server_command import ServerCommand
-from digi.xbee.devices import XBeeDevice, XBeeNetwork, RemoteXBeeDevice
-from digi.xbee.models.address import XBee64BitAddress
+from .command_queue import PriorityCommandQueue, command_destination
+from .frame_pipeline import FramePipeline
+from .batch import BatchExecution
+from .fan_out import FanOutExecution
+from .metrics import Metrics
+from . import config, socket_common
+from digi.xbee.devices import XBeeDevice, XBeeNetwork
+from digi.xbee.exception import ATCommandException, OperationNotSupportedException, TransmitException
+from digi.xbee.models.address import XBee64BitAddress, XBee16BitAddress
+from digi.xbee.models.options import RemoteATCmdOptions, TransmitOptions
+from digi.xbee.models.status import ATCommandStatus, TransmitStatus
+from digi.xbee.packets.common import RemoteATCommandPacket, RemoteATCommandResponsePacket, TransmitPacket, TransmitStatusPacket
 
 class XBeeDeviceConnection:
     """Connection object which manages the communication with a XBee device.
 
     Attributes:
         device (digi.xbee.devices.XBeeDevice): the device on which the commands will be executed.
-        command_queue (queue.Queue): the queue from which the object will get the commands to execute on the device.
+        command_queue (PriorityCommandQueue): the queue from which the object will get the commands to execute on the device.
         notify_queue (queue.Queue): the queue to which the connection object will send the received messages.
         connection_startup_finished (threading.Event): an event which is set when the device startup procedure is finished.
             It may be set when the device is properly configured but it may be set when an error occurs during startup.
             To check if the startup was successful check the `connection_startup_finished` event.
         connection_startup_successful (threading.Event): an event set after a successful startup of the device.
+        discovery_cache_ttl (float): time (in seconds) for which the result of the last network discovery is reused.
+        pipeline (FramePipeline): the pipeline through which the commands to the remote nodes are sent.
+        epoch (str): random identifier of this run of the coordinator handler. The notifications contain it in the `epoch` field,
+            next to the sequence number (`seq`), which starts from 1 in every run.
+
+    The commands to remote nodes (`send` and the AT commands) are sent through the pipeline, so the device thread doesn't wait
+    for the responses. The command queue skips the commands to the nodes which already have the maximum number
+    of frames in flight, so an unreachable node delays only its own commands. A request may contain the `timeout` field
+    (in seconds) which overrides the default time after which the command to a remote node fails.
+
+    A `batch` request executes a list of commands in order and stops at the first failed one,
+    see :class:`~receiver.batch.BatchExecution`. A `fan_out` request reads an AT parameter from many nodes at once,
+    see :class:`~receiver.fan_out.FanOutExecution`. Without the `addresses` field, it queries the nodes found
+    by the last network discovery, and fails if no discovery has been made yet.
 
     """
 
-    def __init__(self, device : XBeeDevice, command_queue : Optional[Queue] = None, notify_queue : Optional[Queue] = None) -> None:
+    PIPELINED_COMMANDS = ("send", "get_parameter", "set_parameter", "execute_command")
+    """Names of the commands which are sent through the pipeline, without waiting for the response."""
+
+    def __init__(self, device : XBeeDevice, command_queue : Optional[PriorityCommandQueue] = None, notify_queue : Optional[Queue] = None,
+            metrics : Optional[Metrics] = None) -> None:
         """Creates the connection object.
 
         Args:
@@ -30,13 +58,23 @@ class XBeeDeviceConnection:
                 If set to None, the queue will be created automatically.
             notify_queue: the queue to which the connection object will send the received messages.
                 If set to None, the queue will be created automatically.
+            metrics: the counters of the coordinator handler. If set to None, they will be created automatically.
         """
         self.device = device
-        self.command_queue = Queue() if command_queue is None else command_queue
+        self.command_queue = PriorityCommandQueue() if command_queue is None else command_queue
         self.notify_queue = Queue() if notify_queue is None else notify_queue
+        self.metrics = Metrics() if metrics is None else metrics
+        self.pipeline = FramePipeline(device, self._complete_command, self.metrics, on_capacity=self.command_queue.wake)
         self._configure_logger()
         self.connection_startup_finished = threading.Event()
         self.connection_startup_successful = threading.Event()
+        self.discovery_cache_ttl = config.DISCOVERY_CACHE_TTL
+        self._discovery_result = None
+        self._discovery_time = None
+        self._batch_destinations : Dict[str, BatchExecution] = {}
+        self.epoch = uuid.uuid4().hex
+        self._notification_seq = 0
+        self._notification_lock = threading.Lock()
     
     def start(self) -> None:
         """Starts the handler.
@@ -55,6 +93,7 @@ class XBeeDeviceConnection:
             self.device.open()
             self.logger.info("Device connection opened.")
             self.device.add_data_received_callback(self._data_received_callback)
+            self.pipeline.start()
             self.connection_startup_successful.set()
             self.connection_startup_finished.set()
             self._thread_loop()
@@ -69,34 +108,138 @@ class XBeeDeviceConnection:
     
     def _thread_loop(self):
         while True:
-            command = self.command_queue.get()
+            command = self.command_queue.get(ready=self._is_ready)
             if command.description["name"] == "stop":
                 self._log_command_begin(command)
                 break
-            self._execute_command_and_put_result(command)
+            elif command.is_expired():
+                self._discard_expired_command(command)
+            elif command.description["name"] == "batch":
+                self._start_batch(command)
+            elif command.description["name"] == "fan_out":
+                self._start_fan_out(command)
+            elif self._is_timer_wait(command):
+                self._start_wait_timer(command)
+            elif command.description["name"] in self.PIPELINED_COMMANDS:
+                self._send_pipelined_command(command)
+            else:
+                self._execute_command_and_put_result(command)
+
+    def _discard_expired_command(self, command : ServerCommand):
+        self.metrics.increment("commands_expired")
+        self._complete_command(command, None, TimeoutError("Deadline exceeded before execution"))
+
+    def _is_ready(self, command : ServerCommand) -> bool:
+        name = command.description.get("name")
+        if name == "batch":
+            # A batch starts when no other batch uses any of its destinations.
+            return not any(destination in self._batch_destinations for destination in BatchExecution.step_destinations(command.description))
+        if name not in self.PIPELINED_COMMANDS:
+            return True
+        destination = command_destination(command.description)
+        if destination is None:
+            return True
+        batch = self._batch_destinations.get(destination)
+        if batch is not None and not batch.is_step(command):
+            return False
+        return self.pipeline.has_capacity(destination)
+
+    def _is_timer_wait(self, command : ServerCommand) -> bool:
+        data = command.description.get("data") or {}
+        return command.description["name"] == "wait" and isinstance(data.get("time"), (int, float)) and not data.get("barrier", False)
+
+    def _start_wait_timer(self, command : ServerCommand):
+        # The wait doesn't use the device, so the response is sent from a timer thread
+        # and the device thread continues with the next commands.
+        timer = threading.Timer(command.description["data"]["time"], self._execute_command_and_put_result, args=(command,))
+        timer.daemon = True
+        timer.start()
+
+    def _start_batch(self, command : ServerCommand):
+        # The steps are put back into the command queue one by one, see BatchExecution.
+        # Until the batch finishes, the other commands to its destinations are skipped by _is_ready.
+        batch = None
+        try:
+            self._log_command_begin(command)
+            batch = BatchExecution(command, self.command_queue, on_finish=self._batch_finished)
+            for destination in batch.destinations:
+                self._batch_destinations[destination] = batch
+            batch.start()
+        except Exception as err:
+            if batch is not None:
+                self._batch_finished(batch)
+            self._complete_command(command, None, err)
+
+    def _batch_finished(self, batch : BatchExecution):
+        # It may be called from the thread of the pipeline or of a wait timer.
+        for destination in batch.destinations:
+            if self._batch_destinations.get(destination) is batch:
+                del self._batch_destinations[destination]
+        self.command_queue.wake()
+
+    def _start_fan_out(self, command : ServerCommand):
+        try:
+            self._log_command_begin(command)
+            max_in_flight = config.FAN_OUT_MAX_IN_FLIGHT
+            if max_in_flight is None:
+                max_in_flight = self.pipeline.max_in_flight // 2
+            FanOutExecution(command, self.command_queue, self._fan_out_addresses(command), max_in_flight).start()
+        except Exception as err:
+            self._complete_command(command, None, err)
+
+    def _fan_out_addresses(self, command : ServerCommand) -> list:
+        addresses = (command.description.get("data") or {}).get("addresses")
+        if addresses is None:
+            # Without the list of addresses, the nodes found by the last discovery are queried.
+            # The discovery isn't run here, because it would block the device thread for several seconds.
+            if self._discovery_result is None:
+                raise ValueError("No nodes have been discovered yet, send a discover request or the list of addresses")
+            return [device["address64"] for device in self._discovery_result["devices"]]
+        if not isinstance(addresses, list) or not all(isinstance(address, str) for address in addresses):
+            raise ValueError("Invalid list of addresses")
+        return addresses
 
     def _execute_command_and_put_result(self, command : ServerCommand):
         try:
             self._log_command_begin(command)
             result = self._execute_command(command)
+        except Exception as err:
+            self._complete_command(command, None, err)
+        else:
+            self._complete_command(command, result, None)
+
+    def _complete_command(self, command : ServerCommand, result : Optional[dict], error : Optional[Exception]):
+        if error is None:
             command.response_queue.put({"type":"response","status":"ok","name":command.description["name"], "data":result})
             self._log_command_successful(command, result)
+        else:
+            response = {"type":"response","status":"error","name":command.description["name"], "message":str(error)}
+            if isinstance(error, TimeoutError):
+                response["timeout"] = True
+            command.response_queue.put(response)
+            self._log_command_error(command, error)
+
+    def _send_pipelined_command(self, command : ServerCommand):
+        try:
+            self._log_command_begin(command)
+            if command.description["name"] == "send":
+                self._send_transmit_request(command)
+            else:
+                self._send_remote_at_command(command)
         except Exception as err:
-            command.response_queue.put({"type":"response","status":"error","name":command.description["name"], "message":str(err)})
-            self._log_command_error(command, err)
+            self._complete_command(command, None, err)
+
+    def _command_timeout(self, command : ServerCommand) -> float:
+        timeout = command.description.get("timeout")
+        timeout = timeout if isinstance(timeout, (int, float)) and timeout > 0 else self.pipeline.timeout
+        if command.deadline is not None:
+            timeout = min(timeout, command.deadline - time.monotonic())
+        return timeout
 
     def _execute_command(self, command : ServerCommand) -> dict:
         name = command.description["name"]
         if name == "discover":
             return self._command_discover(command)
-        elif name == "send":
-            return self._command_send(command)
-        elif name == "get_parameter":
-            return self._command_get_parameter(command)
-        elif name == "set_parameter":
-            return self._command_set_parameter(command)
-        elif name == "execute_command":
-            return self._command_execute_command(command)
         elif name == "wait":
             return self._command_wait(command)
         else:
@@ -104,9 +247,22 @@ class XBeeDeviceConnection:
         
 
     def _command_discover(self, command : ServerCommand) -> dict:
-        xnet = self._discover_network()
-        result = self._format_discovery_result(xnet)
-        return result
+        data = command.description.get("data") or {}
+        max_age = data.get("max_age", self.discovery_cache_ttl)
+        if not self._is_cached_discovery_usable(command, max_age):
+            xnet = self._discover_network()
+            self._discovery_result = self._format_discovery_result(xnet)
+            self._discovery_time = time.monotonic()
+        return {**self._discovery_result, "age": time.monotonic() - self._discovery_time}
+
+    def _is_cached_discovery_usable(self, command : ServerCommand, max_age : float) -> bool:
+        if self._discovery_result is None:
+            return False
+        # A discovery which finished after the command had been created ran while the command was waiting,
+        # so the command is merged into that discovery.
+        if self._discovery_time >= command.time_created:
+            return True
+        return time.monotonic() - self._discovery_time <= max_age
 
     def _discover_network(self) -> XBeeNetwork:
         xnet = self.device.get_network()
@@ -131,46 +287,56 @@ class XBeeDeviceConnection:
             "role": device.get_role().description
         }
     
-    def _command_send(self, command : ServerCommand) -> dict:
+    def _send_transmit_request(self, command : ServerCommand):
         data = command.description["data"]
-        remote_device = RemoteXBeeDevice(self.device, XBee64BitAddress.from_hex_string(data["address64"]))
-        message = base64.b64decode(data["message"])
-        self.device.send_data(remote_device, message)
+        address = XBee64BitAddress.from_hex_string(data["address64"])
+        message = socket_common.payload_bytes(data["message"])
+        make_packet = lambda frame_id: TransmitPacket(
+            frame_id, address, XBee16BitAddress.UNKNOWN_ADDRESS, 0, TransmitOptions.NONE.value, rf_data=message)
+        destination = str(address)
+        self.pipeline.wait_for_capacity(destination)
+        self.pipeline.send(command, destination, make_packet, TransmitStatusPacket, self._transmit_result, self._command_timeout(command))
+
+    def _transmit_result(self, packet : TransmitStatusPacket) -> dict:
+        if packet.transmit_status != TransmitStatus.SUCCESS:
+            raise TransmitException(transmit_status=packet.transmit_status)
         return {}
 
     def _command_wait(self, command : ServerCommand) -> dict:
         data = command.description["data"]
-        time.sleep(data["time"])
+        if data.get("barrier", False):
+            time.sleep(data["time"])
         return {"time":data["time"]}
 
-    def _command_get_parameter(self, command : ServerCommand) -> dict:
-        remote_device = RemoteXBeeDevice(self.device, XBee64BitAddress.from_hex_string(command.description["data"]["address64"]))
-        return self._at_related_command(command, remote_device.get_parameter)
-
-    def _command_set_parameter(self, command : ServerCommand) -> dict:
-        remote_device = RemoteXBeeDevice(self.device, XBee64BitAddress.from_hex_string(command.description["data"]["address64"]))
-        return self._at_related_command(command, remote_device.set_parameter)
-
-    def _command_execute_command(self, command : ServerCommand) -> dict:
-        remote_device = RemoteXBeeDevice(self.device, XBee64BitAddress.from_hex_string(command.description["data"]["address64"]))
-        return self._at_related_command(command, remote_device.execute_command)
-
-    def _at_related_command(self, command : ServerCommand, method : Callable) -> dict:
+    def _send_remote_at_command(self, command : ServerCommand):
         data = command.description["data"]
+        address = XBee64BitAddress.from_hex_string(data["address64"])
         at_command = data["at_command"]
-        value = None if data["value"] is None else base64.b64decode(data["value"])
-        apply_changes = data["apply_changes"]
-        result = method(at_command, value, apply_changes)
-        if result is None:
+        value = None if data.get("value") is None else socket_common.payload_bytes(data["value"])
+        options = RemoteATCmdOptions.APPLY_CHANGES.value if data.get("apply_changes", True) else RemoteATCmdOptions.NONE.value
+        make_packet = lambda frame_id: RemoteATCommandPacket(
+            frame_id, address, XBee16BitAddress.UNKNOWN_ADDRESS, options, at_command, parameter=value)
+        handle_response = lambda packet: self._remote_at_command_result(command, packet)
+        destination = str(address)
+        self.pipeline.wait_for_capacity(destination)
+        self.pipeline.send(command, destination, make_packet, RemoteATCommandResponsePacket, handle_response, self._command_timeout(command))
+
+    def _remote_at_command_result(self, command : ServerCommand, packet : RemoteATCommandResponsePacket) -> dict:
+        if packet.status != ATCommandStatus.OK:
+            raise ATCommandException(message=packet.status.description, cmd_status=packet.status)
+        if command.description["name"] != "get_parameter":
             return {"result":None}
-        else:
-            return {"result":base64.b64encode(result).decode()}
+        if packet.command_value is None:
+            raise OperationNotSupportedException(message=f"Could not get the {packet.command} value.")
+        return {"result":bytes(packet.command_value)}
 
     def _data_received_callback(self, xbee_message):
         address = str(xbee_message.remote_device.get_64bit_addr())
-        received_data = base64.b64encode(xbee_message.data).decode()
+        received_data = bytes(xbee_message.data)
         message_data = {"address64":address, "message":received_data}
-        self.notify_queue.put({"type":"notify", "name":"receive", "data":message_data})
+        with self._notification_lock:
+            self._notification_seq += 1
+            self.notify_queue.put({"type":"notify", "name":"receive", "seq":self._notification_seq, "epoch":self.epoch, "data":message_data})
         self._log_received_message(message_data)
 
     def _configure_logger(self):
@@ -178,13 +344,16 @@ class XBeeDeviceConnection:
         self.logger.addHandler(logging.NullHandler())
     
     def _log_command_begin(self, command : ServerCommand):
-        self.logger.debug("Started executing command %s", json.dumps(command.description))
+        self.logger.debug("Started executing command %s", self._to_json(command.description))
 
     def _log_command_successful(self, command : ServerCommand, result : dict):
-        self.logger.info("Executed command %s. Result: %s", json.dumps(command.description), json.dumps(result))
+        self.logger.info("Executed command %s. Result: %s", self._to_json(command.description), self._to_json(result))
 
     def _log_command_error(self, command : ServerCommand, error : str):
-        self.logger.error("Error while executing command %s: %s", json.dumps(command.description), error)
+        self.logger.error("Error while executing command %s: %s", self._to_json(command.description), error)
 
     def _log_received_message(self, message_data : dict):
-        self.logger.info("Received message: %s", json.dumps(message_data))
+        self.logger.info("Received message: %s", self._to_json(message_data))
+
+    def _to_json(self, obj) -> str:
+        return json.dumps(obj, default=socket_common.json_default)
@@ -6,6 +6,10 @@ from . import config
 from .xbee_device_connection import XBeeDeviceConnection
 from .request_response_server import SocketRequestResponseServer
 from .notify_server import SocketNotifyServer
+from .coalescing import CoalescingCommandQueue
+from .command_queue import PriorityCommandQueue
+from .metrics import Metrics
+from .event_loop import ServerEventLoop
 
 def _configure_loggers():
     with open("receiver/logconfig.json", "r") as fp:
@@ -30,22 +34,29 @@ def main():
     - one :class:`~receiver.xbee_device_connection.XBeeDeviceConnection`
     - one :class:`~receiver.request_response_server.SocketRequestResponseServer`
     - one :class:`~receiver.notify_server.SocketNotifyServer`
+    - one :class:`~receiver.coalescing.CoalescingCommandQueue`, through which the requests are put into the command queue
+    - one :class:`~receiver.event_loop.ServerEventLoop`, on which both servers run
 
     """
     signal.signal(signal.SIGINT, _sigint_handler)
     _configure_loggers()
     _check_device_config()
+    metrics = Metrics()
     device = XBeeDevice(config.DEVICE_SERIAL_PORT, config.DEVICE_BAUD_RATE)
-    xbee_connection = XBeeDeviceConnection(device)
+    xbee_connection = XBeeDeviceConnection(device, PriorityCommandQueue(metrics), metrics=metrics)
     xbee_connection.start()
     xbee_connection.connection_startup_finished.wait()
     if not xbee_connection.connection_startup_successful.is_set():
         print("Couldn't connect to the XBee device.")
         return
     print("Successfully connected to the XBee device.")
-    request_server = SocketRequestResponseServer(config.IP_ADDRESS, config.TCP_PORT_REQUEST, xbee_connection.command_queue)
+    command_queue = CoalescingCommandQueue(xbee_connection.command_queue, metrics)
+    event_loop = ServerEventLoop()
+    request_server = SocketRequestResponseServer(config.IP_ADDRESS, config.TCP_PORT_REQUEST, command_queue, metrics, event_loop,
+        config.UNIX_SOCKET_REQUEST)
     request_server.run()
-    notification_server = SocketNotifyServer(config.IP_ADDRESS, config.TCP_PORT_NOTIFY, xbee_connection.notify_queue)
+    notification_server = SocketNotifyServer(config.IP_ADDRESS, config.TCP_PORT_NOTIFY, xbee_connection.notify_queue, metrics, event_loop,
+        config.UNIX_SOCKET_NOTIFY)
     notification_server.run()
     while True:
         time.sleep(1)
@@ -0,0 +1,91 @@
+"""A fake XBee device for the tests of the coordinator handler."""
+
+import threading
+from queue import Queue
+from typing import Dict, Optional
+from digi.xbee.models.address import XBee16BitAddress
+from digi.xbee.models.status import ATCommandStatus, TransmitStatus
+from digi.xbee.packets.common import RemoteATCommandPacket, RemoteATCommandResponsePacket, TransmitStatusPacket
+from receiver.command_queue import PriorityCommandQueue
+from receiver.server_command import ServerCommand
+from receiver.xbee_device_connection import XBeeDeviceConnection
+
+class FakeDevice:
+    """A local XBee device which records the sent packets and answers them on behalf of the reachable nodes.
+
+    Attributes:
+        sent (list): the sent packets, in the order of sending.
+        reachable (set): 64-bit addresses of the nodes which respond, as upper-case hexadecimal strings.
+        response_delay (float): time (in seconds) after which a reachable node responds.
+    """
+
+    def __init__(self, reachable=(), response_delay : float = 0.01) -> None:
+        self.sent = []
+        self.reachable = set(reachable)
+        self.response_delay = response_delay
+        self._packet_callbacks = []
+        self._frame_id = 0
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def is_open(self):
+        return True
+
+    def add_data_received_callback(self, callback):
+        pass
+
+    def add_packet_received_callback(self, callback):
+        self._packet_callbacks.append(callback)
+
+    def get_next_frame_id(self):
+        self._frame_id = self._frame_id % 255 + 1
+        return self._frame_id
+
+    def send_packet(self, packet, sync=False):
+        self.sent.append(packet)
+        if str(packet.x64bit_dest_addr) in self.reachable:
+            timer = threading.Timer(self.response_delay, self._respond, args=(packet,))
+            timer.daemon = True
+            timer.start()
+
+    def _respond(self, packet):
+        if isinstance(packet, RemoteATCommandPacket):
+            response = RemoteATCommandResponsePacket(packet.frame_id, packet.x64bit_dest_addr, XBee16BitAddress.UNKNOWN_ADDRESS,
+                packet.command, ATCommandStatus.OK, comm_value=b"\x01")
+        else:
+            response = TransmitStatusPacket(packet.frame_id, XBee16BitAddress.UNKNOWN_ADDRESS, 0, TransmitStatus.SUCCESS)
+        for callback in self._packet_callbacks:
+            callback(response)
+
+def sent_commands(device : FakeDevice):
+    """Returns the AT commands sent to the nodes as (address, command) tuples, in the order of sending."""
+    return [(str(packet.x64bit_dest_addr), packet.command) for packet in device.sent if isinstance(packet, RemoteATCommandPacket)]
+
+def start_connection(device : FakeDevice, command_queue : Optional[PriorityCommandQueue] = None) -> XBeeDeviceConnection:
+    """Starts a device connection with the fake device and waits until it's ready."""
+    connection = XBeeDeviceConnection(device, command_queue)
+    connection.start()
+    connection.connection_startup_finished.wait()
+    return connection
+
+def put_request(command_queue, name : str, data : dict, **fields) -> Queue:
+    """Puts a request into the command queue.
+
+    Returns:
+        The queue into which the response is put.
+    """
+    response_queue = Queue()
+    command_queue.put(ServerCommand({"type":"request", "name":name, "data":data, **fields}, response_queue))
+    return response_queue
+
+def at_data(address : str, at_command : str, **fields) -> Dict:
+    """Returns the data of an AT command request."""
+    return {"address64":address, "at_command":at_command, **fields}
+
+def wait_for_response(response_queue : Queue, timeout : float = 5) -> dict:
+    """Waits for a response and returns it."""
+    return response_queue.get(timeout=timeout)
@@ -0,0 +1,49 @@
+"""Tests of the execution of `batch` requests by :class:`receiver.batch.BatchExecution`."""
+
+from queue import Queue
+from receiver.command_queue import PriorityCommandQueue
+from receiver.server_command import ServerCommand
+from tests.fake_xbee import FakeDevice, at_data, put_request, sent_commands, start_connection, wait_for_response
+
+NODE = "0013A20000000001"
+OTHER_NODE = "0013A20000000002"
+
+def test_step_put_at_front_goes_before_the_waiting_commands_of_its_destination():
+    command_queue = PriorityCommandQueue()
+    waiting = ServerCommand({"type":"request", "name":"get_parameter", "data":at_data(NODE, "NI")}, Queue())
+    step = ServerCommand({"type":"request", "name":"set_parameter", "data":at_data(NODE, "D0", value="AQ==")}, Queue())
+    command_queue.put(waiting)
+    command_queue.put(step, front=True)
+
+    assert command_queue.get(block=False) is step
+    assert command_queue.get(block=False) is waiting
+
+def test_batch_is_not_interleaved_with_other_commands_to_its_node():
+    device = FakeDevice(reachable=[NODE, OTHER_NODE], response_delay=0.05)
+    connection = start_connection(device)
+    steps = [{"name":"set_parameter", "data":at_data(NODE, f"D{index}", value="AQ==", apply_changes=False)} for index in range(3)]
+    steps.append({"name":"execute_command", "data":at_data(NODE, "AC")})
+
+    batch_response = put_request(connection.command_queue, "batch", {"commands":steps})
+    other_responses = [put_request(connection.command_queue, "set_parameter", at_data(NODE, "D9", value="AQ==")) for _ in range(2)]
+    other_node_response = put_request(connection.command_queue, "get_parameter", at_data(OTHER_NODE, "NI"))
+
+    assert wait_for_response(batch_response)["status"] == "ok"
+    assert all(wait_for_response(response)["status"] == "ok" for response in other_responses)
+    assert wait_for_response(other_node_response)["status"] == "ok"
+    commands_to_node = [command for address, command in sent_commands(device) if address == NODE]
+    assert commands_to_node == ["D0", "D1", "D2", "AC", "D9", "D9"]
+    # The commands to the other nodes are not delayed by the batch.
+    assert sent_commands(device).index((OTHER_NODE, "NI")) < sent_commands(device).index((NODE, "AC"))
+
+def test_other_commands_to_the_node_run_after_a_failed_batch():
+    device = FakeDevice(response_delay=0.01)
+    connection = start_connection(device)
+    steps = [{"name":"get_parameter", "data":at_data(NODE, "NI"), "timeout":0.1}, {"name":"get_parameter", "data":at_data(NODE, "ID")}]
+
+    batch_response = put_request(connection.command_queue, "batch", {"commands":steps})
+    other_response = put_request(connection.command_queue, "get_parameter", at_data(NODE, "SH"), timeout=0.1)
+
+    assert wait_for_response(batch_response)["status"] == "error"
+    assert wait_for_response(other_response)["status"] == "error"
+    assert [command for _, command in sent_commands(device)] == ["NI", "SH"]
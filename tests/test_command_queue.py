@@ -0,0 +1,67 @@
+"""Tests of the order in which :class:`receiver.command_queue.PriorityCommandQueue` serves the commands."""
+
+import time
+from queue import Empty, Queue
+import pytest
+from receiver.command_queue import PriorityCommandQueue
+from receiver.server_command import ServerCommand
+
+def make_command(address=None, priority=None, name="get_parameter", age=0.0):
+    description = {"type":"request", "name":name, "data":{} if address is None else {"address64":address, "at_command":"NI"}}
+    if priority is not None:
+        description["priority"] = priority
+    return ServerCommand(description, Queue(), time_created=time.monotonic() - age)
+
+def take_all(command_queue, ready=None):
+    commands = []
+    while True:
+        try:
+            commands.append(command_queue.get(block=False, ready=ready))
+        except Empty:
+            return commands
+
+def test_higher_priority_class_is_served_first():
+    command_queue = PriorityCommandQueue()
+    background = make_command(name="discover")
+    polling = make_command("01", "polling")
+    interactive = make_command("02")
+    for command in (background, polling, interactive):
+        command_queue.put(command)
+
+    assert take_all(command_queue) == [interactive, polling, background]
+
+def test_destinations_are_served_in_round_robin_order():
+    command_queue = PriorityCommandQueue()
+    # All commands to the first node are put before the commands to the other nodes.
+    for address in ("01", "02", "03"):
+        for _ in range(3):
+            command_queue.put(make_command(address))
+
+    served = [command.description["data"]["address64"] for command in take_all(command_queue)]
+
+    assert served == ["01", "02", "03"] * 3
+
+def test_starving_commands_are_served_first_oldest_first():
+    command_queue = PriorityCommandQueue()
+    command_queue.starvation_time = 10
+    interactive = make_command("01")
+    old_background = make_command(name="discover", age=15)
+    older_polling = make_command("02", "polling", age=20)
+    for command in (interactive, old_background, older_polling):
+        command_queue.put(command)
+
+    assert take_all(command_queue) == [older_polling, old_background, interactive]
+
+def test_commands_which_are_not_ready_keep_their_place():
+    command_queue = PriorityCommandQueue()
+    blocked = make_command("01")
+    other = make_command("02", "polling")
+    command_queue.put(blocked)
+    command_queue.put(other)
+
+    assert take_all(command_queue, ready=lambda command: command is not blocked) == [other]
+    assert take_all(command_queue) == [blocked]
+
+def test_get_with_timeout_raises_empty():
+    with pytest.raises(Empty):
+        PriorityCommandQueue().get(timeout=0.01)
@@ -0,0 +1,60 @@
+"""Tests of the database queries in :mod:`webserver.dbsrv`."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from webserver import dbmodels, dbsrv, pydmodels
+from webserver.database import Base
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+def add_floors(db, floor_count, nodes_per_floor):
+    for floor_number in range(floor_count):
+        floor = dbmodels.Floor(name=f"Floor {floor_number}", number=floor_number, width=100, height=100, image=b"image")
+        for node_number in range(nodes_per_floor):
+            node = dbmodels.Node(name=f"Node {node_number}", address64=f"{node_number:016X}", x=1, y=1)
+            node.reading_configs = [dbmodels.ReadingConfig(name="Temperature", mode="listen", refresh_period=0, message_prefix="dA==")]
+            floor.nodes.append(node)
+        db.add(floor)
+    db.commit()
+    db.expunge_all()
+
+def count_floor_queries(db):
+    statements = []
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        floors = dbsrv.get_all_floors(db)
+        # The response is serialized like in the endpoint, which accesses the nodes and their reading configs.
+        [pydmodels.Floor.from_orm(floor) for floor in floors]
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+@pytest.mark.parametrize("floor_count, nodes_per_floor", [(1, 1), (5, 20), (10, 40), (50, 60)])
+def test_get_all_floors_uses_constant_number_of_queries(db, floor_count, nodes_per_floor):
+    add_floors(db, floor_count, nodes_per_floor)
+
+    statements = count_floor_queries(db)
+
+    # One query for the maps and one for their nodes joined with the reading configs.
+    assert len(statements) == 2
+
+def test_get_all_floors_does_not_load_images(db):
+    add_floors(db, 2, 2)
+
+    statements = count_floor_queries(db)
+
+    assert not any("floors.image," in statement or "floors.image " in statement for statement in statements)
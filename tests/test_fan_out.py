@@ -0,0 +1,38 @@
+"""Tests of the execution of `fan_out` requests by :class:`receiver.fan_out.FanOutExecution`."""
+
+import time
+from receiver import config
+from tests.fake_xbee import FakeDevice, at_data, put_request, start_connection, wait_for_response
+
+NODES = [f"0013A200000002{index:02X}" for index in range(40)]
+DEAD_NODES = NODES[::10]
+HEALTHY_NODE = "0013A20000000003"
+
+def test_unreachable_nodes_are_missing_and_live_nodes_are_queried(monkeypatch):
+    monkeypatch.setattr(config, "FAN_OUT_NODE_TIMEOUT", 0.2)
+    device = FakeDevice(reachable=set(NODES) - set(DEAD_NODES))
+    connection = start_connection(device)
+
+    started = time.monotonic()
+    response = wait_for_response(put_request(connection.command_queue, "fan_out", {"at_command":"NI", "addresses":NODES, "timeout":4}))
+
+    assert response["status"] == "ok"
+    assert sorted(response["data"]["missing"]) == sorted(DEAD_NODES)
+    assert sorted(response["data"]["results"]) == sorted(set(NODES) - set(DEAD_NODES))
+    assert all(result["status"] == "ok" for result in response["data"]["results"].values())
+    # The response is sent when all nodes are finished, not at the end of the collection.
+    assert time.monotonic() - started < 3
+
+def test_fan_out_does_not_block_interactive_commands(monkeypatch):
+    monkeypatch.setattr(config, "FAN_OUT_NODE_TIMEOUT", 0.5)
+    device = FakeDevice(reachable=[HEALTHY_NODE])
+    connection = start_connection(device)
+    fan_out_response = put_request(connection.command_queue, "fan_out", {"at_command":"NI", "addresses":DEAD_NODES, "timeout":4})
+    time.sleep(0.1)
+
+    started = time.monotonic()
+    response = wait_for_response(put_request(connection.command_queue, "set_parameter", at_data(HEALTHY_NODE, "D0", value="AQ==")))
+
+    assert response["status"] == "ok"
+    assert time.monotonic() - started < 0.3
+    assert sorted(wait_for_response(fan_out_response)["data"]["missing"]) == sorted(DEAD_NODES)
@@ -0,0 +1,58 @@
+"""Tests of the limits of frames in flight in :class:`receiver.frame_pipeline.FramePipeline`."""
+
+import time
+from receiver import config
+from tests.fake_xbee import FakeDevice, at_data, put_request, start_connection, wait_for_response
+
+DEAD_NODES = ["0013A20000000001", "0013A20000000002"]
+HEALTHY_NODE = "0013A20000000003"
+
+def wait_until_sent(device, count):
+    # The frames to the unreachable nodes are sent before the command to the healthy node is put into the queue.
+    end_time = time.monotonic() + 1
+    while len(device.sent) < count and time.monotonic() < end_time:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+def test_unreachable_nodes_do_not_block_other_nodes():
+    # At 9600 baud the pipeline allows 4 frames in flight, the unreachable nodes get 2 frames each.
+    assert config.DEVICE_BAUD_RATE == 9600 and config.PIPELINE_MAX_IN_FLIGHT is None
+    device = FakeDevice(reachable=[HEALTHY_NODE])
+    connection = start_connection(device)
+    for address in DEAD_NODES:
+        for _ in range(2):
+            put_request(connection.command_queue, "get_parameter", at_data(address, "NI"), priority="polling")
+    wait_until_sent(device, 3)
+
+    started = time.monotonic()
+    response = wait_for_response(put_request(connection.command_queue, "set_parameter", at_data(HEALTHY_NODE, "D0", value="AQ==")))
+
+    assert response["status"] == "ok"
+    assert time.monotonic() - started < 1
+
+def test_stale_frames_stop_counting_into_the_limit(monkeypatch):
+    monkeypatch.setattr(config, "PIPELINE_STALE_FRAME_AGE", 0.3)
+    dead_nodes = [f"0013A200000001{index:02X}" for index in range(4)]
+    device = FakeDevice(reachable=[HEALTHY_NODE])
+    connection = start_connection(device)
+    for address in dead_nodes:
+        put_request(connection.command_queue, "get_parameter", at_data(address, "NI"))
+    wait_until_sent(device, 4)
+
+    started = time.monotonic()
+    response = wait_for_response(put_request(connection.command_queue, "get_parameter", at_data(HEALTHY_NODE, "NI")))
+
+    assert response["status"] == "ok"
+    assert time.monotonic() - started < 1
+
+def test_node_which_timed_out_gets_one_frame_in_flight():
+    device = FakeDevice()
+    connection = start_connection(device)
+    address = DEAD_NODES[0]
+    wait_for_response(put_request(connection.command_queue, "get_parameter", at_data(address, "NI"), timeout=0.1))
+
+    for _ in range(2):
+        put_request(connection.command_queue, "get_parameter", at_data(address, "NI"))
+    time.sleep(0.2)
+
+    assert len(device.sent) == 2
@@ -0,0 +1,54 @@
+"""Tests of the generation of the tile pyramids in :mod:`webserver.tiles`."""
+
+import pytest
+from PIL import Image
+from webserver import config, tiles
+
+TILE_SIZE = 256
+
+def make_image(path, mode="RGB", size=(600, 300)):
+    Image.new(mode, size, "white").save(path)
+    return path
+
+def test_tiles_keep_the_mode_of_the_image(tmp_path):
+    image_path = make_image(tmp_path / "map.png")
+
+    min_zoom = tiles.generate_tiles(image_path, tmp_path / "tiles", TILE_SIZE)
+
+    assert min_zoom == -2
+    with Image.open(tiles.tile_path(tmp_path / "tiles", 0, 0, -1)) as tile:
+        assert tile.mode == "RGB" and tile.size == (TILE_SIZE, TILE_SIZE)
+    # The tile at the right edge is padded with transparent pixels.
+    with Image.open(tiles.tile_path(tmp_path / "tiles", 0, 2, -1)) as tile:
+        assert tile.mode == "RGBA" and tile.size == (TILE_SIZE, TILE_SIZE)
+        assert tile.getpixel((0, 0)) == (255, 255, 255, 255)
+        assert tile.getpixel((600 - 2 * TILE_SIZE, 0))[3] == 0
+    assert tiles.tile_path(tmp_path / "tiles", -2, 0, -1).is_file()
+
+def test_full_resolution_image_is_not_converted(tmp_path, monkeypatch):
+    image_path = make_image(tmp_path / "map.png", size=(1000, 700))
+    converted_sizes = []
+    convert = Image.Image.convert
+    def recording_convert(image, *args, **kwargs):
+        converted_sizes.append(image.size)
+        return convert(image, *args, **kwargs)
+    monkeypatch.setattr(Image.Image, "convert", recording_convert)
+
+    tiles.generate_tiles(image_path, tmp_path / "tiles", TILE_SIZE)
+
+    assert converted_sizes and all(width <= TILE_SIZE and height <= TILE_SIZE for width, height in converted_sizes)
+
+def test_palette_image_is_converted_to_a_reducible_mode(tmp_path):
+    image_path = make_image(tmp_path / "map.png", mode="P")
+
+    assert tiles.generate_tiles(image_path, tmp_path / "tiles", TILE_SIZE) == -2
+    with Image.open(tiles.tile_path(tmp_path / "tiles", 0, 0, -1)) as tile:
+        assert tile.mode == "RGB"
+
+def test_too_large_image_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "MAP_IMAGE_MAX_PIXELS", 100_000)
+    image_path = make_image(tmp_path / "map.png")
+
+    with pytest.raises(ValueError):
+        tiles.generate_tiles(image_path, tmp_path / "tiles", TILE_SIZE)
+    assert not (tmp_path / "tiles").exists()
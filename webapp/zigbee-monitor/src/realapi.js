@@ -80,8 +80,9 @@ async function getLayers(){
     return layers;
 }
 
-async function getDiscoveryResults(){
-    const response = await axios.get(apiurl('/network-discovery'));
+async function getDiscoveryResults(maxAge){
+    const params = typeof maxAge === 'number' ? {max_age:maxAge} : {};
+    const response = await axios.get(apiurl('/network-discovery'), {params:params});
     log(response.data);
     return response.data;
 }
@@ -164,7 +165,9 @@ async function deleteUser(user){
 
 function processLayersResponse(layers){
     for(let layer of layers){
-        layer.imgurl = apiurl('/floors/'+layer.id+'/image');
+        layer.imgurl = layer.image_hash ? apiurl('/floor-images/'+layer.image_hash) : apiurl('/floors/'+layer.id+'/image');
+        layer.tileurl = (layer.image_hash && layer.tile_min_zoom !== null) ? apiurl('/floors/'+layer.id+'/tiles/{z}/{x}/{y}?v='+layer.image_hash) : null;
+        layer.tileMinZoom = layer.tile_min_zoom;
         for(let node of layer.nodes){
             node.address16 = null;
             node.deviceId = null;
@@ -20,6 +20,17 @@ function isOneColumnMode(mode){
     return oneColumnModes.indexOf(mode) !== -1;
 }
 
+function formatAtCommandReading(result, resultFormat){
+    if(result === null)
+        return '---';
+    else if(resultFormat === 'hex')
+        return utils.decodeMessageToHex(result);
+    else if(resultFormat === 'dec')
+        return utils.decodeToDecBigEndian(result);
+    else
+        return utils.decodeMessageToText(result);
+}
+
 function getDefaultState(){
     return {
         user:null,
@@ -124,6 +135,7 @@ const store = new Vuex.Store({
         setEditedLayerImage(state, imageData){
             state.editedLayerImageFile = imageData.file;
             state.editedLayer.imgurl = imageData.imgurl;
+            state.editedLayer.tileurl = null;
             state.editedLayer.width = imageData.width;
             state.editedLayer.height = imageData.height;
         },
@@ -287,6 +299,20 @@ const store = new Vuex.Store({
         setLastReading(state, data){
             data.readingConfig.lastReading = data.lastReading;
         },
+        updateScheduledReading(state, reading){
+            for(let layer of state.layers){
+                for(let node of layer.nodes){
+                    const rc = node.readingConfigs.find(rc => rc.id === reading.reading_config_id);
+                    if(rc){
+                        if(reading.status === 'ok')
+                            rc.lastReading = formatAtCommandReading(reading.result, rc.atCommandResultFormat);
+                        else
+                            rc.lastReading = '---';
+                        return;
+                    }
+                }
+            }
+        },
         addReadingTimer(state, timerId){
             state.readingTimers.push(timerId);
         },
@@ -343,10 +369,10 @@ const store = new Vuex.Store({
             context.commit('setLayers', layers);
             context.commit('writeDiscoveryStatusToNodes');
             context.commit('clearReadingTimers');
-            context.dispatch('setReadingTimers');
+            context.dispatch('setDiscoveryTimer');
         },
-        async downloadDiscoveryResults(context){
-            const results = await api.getDiscoveryResults();
+        async downloadDiscoveryResults(context, maxAge){
+            const results = await api.getDiscoveryResults(maxAge);
             context.commit('setDiscoveryResults', results);
             context.commit('writeDiscoveryStatusToNodes');
         },
@@ -386,55 +412,19 @@ const store = new Vuex.Store({
             context.commit('addMessage', message);
             context.commit('updateLastReadings', message);
         },
-        setReadingTimers(context){
-            for(let layer of context.state.layers){
-                for(let node of layer.nodes){
-                    for(let rc of node.readingConfigs){
-                        if(rc.mode === 'send'){
-                            const actionData = {node:node, readingConfig:rc};
-                            const timerId = setInterval(context.dispatch, rc.refreshPeriod*1000, 'sendMessageForReading', actionData);
-                            context.commit('addReadingTimer', timerId);
-                            context.dispatch('sendMessageForReading', actionData);
-                        }
-                        else if(rc.mode === 'at'){
-                            const actionData = {node:node, readingConfig:rc};
-                            const timerId = setInterval(context.dispatch, rc.refreshPeriod*1000, 'sendAtCommandForReading', actionData);
-                            context.commit('addReadingTimer', timerId);
-                            context.dispatch('sendAtCommandForReading', actionData);
-                        }
-                    }
-                }
-            }
+        handleSocketMessage(context, message){
+            if(message.type === 'batch')
+                message.messages.forEach(batchedMessage => context.dispatch('handleSocketMessage', batchedMessage));
+            else if(message.type === 'reading')
+                context.commit('updateScheduledReading', message);
+            else
+                context.dispatch('addReceivedMessage', message);
+        },
+        setDiscoveryTimer(context){
             const dixcoveryTimerId = setInterval(context.dispatch, 120*1000, 'downloadDiscoveryResults');
             context.commit('addReadingTimer', dixcoveryTimerId);
             context.dispatch('downloadDiscoveryResults');
 
-        },
-        async sendMessageForReading(context, data){
-            const message = {type:'sent', address64:data.node.address64, message:data.readingConfig.messageToSend};
-            await context.dispatch('sendMessage', message);
-
-        },
-        async sendAtCommandForReading(context, data){
-            const commandData = {
-                commandType:'get_parameter',
-                address64:data.node.address64,
-                atCommand:data.readingConfig.atCommand,
-                value:data.readingConfig.atCommandData,
-            };
-            const message = await context.dispatch('sendAtCommand', commandData);
-            let lastReading;
-            if(message.result === null)
-                lastReading = '---';
-            else if(data.readingConfig.atCommandResultFormat === 'hex')
-                lastReading = utils.decodeMessageToHex(message.result);
-            else if(data.readingConfig.atCommandResultFormat === 'dec')
-                lastReading = utils.decodeToDecBigEndian(message.result);
-            else
-                lastReading = utils.decodeMessageToText(message.result);
-
-            context.commit('setLastReading', {readingConfig:data.readingConfig, lastReading:lastReading});
-
         },
         async sendAtCommand(context, commandData){
             const message = {
@@ -461,7 +451,7 @@ const store = new Vuex.Store({
         },
         openMessageSocket(context){
             const socket = api.makeMessageSocket();
-            socket.onmessage = e => store.dispatch('addReceivedMessage', JSON.parse(e.data));
+            socket.onmessage = e => store.dispatch('handleSocketMessage', JSON.parse(e.data));
             context.commit('setMessageSocket', socket);
         },
         closeMessageSocket(context){
@@ -22,15 +22,66 @@ XBEE_PORT_NOTIFY = 9021
 #: IP address of the coordinator handler.
 XBEE_IP_ADDRESS = '127.0.0.1'
 
+#: Path of the Unix domain socket used for making requests to the coordinator handler
+#: (`UNIX_SOCKET_REQUEST` in the config of the coordinator handler). If set, it's used instead of `XBEE_PORT_REQUEST`.
+#: The default (None) means TCP, which is needed when the coordinator handler runs on another machine.
+XBEE_UNIX_SOCKET_REQUEST = None
+
+#: Path of the Unix domain socket used for getting notifications from the coordinator handler
+#: (`UNIX_SOCKET_NOTIFY` in the config of the coordinator handler). If set, it's used instead of `XBEE_PORT_NOTIFY`.
+XBEE_UNIX_SOCKET_NOTIFY = None
+
+#: Maximum number of the connections to the request-response server of the coordinator handler.
+#: Each connection carries many requests at once, so a few connections are enough.
+XBEE_POOL_SIZE = 4
+
+#: Time (in seconds) between the health checks of the connections to the coordinator handler. 0 disables the health checks.
+XBEE_HEALTH_CHECK_INTERVAL = 30
+
+#: Time (in seconds) in which the coordinator handler must answer a health check, otherwise the connection is closed.
+XBEE_HEALTH_CHECK_TIMEOUT = 5
+
+#: Delay (in seconds) before the next attempt to connect to the coordinator handler after a failed attempt.
+#: The delay doubles after each consecutive failure, up to `XBEE_RECONNECT_BACKOFF_MAX`.
+XBEE_RECONNECT_BACKOFF_MIN = 0.1
+
+#: Maximum delay (in seconds) between the attempts to connect to the coordinator handler.
+XBEE_RECONNECT_BACKOFF_MAX = 5
+
+#: Time (in seconds) for which the messages for a websocket are collected before they are sent in one batch.
+#: 0 means that the messages are sent as soon as possible (still in batches if they arrive faster than they are sent).
+WEBSOCKET_BATCH_TIME = 0.05
+
+#: Maximum number of messages sent to a websocket in one batch.
+WEBSOCKET_BATCH_SIZE = 100
+
+#: Maximum number of messages waiting to be sent to one websocket.
+WEBSOCKET_BUFFER_SIZE = 1000
+
+#: What happens when the buffer of a websocket is full.
+#: `drop_oldest` drops the oldest waiting message, `disconnect` closes the websocket.
+WEBSOCKET_OVERFLOW_POLICY = "drop_oldest"
+
 #: Time after which the user is logged out.
 SESSION_IDLE_TIME = 15*60
 
+#: Time (in seconds) between writing the times of the last activity of the cached user sessions to the database.
+SESSION_ACTIVITY_FLUSH_INTERVAL = 30
+
 #: Location of the SQLite database file
 DATABASE_URL = "sqlite:///" + str(PROJECT_DIR / "database" / "zigbee_monitor.db")
 
 #: Timeout for requests to the coordinator handler.
 DEVICE_TIMEOUT = 30
 
+#: The directory in which the map images are stored, in files named by the hashes of their contents.
+IMAGE_STORE_DIR = str(PROJECT_DIR / "database" / "images")
+
+#: Maximum number of pixels of a map image from which the tiles are generated. The whole image is decoded into the memory
+#: (about 4 bytes per pixel), so the tiles of larger images aren't generated and the map display shows the whole image.
+#: It's also used as the limit of the decompression bomb check of Pillow (`PIL.Image.MAX_IMAGE_PIXELS`).
+MAP_IMAGE_MAX_PIXELS = 100_000_000
+
 #: The directory with static files.
 STATIC_FILES_DIR = str(Path(__file__).parent / "static")
 
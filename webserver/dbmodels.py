@@ -1,7 +1,7 @@
 """Module defining ORM models used by SQLAlchemy"""
 
 from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Float, LargeBinary
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql.sqltypes import DateTime
 
 from .database import Base
@@ -20,8 +20,16 @@ class Floor(Base):
     number = Column(Integer)
     """The number used for sorting maps. If the maps are building floors, the number may be equal to floor number."""
 
-    image = Column(LargeBinary)
-    """Map image file."""
+    image = deferred(Column(LargeBinary))
+    """Map image file stored in the database by the previous versions. It's deferred, so it's loaded only when it's accessed.
+    Such images are moved into the :mod:`~webserver.image_store` on startup, see :func:`~webserver.dbsrv.migrate_floor_images`."""
+
+    image_hash = Column(String(64))
+    """SHA-256 hash of the map image file in the :mod:`~webserver.image_store`. None if the map has no image."""
+
+    tile_min_zoom = Column(Integer)
+    """The lowest zoom level of the tile pyramid of the map image (see :mod:`~webserver.tiles`).
+    None if the tiles haven't been generated yet."""
 
     image_media_type = Column(String(256))
     """Media type of the image file."""
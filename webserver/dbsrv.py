@@ -1,15 +1,27 @@
 """Module with functions operating on the database."""
 
 from datetime import datetime, timedelta
-from typing import List
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import File, UploadFile, HTTPException
 import secrets
 from . import config, dbmodels, pydmodels
 from .pwdcontext import pwd_context
+from .session_cache import session_cache
+from .image_store import image_store
+
+def _query_floors(db: Session):
+    # The nodes are loaded by one query for all maps at once, together with their reading configs (joined),
+    # instead of one query per map and per node during serialization. The reading configs are joined
+    # rather than loaded by another selectinload, which would split the ids of thousands of nodes into several queries.
+    # The image is deferred in the model.
+    return db.query(dbmodels.Floor).options(
+        selectinload(dbmodels.Floor.nodes).joinedload(dbmodels.Node.reading_configs))
 
 def get_floor_by_id(db: Session, floor_id: int):
-    """Gets a map by its id.
+    """Gets a map by its id, with its nodes and their reading configs, but without the image.
     
     Args:
         db: a database session.
@@ -19,10 +31,12 @@ def get_floor_by_id(db: Session, floor_id: int):
         The map with the given id.
     """
 
-    return db.query(dbmodels.Floor).filter(dbmodels.Floor.id == floor_id).first()
+    return _query_floors(db).filter(dbmodels.Floor.id == floor_id).first()
 
 def get_all_floors(db: Session):
-    """Gets all maps from the database.
+    """Gets all maps from the database, with their nodes and reading configs, but without the images.
+
+    The maps are loaded by a constant number of queries, regardless of the number of maps and nodes.
     
     Args:
         db: a database session.
@@ -30,7 +44,36 @@ def get_all_floors(db: Session):
     Returns:
         All maps in the database.
     """
-    return db.query(dbmodels.Floor).order_by(dbmodels.Floor.number.desc()).all()
+    return _query_floors(db).order_by(dbmodels.Floor.number.desc()).all()
+
+def get_floor_image(db: Session, floor_id: int):
+    """Gets the hash, the media type and the lowest tile zoom level of the image of a map, without loading the nodes of the map.
+
+    Args:
+        db: a database session.
+        floor_id: id of the map.
+
+    Returns:
+        A row with the fields `image_hash`, `image_media_type` and `tile_min_zoom`, or None if the map doesn't exist.
+    """
+    return (db.query(dbmodels.Floor.image_hash, dbmodels.Floor.image_media_type, dbmodels.Floor.tile_min_zoom)
+        .filter(dbmodels.Floor.id == floor_id)
+        .first())
+
+def get_image_media_type(db: Session, image_hash: str):
+    """Gets the media type of a map image by its hash.
+
+    Args:
+        db: a database session.
+        image_hash: hash of the image.
+
+    Returns:
+        The media type of the image, or None if no map uses the image.
+    """
+    row = (db.query(dbmodels.Floor.image_media_type)
+        .filter(dbmodels.Floor.image_hash == image_hash)
+        .first())
+    return None if row is None else row.image_media_type
 
 def create_floor(db: Session, floor: pydmodels.FloorCreate):
     """Adds a map to the database.
@@ -48,8 +91,7 @@ def create_floor(db: Session, floor: pydmodels.FloorCreate):
         db_floor.nodes.append(db_node)
     db.add(db_floor)
     db.commit()
-    db.refresh(db_floor)
-    return db_floor
+    return get_floor_by_id(db, db_floor.id)
 
 def modify_floor(db: Session, floor_id:int, floor: pydmodels.Floor):
     """Modifies a map in the database.
@@ -62,7 +104,7 @@ def modify_floor(db: Session, floor_id:int, floor: pydmodels.Floor):
     Returns:
         The modified map from the database.
     """
-    db_floor = db.query(dbmodels.Floor).get(floor_id)
+    db_floor = _query_floors(db).filter(dbmodels.Floor.id == floor_id).first()
     if db_floor is None:
         return None
     db_floor.name = floor.name
@@ -73,8 +115,7 @@ def modify_floor(db: Session, floor_id:int, floor: pydmodels.Floor):
     _update_nodes_in_floor(floor, db_floor)
     _add_nodes_in_floor(floor, db_floor)
     db.commit()
-    db.refresh(db_floor)
-    return db_floor
+    return get_floor_by_id(db, floor_id)
 
 def _delete_nodes_in_floor(floor: pydmodels.Floor, db_floor: dbmodels.Floor):
     floor_node_ids = [n.id for n in floor.nodes]
@@ -104,26 +145,71 @@ def delete_floor(db: Session, floor_id: int) -> bool:
     db_floor = db.query(dbmodels.Floor).get(floor_id)
     if db_floor is None:
         return False
+    image_hash = db_floor.image_hash
     db.delete(db_floor)
     db.commit()
+    _remove_unused_image(db, image_hash)
     return True
 
-async def set_floor_image(db: Session, floor_id: int, file: UploadFile) -> None:
+def set_floor_image(db: Session, floor_id: int, file: UploadFile) -> str:
     """Sets the image file for the given map
     
+    The file is copied into the :data:`~webserver.image_store.image_store` and the map references it by its hash.
+    The previous image of the map is removed from the store if no other map uses it.
+    The tiles of the new image have to be generated by :func:`~webserver.tiles.generate_floor_tiles`.
+    The file is hashed and copied synchronously, so the function shouldn't be called on the event loop.
+
     Args:
         db: a database session.
         floor_id: id of the map.
         file: the file uploaded by the client.
+
+    Returns:
+        The hash of the image.
     """
-    contents = await file.read()
     db_floor = db.query(dbmodels.Floor).get(floor_id)
     if db_floor is None:
         raise HTTPException(status_code=404, detail="Floor not found")
-    db_floor.image = contents
+    image_hash = image_store.put_file(file.file)
+    previous_hash = db_floor.image_hash
+    db_floor.image = None
+    db_floor.image_hash = image_hash
     db_floor.image_media_type = file.content_type
+    if previous_hash != image_hash:
+        db_floor.tile_min_zoom = None
     db.commit()
-    db.refresh(db_floor)
+    if previous_hash != image_hash:
+        _remove_unused_image(db, previous_hash)
+    return image_hash
+
+def _remove_unused_image(db: Session, image_hash: Optional[str]):
+    if image_hash is None:
+        return
+    if db.query(dbmodels.Floor.id).filter(dbmodels.Floor.image_hash == image_hash).first() is None:
+        image_store.remove(image_hash)
+
+def migrate_floor_images(db: Session) -> None:
+    """Moves the map images stored in the database by the previous versions into the image store.
+
+    The `image_hash` and `tile_min_zoom` columns are added to the `floors` table if they're missing. Then the image of each map which has one
+    in the `image` column is copied into the :data:`~webserver.image_store.image_store` and removed from the database.
+    It should be called on startup.
+
+    Args:
+        db: a database session.
+    """
+    columns = [column["name"] for column in inspect(db.get_bind()).get_columns(dbmodels.Floor.__tablename__)]
+    for name, column_type in (("image_hash", "VARCHAR(64)"), ("tile_min_zoom", "INTEGER")):
+        if name not in columns:
+            db.execute(text(f"ALTER TABLE {dbmodels.Floor.__tablename__} ADD COLUMN {name} {column_type}"))
+    db.commit()
+    floor_ids = [row.id for row in db.query(dbmodels.Floor.id).filter(dbmodels.Floor.image.isnot(None))]
+    for floor_id in floor_ids:
+        db_floor = db.query(dbmodels.Floor).options(undefer(dbmodels.Floor.image)).get(floor_id)
+        db_floor.image_hash = image_store.put(db_floor.image)
+        db_floor.image = None
+        db.commit()
+        db.expunge(db_floor)
 
 def _make_db_node(node: pydmodels.Node) -> dbmodels.Node:
     db_node = dbmodels.Node(name=node.name, address64=node.address64, x=node.x, y=node.y)
@@ -280,6 +366,7 @@ def modify_user(db: Session, user_id: int, user: pydmodels.UserModify):
     if user.password is not None:
         db_user.password_hash = pwd_context.hash(user.password)
     db.commit()
+    session_cache.invalidate_user(user_id)
     db.refresh(db_user)
     return db_user
 
@@ -298,6 +385,7 @@ def delete_user(db: Session, user_id: int):
         return False
     db.delete(db_user)
     db.commit()
+    session_cache.invalidate_user(user_id)
     return True
 
 def change_password(db: Session, password_change: pydmodels.PasswordChange, username: str):
@@ -318,6 +406,7 @@ def change_password(db: Session, password_change: pydmodels.PasswordChange, user
         raise HTTPException(status_code=403, detail="Incorrect old password")
     db_user.password_hash = pwd_context.hash(password_change.new_password)
     db.commit()
+    session_cache.invalidate_user(db_user.id)
     db.refresh(db_user)
     return db_user
     
@@ -356,6 +445,7 @@ def get_all_user_sessions(db: Session) -> List[dbmodels.UserSession]:
     Returns:
         All user sessions from the database.
     """
+    session_cache.flush(db)
     return db.query(dbmodels.UserSession).all()
 
 def start_user_session(db: Session, db_user: dbmodels.User) -> dbmodels.UserSession:
@@ -387,6 +477,7 @@ def end_user_session(db: Session, session_id: str):
         db: a database session.
         session_id: session id (token)
     """
+    session_cache.invalidate(session_id)
     user_session = db.query(dbmodels.UserSession).filter(dbmodels.UserSession.session_id == session_id).first()
     db.delete(user_session)
     db.commit()
@@ -400,6 +491,7 @@ def end_all_user_sessions(db: Session, db_user: dbmodels.User):
         db: a database session.
         db_user: user, whose sessions will be deleted.
     """
+    session_cache.invalidate_user(db_user.id)
     del db_user.sessions[:]
     db.commit()
 
@@ -411,6 +503,7 @@ def delete_expired_user_sessions(db: Session):
     Args:
         db: a database session.
     """
+    session_cache.flush(db)
     time_newest_expired = datetime.now() - timedelta(seconds=config.SESSION_IDLE_TIME)
     db.query(dbmodels.UserSession).filter(dbmodels.UserSession.time_last_activity < time_newest_expired).delete()
     db.commit()
@@ -421,6 +514,7 @@ def delete_all_user_sessions(db: Session):
     Args:
         db: a database session.
     """
+    session_cache.clear()
     db.query(dbmodels.UserSession).delete()
     db.commit()
 
@@ -439,7 +533,10 @@ def get_session_by_session_id(db: Session, session_id: str):
 def get_session_and_refresh(db: Session, session_id: str):
     """Gets a session by its session id, checks if it is not expired and refreshes it.
     
-    If the session is expired it is removed from the database. Othewise the current time is written into time_last_activity.
+    The valid sessions are kept in the :data:`~webserver.session_cache.session_cache`, so usually the database isn't queried.
+    The current time is recorded as the time of the last activity in the cache and written into `time_last_activity`
+    in the database later, in a batch with other sessions. If the session is expired it is removed from the database.
+
     Args:
         db: a database session.
         session_id: session id (token).
@@ -448,19 +545,29 @@ def get_session_and_refresh(db: Session, session_id: str):
         If the session by the given session_id exists and is not expired returns the updates session.
         Otherwise, returns none.
     """
-    user_session = get_session_by_session_id(db, session_id)
-    if user_session is None:
-        return None
     time_now = datetime.now()
-    if time_now - user_session.time_last_activity > timedelta(seconds=config.SESSION_IDLE_TIME):
-        db.delete(user_session)
-        db.commit()
-        return None
-    user_session.time_last_activity = time_now
-    db.commit()
-    db.refresh(user_session)
-    return user_session
-
-
-
-
+    cached_session = session_cache.get(session_id, time_now)
+    if cached_session is None:
+        cached_session = _load_session(db, session_id)
+        if cached_session is None:
+            return None
+        if time_now - cached_session.time_last_activity > timedelta(seconds=config.SESSION_IDLE_TIME):
+            db.query(dbmodels.UserSession).filter(dbmodels.UserSession.id == cached_session.id).delete()
+            db.commit()
+            return None
+        session_cache.put(cached_session, time_now)
+    set_committed_value(cached_session, "time_last_activity", time_now)
+    # The cached session is copied into the database session without querying the database.
+    return db.merge(cached_session, load=False)
+
+def _load_session(db: Session, session_id: str):
+    # The session is loaded by a separate database session, so it's detached with all attributes loaded
+    # and can be kept in the cache.
+    loading_db = Session(bind=db.get_bind())
+    try:
+        return (loading_db.query(dbmodels.UserSession)
+            .options(joinedload(dbmodels.UserSession.user))
+            .filter(dbmodels.UserSession.session_id == session_id)
+            .first())
+    finally:
+        loading_db.close()
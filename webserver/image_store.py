@@ -0,0 +1,135 @@
+"""Content-addressed store of the map images.
+
+The images are kept as files named by the SHA-256 hash of their contents, so the same image is stored only once
+and a stored file never changes. The maps reference their images by the hash (:attr:`~webserver.dbmodels.Floor.image_hash`),
+which also serves as the strong ETag of the image.
+"""
+
+import hashlib, io, os, re, shutil, tempfile
+from pathlib import Path
+from typing import BinaryIO, Union
+from . import config
+
+_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+class ImageStore:
+    """A directory with files named by the SHA-256 hashes of their contents.
+
+    The files are placed in subdirectories named by the first two characters of the hash,
+    so a single directory doesn't hold too many files.
+
+    Attributes:
+        directory (pathlib.Path): the root directory of the store.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    """Size of the chunks in which the files are copied into the store."""
+
+    def __init__(self, directory : Union[str, Path]) -> None:
+        """Creates the store. The directory is created when the first file is added.
+
+        Args:
+            directory: the root directory of the store.
+        """
+        self.directory = Path(directory)
+
+    @staticmethod
+    def is_valid_hash(image_hash : str) -> bool:
+        """Checks if the string is a hash used by the store (64 lowercase hexadecimal digits).
+
+        Args:
+            image_hash: the checked string.
+        """
+        return _HASH_PATTERN.fullmatch(image_hash) is not None
+
+    def path(self, image_hash : str) -> Path:
+        """Returns the path of the file with the given hash.
+
+        Args:
+            image_hash: the hash of the file.
+
+        Raises:
+            ValueError: when the hash is invalid.
+        """
+        if not self.is_valid_hash(image_hash):
+            raise ValueError(f"Invalid image hash: {image_hash}")
+        return self.directory / image_hash[:2] / image_hash
+
+    def exists(self, image_hash : str) -> bool:
+        """Checks if the file with the given hash is in the store.
+
+        Args:
+            image_hash: the hash of the file.
+        """
+        return self.is_valid_hash(image_hash) and self.path(image_hash).is_file()
+
+    def put(self, data : bytes) -> str:
+        """Adds the data to the store.
+
+        Args:
+            data: the contents of the file.
+
+        Returns:
+            The hash of the data.
+        """
+        return self.put_file(io.BytesIO(data))
+
+    def put_file(self, source : BinaryIO) -> str:
+        """Copies a file into the store in chunks, without reading it into the memory at once.
+
+        Args:
+            source: the file opened in binary mode, read from its current position.
+
+        Returns:
+            The hash of the file.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as temp_file:
+            try:
+                for chunk in iter(lambda: source.read(self.CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+            except BaseException:
+                temp_file.close()
+                os.remove(temp_file.name)
+                raise
+        return self._commit(temp_file.name, digest.hexdigest())
+
+    def tiles_directory(self, image_hash : str) -> Path:
+        """Returns the directory of the tile pyramid of the image with the given hash (see :mod:`~webserver.tiles`).
+
+        Args:
+            image_hash: the hash of the image.
+
+        Raises:
+            ValueError: when the hash is invalid.
+        """
+        if not self.is_valid_hash(image_hash):
+            raise ValueError(f"Invalid image hash: {image_hash}")
+        return self.directory / "tiles" / image_hash[:2] / image_hash
+
+    def remove(self, image_hash : str) -> None:
+        """Removes the file with the given hash and its tiles from the store, if they exist.
+
+        Args:
+            image_hash: the hash of the file.
+        """
+        try:
+            self.path(image_hash).unlink()
+        except FileNotFoundError:
+            pass
+        shutil.rmtree(self.tiles_directory(image_hash), ignore_errors=True)
+
+    def _commit(self, temp_path : str, image_hash : str) -> str:
+        # The file is written under a temporary name and renamed, so a partially written file never has the final name.
+        target = self.path(image_hash)
+        if target.is_file():
+            os.remove(temp_path)
+            return image_hash
+        target.parent.mkdir(exist_ok=True)
+        os.replace(temp_path, target)
+        return image_hash
+
+image_store = ImageStore(config.IMAGE_STORE_DIR)
+"""The store of the map images used by the webserver."""
@@ -1,20 +1,33 @@
 """Main module of the FastAPI app."""
 
-import secrets
-from typing import List, Optional
-from fastapi import FastAPI, WebSocket, Depends, HTTPException, status, Response, UploadFile, File
+import asyncio, secrets
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from fastapi import BackgroundTasks, FastAPI, WebSocket, Depends, HTTPException, status, Response, UploadFile, File
 from fastapi.params import Cookie
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import OAuth2PasswordRequestForm, APIKeyCookie
 from sqlalchemy.orm import Session
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
-from . import xbeesrv, config, dbmodels, pydmodels, dbsrv
+from . import xbeesrv, config, dbmodels, pydmodels, dbsrv, tiles
+from .readingsrv import reading_scheduler
+from .session_cache import session_cache
+from .image_store import image_store
 from .database import SessionLocal, engine
 
 dbmodels.Base.metadata.create_all(bind=engine)
 
+def _migrate_database():
+    db = SessionLocal()
+    try:
+        dbsrv.migrate_floor_images(db)
+    finally:
+        db.close()
+
+_migrate_database()
+
 def get_db():
     """A dependency which yields a SQLAlchemy session.
     
@@ -33,6 +46,43 @@ app = FastAPI()
 
 app.mount("/static", StaticFiles(directory=config.STATIC_FILES_DIR, html=True), name="static")
 
+@app.on_event("startup")
+async def start_reading_scheduler():
+    """Starts the scheduler of the periodic readings."""
+
+    await reading_scheduler.start()
+
+@app.on_event("shutdown")
+async def stop_reading_scheduler():
+    """Stops the scheduler of the periodic readings."""
+
+    await reading_scheduler.stop()
+
+@app.on_event("shutdown")
+async def close_coordinator_connections():
+    """Closes the connections to the coordinator handler."""
+
+    await xbeesrv.close_connection_pool()
+    await xbeesrv.stop_notification_subscriber()
+
+@app.on_event("startup")
+async def generate_missing_tiles():
+    """Starts generating the tiles of the map images which don't have them yet, in the background."""
+
+    asyncio.get_running_loop().run_in_executor(None, tiles.generate_missing_tiles)
+
+@app.on_event("startup")
+async def start_session_cache():
+    """Starts writing the activity of the cached user sessions to the database."""
+
+    await session_cache.start()
+
+@app.on_event("shutdown")
+async def stop_session_cache():
+    """Writes the remaining activity of the cached user sessions to the database."""
+
+    await session_cache.stop()
+
 cookie_sid = APIKeyCookie(name="SID")
 """A dependency on cookie with the session id token."""
 
@@ -204,7 +254,9 @@ def get_floor_by_id(floor_id : int, db: Session = Depends(get_db)):
 def create_floor(floor: pydmodels.FloorCreate, db: Session = Depends(get_db)):
     """Endpoint which creates a new map."""
 
-    return dbsrv.create_floor(db, floor)
+    db_floor = dbsrv.create_floor(db, floor)
+    reading_scheduler.reload()
+    return db_floor
 
 @app.put("/floors/{floor_id}", response_model=pydmodels.Floor, dependencies=[Depends(is_valid_user)])
 def modify_floor(floor_id: int,floor: pydmodels.FloorCreate, db: Session = Depends(get_db)):
@@ -213,6 +265,7 @@ def modify_floor(floor_id: int,floor: pydmodels.FloorCreate, db: Session = Depen
     floor = dbsrv.modify_floor(db, floor_id, floor)
     if floor is None:
         raise HTTPException(status_code=404, detail="Floor not found")
+    reading_scheduler.reload()
     return floor
 
 @app.delete("/floors/{floor_id}", response_class=Response, status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(is_valid_user)])
@@ -222,23 +275,99 @@ def delete_floor(floor_id : int, db: Session = Depends(get_db)):
     existed_before = dbsrv.delete_floor(db, floor_id)
     if not existed_before:
         raise HTTPException(status_code=404, detail="Floor not found")
+    reading_scheduler.reload()
+
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+"""The `Cache-Control` header of the responses which never change."""
 
 @app.get("/floors/{floor_id}/image", response_class=Response, dependencies=[Depends(is_valid_user)])
-def get_floor_image_by_id(floor_id : int, db: Session = Depends(get_db)):
-    """Endpoint which returns a map image of the given id."""
+def get_floor_image_by_id(floor_id : int, request: Request, db: Session = Depends(get_db)):
+    """Endpoint which returns a map image of the given id.
+
+    The image of a map may change, so the clients have to revalidate it (with the ETag) before using a cached copy.
+    The immutable URL `/floor-images/{image_hash}` should be preferred.
+    """
 
-    db_floor = dbsrv.get_floor_by_id(db, floor_id)
+    db_floor = dbsrv.get_floor_image(db, floor_id)
     if db_floor is None:
         raise HTTPException(status_code=404, detail="Floor not found")
-    if db_floor.image is None:
+    if db_floor.image_hash is None or not image_store.exists(db_floor.image_hash):
         raise HTTPException(status_code=404, detail="Floor image not found")
-    return Response(content=db_floor.image, media_type=db_floor.image_media_type)
+    return file_response(request, image_store.path(db_floor.image_hash), f'"{db_floor.image_hash}"',
+        db_floor.image_media_type, "private, no-cache")
+
+@app.get("/floor-images/{image_hash}", response_class=Response, dependencies=[Depends(is_valid_user)])
+def get_floor_image_by_hash(image_hash : str, request: Request, db: Session = Depends(get_db)):
+    """Endpoint which returns a map image by the hash of its contents.
+
+    The contents under the URL never change, so the image may be cached by the clients forever.
+    """
+
+    media_type = dbsrv.get_image_media_type(db, image_hash) if image_store.is_valid_hash(image_hash) else None
+    if media_type is None or not image_store.exists(image_hash):
+        raise HTTPException(status_code=404, detail="Floor image not found")
+    return file_response(request, image_store.path(image_hash), f'"{image_hash}"', media_type, IMMUTABLE_CACHE_CONTROL)
+
+@app.get("/floors/{floor_id}/tiles/{zoom}/{x}/{y}", response_class=Response, dependencies=[Depends(is_valid_user)])
+def get_floor_tile(floor_id : int, zoom : int, x : int, y : int, request: Request, v: Optional[str] = None, db: Session = Depends(get_db)):
+    """Endpoint which returns a tile of a map image, see :mod:`~webserver.tiles`.
+
+    If the `v` query parameter is the hash of the current image of the map, the tile may be cached by the clients forever.
+    """
+
+    db_floor = dbsrv.get_floor_image(db, floor_id)
+    if db_floor is None:
+        raise HTTPException(status_code=404, detail="Floor not found")
+    if db_floor.image_hash is None or db_floor.tile_min_zoom is None:
+        raise HTTPException(status_code=404, detail="Floor tiles not found")
+    path = tiles.tile_path(image_store.tiles_directory(db_floor.image_hash), zoom, x, y)
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Tile not found")
+    cache_control = IMMUTABLE_CACHE_CONTROL if v == db_floor.image_hash else "private, no-cache"
+    return file_response(request, path, f'"{db_floor.image_hash}-{zoom}-{x}-{y}"', "image/png", cache_control)
+
+def file_response(request: Request, path: Path, etag: str, media_type: Optional[str], cache_control: str) -> Response:
+    """Makes a response with a file from the image store.
+
+    If the request has a matching `If-None-Match` header, the response is `304 Not Modified` without the body.
+    Otherwise the file is streamed.
+
+    Args:
+        request: the request for the file.
+        path: path of the file.
+        etag: the strong ETag of the file (with quotes).
+        media_type: media type of the file.
+        cache_control: value of the `Cache-Control` header.
+
+    Returns:
+        The response.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Checks if the `If-None-Match` header matches the ETag.
+
+    Args:
+        if_none_match: value of the header, or None if it's missing.
+        etag: the ETag (with quotes).
+
+    Returns:
+        True if the header contains the ETag (also as a weak ETag) or `*`.
+    """
+    if if_none_match is None:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
 
 @app.put("/floors/{floor_id}/image", response_class=Response, status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(is_valid_user)])
-async def modify_floor_image_by_id(floor_id : int, file: UploadFile = File(...), db: Session = Depends(get_db)):
-    """Endpoint which modifies a map image of the given id."""
+def modify_floor_image_by_id(floor_id : int, background_tasks: BackgroundTasks, file: UploadFile = File(...), db: Session = Depends(get_db)):
+    """Endpoint which modifies a map image of the given id. The tiles of the image are generated in the background."""
 
-    await dbsrv.set_floor_image(db, floor_id, file)
+    image_hash = dbsrv.set_floor_image(db, floor_id, file)
+    background_tasks.add_task(tiles.generate_floor_tiles, floor_id, image_hash)
     
 @app.get("/users", response_model=List[pydmodels.User], dependencies=[Depends(is_valid_admin)])
 def get_users(db: Session = Depends(get_db)):
@@ -332,10 +461,12 @@ def handle_xbee_error(request: Request, err: xbeesrv.XBeeServerError):
     )
 
 @app.get("/network-discovery", response_model=pydmodels.DiscoveryResult, dependencies=[Depends(is_valid_user)])
-async def discover_network():
-    """Endpoint which discovers the ZigBee network."""    
+async def discover_network(max_age: Optional[float] = None):
+    """Endpoint which discovers the ZigBee network.
+    
+    A cached result of a previous discovery may be returned if it's not older than `max_age` seconds."""    
 
-    return await xbeesrv.discover_network()
+    return await xbeesrv.discover_network(max_age)
 
 @app.post("/xbee-message", response_model=pydmodels.XBeeMessageResult, dependencies=[Depends(is_valid_user)])
 async def send_message(message : pydmodels.MessageToXBee):
@@ -347,7 +478,7 @@ async def send_message(message : pydmodels.MessageToXBee):
 async def wait(waiting : pydmodels.XBeeWaiting):
     """Endpoints which makes the coordinator handler wait for some time."""
 
-    return await xbeesrv.wait(waiting.time)
+    return await xbeesrv.wait(waiting.time, waiting.barrier)
 
 @app.post("/xbee-get-parameter", response_model=pydmodels.AtCommandResult, dependencies=[Depends(is_valid_user)])
 async def get_parameter(command_data : pydmodels.AtCommandGetExecute):
@@ -373,6 +504,28 @@ async def execute_command(command_data : pydmodels.AtCommandWithType):
 
     return await xbeesrv.at_command(command_data.command_type, command_data)
 
+@app.post("/xbee-batch", response_model=pydmodels.XBeeBatchResult, dependencies=[Depends(is_valid_user)])
+async def execute_batch(batch : pydmodels.XBeeBatch):
+    """Endpoint which executes several commands on the devices in ZigBee network in one request.
+
+    The commands are executed in order and the execution stops at the first failed command."""
+
+    return await xbeesrv.batch(batch)
+
+@app.post("/xbee-at-fan-out", response_model=pydmodels.AtFanOutResult, dependencies=[Depends(is_valid_user)])
+async def execute_at_fan_out(fan_out : pydmodels.AtFanOut):
+    """Endpoint which reads an AT parameter from many devices in ZigBee network at once.
+
+    The results received before the timeout are returned, the devices which didn't respond are listed as missing."""
+
+    return await xbeesrv.at_fan_out(fan_out)
+
+@app.get("/xbee-stats", response_model=Dict[str, Any], dependencies=[Depends(is_valid_admin)])
+async def get_xbee_stats():
+    """Endpoint which returns the statistics of the coordinator handler."""
+
+    return await xbeesrv.get_stats()
+
 @app.websocket("/message-socket")
 async def message_websocket(websocket : WebSocket, user_session : Optional[dbmodels.UserSession] = Depends(get_current_session_ws)):
     """WebSocket which allows clients receive messages received by the coordinator."""
@@ -1,7 +1,7 @@
 """Module with Pydantic models for the API requests and responses."""
 
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, root_validator
 
 class ReadingConfigBase(BaseModel):
     """Base class for ReadingConfig objects."""
@@ -121,6 +121,13 @@ class Floor(FloorBase):
     id: int
     """Node id."""
 
+    image_hash: Optional[str] = None
+    """Hash of the map image, which is available at `/floor-images/{image_hash}`. None if the map has no image."""
+
+    tile_min_zoom: Optional[int] = None
+    """The lowest zoom level of the tiles of the map image, available at `/floors/{id}/tiles/{zoom}/{x}/{y}`.
+    The highest level is 0 (the full resolution). None if the tiles haven't been generated yet."""
+
     class Config:
         orm_mode = True
 
@@ -215,6 +222,105 @@ class AtCommandResult(BaseModel):
     error: Optional[str]
     """Error message. Present if `status` is `error`."""
 
+class BatchStep(BaseModel):
+    """A command executed as a step of a batch."""
+
+    command_type: Literal["send", "get_parameter", "set_parameter", "execute_command"]
+    """Type of the command. Allowed values:
+    - `send` to send a message
+    - `get_parameter` to read a parameter value
+    - `set_parameter` to set a parameter value
+    - `execute_command` to execute a command unrelated to any parameter.
+    """
+
+    address64: str
+    """64-bit address of the device."""
+
+    message: Optional[str]
+    """Base64-encoded message to send. Required if `command_type` is `send`."""
+
+    at_command: Optional[str]
+    """AT command name (2 characters). Required for the AT commands."""
+
+    value: Optional[str]
+    """AT command value."""
+
+    apply_changes: bool = True
+    """If the changes made by the AT command should be applied."""
+
+    @root_validator(skip_on_failure=True)
+    def check_required_fields(cls, values):
+        """Checks that the fields required by the type of the command are present."""
+        if values.get("command_type") == "send":
+            if values.get("message") is None:
+                raise ValueError("message is required for the send command")
+        elif values.get("at_command") is None:
+            raise ValueError("at_command is required for the AT commands")
+        return values
+
+class XBeeBatch(BaseModel):
+    """Schema of a batch of commands executed in order. The execution stops at the first failed command."""
+
+    steps: List[BatchStep]
+    """The commands to execute."""
+
+class BatchStepResult(BaseModel):
+    """Result of one step of a batch."""
+
+    command_type: str
+    """Type of the command."""
+
+    status: str
+    """Describes if the command was successfully executed. Possible values: `error` and `ok`."""
+
+    result: Optional[str]
+    """Result of the command. Present if the command was of type get_parameter and `status` is `ok`."""
+
+    error: Optional[str]
+    """Error message. Present if `status` is `error`."""
+
+class XBeeBatchResult(BaseModel):
+    """Result of a batch of commands."""
+
+    status: str
+    """`ok` if all steps were executed successfully, otherwise `error`."""
+
+    results: List[BatchStepResult] = []
+    """Results of the executed steps, in the order of the steps. The steps after the failed one are not executed."""
+
+    error: Optional[str]
+    """Error message. Present if `status` is `error`."""
+
+class AtFanOut(BaseModel):
+    """Schema of a request which reads an AT parameter from many devices at once."""
+
+    at_command: str
+    """AT command name (2 characters)."""
+
+    value: Optional[str]
+    """AT command value."""
+
+    addresses: Optional[List[str]]
+    """64-bit addresses of the devices. If not set, all discovered devices are queried."""
+
+    timeout: Optional[float]
+    """Time (in seconds) for which the responses are collected. If not set, the default of the coordinator handler is used."""
+
+class AtFanOutResult(BaseModel):
+    """Result of a request which reads an AT parameter from many devices at once."""
+
+    status: str
+    """Describes if the request was successfully executed. Possible values: `error` and `ok`."""
+
+    results: Dict[str, AtCommandResult] = {}
+    """Results of the AT command, with the 64-bit addresses of the devices which responded as keys."""
+
+    missing: List[str] = []
+    """64-bit addresses of the devices which didn't respond in time."""
+
+    error: Optional[str]
+    """Error message. Present if `status` is `error`."""
+
 class MessageToXBee(BaseModel):
     """Schema for sending messages to an XBee device."""
 
@@ -230,6 +336,9 @@ class XBeeWaiting(BaseModel):
     time : float
     """The time to wait."""
 
+    barrier : bool = False
+    """If True, the coordinator handler doesn't execute any other command while waiting."""
+
 class XBeeWaitingResult(BaseModel):
     """Schema of the result the waiting request."""
 
@@ -263,6 +372,9 @@ class DiscoveryResult(BaseModel):
     devices : List[DeviceInDiscoveryResult]
     """List of discovered devices."""
 
+    age : Optional[float]
+    """Time (in seconds) elapsed since the discovery was finished."""
+
 class XBeeMessageResult(BaseModel):
     """Result of a request to send a message to an XBee device."""
 
@@ -0,0 +1,187 @@
+"""Server-side scheduler of the periodic readings.
+
+The readings with mode `send` or `at` are obtained by the webserver once per their `refresh_period`,
+regardless of the number of clients viewing them. The results are pushed to all connected websockets.
+"""
+
+import asyncio, logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from . import dbmodels, pydmodels, xbeesrv
+from .database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class PolledReading:
+    """A reading which has to be obtained periodically by the scheduler. It's a snapshot of a :class:`~webserver.dbmodels.ReadingConfig`."""
+
+    id: int
+    """Id of the reading config."""
+
+    address64: str
+    """64-bit address of the node which provides the reading."""
+
+    mode: str
+    """The mode of obtaining the reading (`send` or `at`)."""
+
+    refresh_period: float
+    """The period in which the reading is refreshed."""
+
+    message_to_send: Optional[str]
+    """Base64-encoded message which is sent to the node in `send` mode."""
+
+    at_command: Optional[str]
+    """The AT command used in `at` mode."""
+
+    at_command_data: Optional[str]
+    """Base64-encoded data of the AT command used in `at` mode."""
+
+def load_polled_readings() -> List[PolledReading]:
+    """Loads all readings which have to be obtained periodically from the database.
+
+    The readings which can't be obtained (without the message to send or the AT command) are skipped.
+
+    Returns:
+        The readings with mode `send` or `at` and a positive refresh period.
+    """
+    db = SessionLocal()
+    try:
+        rows = (db.query(dbmodels.ReadingConfig, dbmodels.Node.address64)
+            .join(dbmodels.Node, dbmodels.ReadingConfig.node_id == dbmodels.Node.id)
+            .filter(dbmodels.ReadingConfig.mode.in_(["send", "at"]))
+            .filter(dbmodels.ReadingConfig.refresh_period > 0)
+            .all())
+    finally:
+        db.close()
+    readings = []
+    for rc, address64 in rows:
+        reading = _make_polled_reading(rc, address64)
+        if _is_pollable(reading):
+            readings.append(reading)
+        else:
+            logger.warning(f"Reading {reading.id} in mode {reading.mode} is incomplete, so it isn't polled.")
+    return readings
+
+def _is_pollable(reading : PolledReading) -> bool:
+    if not reading.address64:
+        return False
+    if reading.mode == "send":
+        return bool(reading.message_to_send)
+    return bool(reading.at_command)
+
+def _make_polled_reading(rc: dbmodels.ReadingConfig, address64: str) -> PolledReading:
+    return PolledReading(
+        id=rc.id,
+        address64=address64,
+        mode=rc.mode,
+        refresh_period=rc.refresh_period,
+        message_to_send=rc.message_to_send,
+        at_command=rc.at_command,
+        at_command_data=rc.at_command_data
+    )
+
+class ReadingScheduler:
+    """Scheduler which obtains each reading once per its refresh period.
+
+    Each reading is polled by its own asyncio task. When the maps are modified, :meth:`reload` should be called.
+    The tasks of the readings which haven't changed are kept, so their timing is not disturbed.
+
+    The results of readings in `send` mode arrive as notifications of the coordinator handler, so they are delivered
+    to the websockets like any other received message. The results of readings in `at` mode are sent
+    to all websockets as messages of type `reading`.
+    """
+
+    def __init__(self) -> None:
+        """Creates the scheduler. The scheduler does nothing until :meth:`start` is called."""
+        self._loop : Optional[asyncio.AbstractEventLoop] = None
+        self._reload_event : Optional[asyncio.Event] = None
+        self._main_task : Optional[asyncio.Task] = None
+        self._readings : Dict[int, PolledReading] = {}
+        self._tasks : Dict[int, asyncio.Task] = {}
+        self.logger = logging.getLogger(__name__)
+
+    async def start(self) -> None:
+        """Starts the scheduler. Must be called from the event loop of the webserver."""
+        self._loop = asyncio.get_running_loop()
+        self._reload_event = asyncio.Event()
+        self._main_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the scheduler and all polling tasks."""
+        if self._main_task is not None:
+            self._main_task.cancel()
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        self._readings.clear()
+
+    def reload(self) -> None:
+        """Makes the scheduler reload the readings from the database.
+
+        The method is thread-safe, so it may be called from the synchronous endpoints.
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._reload_event.set)
+
+    async def _run(self):
+        while True:
+            self._reload_event.clear()
+            try:
+                readings = await self._loop.run_in_executor(None, load_polled_readings)
+                self._replace_tasks(readings)
+            except Exception as err:
+                self.logger.error(f"Could not load the readings from the database: {err}")
+            await self._reload_event.wait()
+
+    def _replace_tasks(self, readings : List[PolledReading]):
+        new_readings = {r.id: r for r in readings}
+        for rc_id in list(self._tasks):
+            if new_readings.get(rc_id) != self._readings[rc_id]:
+                self._tasks.pop(rc_id).cancel()
+                del self._readings[rc_id]
+        for rc_id, reading in new_readings.items():
+            if rc_id not in self._tasks:
+                self._readings[rc_id] = reading
+                self._tasks[rc_id] = asyncio.create_task(self._poll_loop(reading))
+        self.logger.info(f"Scheduled {len(self._tasks)} readings.")
+
+    async def _poll_loop(self, reading : PolledReading):
+        while True:
+            started = self._loop.time()
+            await self._poll(reading)
+            elapsed = self._loop.time() - started
+            await asyncio.sleep(max(0, reading.refresh_period - elapsed))
+
+    async def _poll(self, reading : PolledReading):
+        try:
+            if reading.mode == "send":
+                await self._poll_send(reading)
+            else:
+                await self._poll_at(reading)
+        except xbeesrv.XBeeServerError as err:
+            self.logger.error(f"Error while polling reading {reading.id}: {err}")
+        except Exception as err:
+            # The task of the reading must keep running, it's recreated only when the reading is modified.
+            self.logger.error(f"Unexpected error while polling reading {reading.id}: {err!r}")
+
+    async def _poll_send(self, reading : PolledReading):
+        result = await xbeesrv.send_b64_data(address64=reading.address64, message=reading.message_to_send, priority="polling")
+        if result.status != "ok":
+            self.logger.error(f"Error while polling reading {reading.id}: {result.message}")
+
+    async def _poll_at(self, reading : PolledReading):
+        command = pydmodels.AtCommandGetExecute(address64=reading.address64, at_command=reading.at_command, value=reading.at_command_data)
+        result = await xbeesrv.at_command("get_parameter", command, priority="polling")
+        message = {
+            'type':'reading',
+            'reading_config_id':reading.id,
+            'address64':reading.address64,
+            'status':result.status,
+            'result':result.result,
+            'error':result.error
+        }
+        xbeesrv.broadcast_to_websockets(message)
+
+reading_scheduler = ReadingScheduler()
+"""The scheduler used by the webserver."""
@@ -0,0 +1,165 @@
+"""Process-local cache of the user sessions.
+
+Validating a session on every request would otherwise read the session from the database and write its `time_last_activity`,
+so every request (even a GET) would be a write transaction. The cache keeps the validated sessions in memory
+together with the time of the last activity. The times are written to the database in batches
+by :meth:`SessionCache.flush`, which is called periodically and before the database is queried for the times.
+
+The functions of :mod:`~webserver.dbsrv` which end the sessions or modify the users invalidate the cached sessions immediately.
+The cache is local to the process, so the webserver should be run as a single process (which is the default).
+"""
+
+import asyncio, logging, threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from sqlalchemy import bindparam
+from sqlalchemy.orm import Session
+from . import config, dbmodels
+from .database import SessionLocal
+
+@dataclass
+class CachedSession:
+    """A validated user session kept in the cache."""
+
+    user_session: dbmodels.UserSession
+    """The session detached from the database session, with its user loaded."""
+
+    time_last_activity: datetime
+    """Time of the last activity of the user in the session."""
+
+    dirty: bool = False
+    """True if `time_last_activity` hasn't been written to the database yet."""
+
+class SessionCache:
+    """A thread-safe cache of the user sessions keyed by their session ids.
+
+    A session expires from the cache after `SESSION_IDLE_TIME` seconds without activity, like in the database.
+
+    Attributes:
+        idle_time (timedelta): time without activity after which a session expires.
+        flush_interval (float): time (in seconds) between writing the times of the last activity to the database.
+    """
+
+    def __init__(self, idle_time : float, flush_interval : float) -> None:
+        """Creates an empty cache.
+
+        Args:
+            idle_time: time (in seconds) without activity after which a session expires.
+            flush_interval: time (in seconds) between writing the times of the last activity to the database.
+        """
+        self.idle_time = timedelta(seconds=idle_time)
+        self.flush_interval = flush_interval
+        self._sessions : Dict[str, CachedSession] = {}
+        self._lock = threading.Lock()
+        self._flush_task : Optional[asyncio.Task] = None
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, session_id : str, time_now : datetime) -> Optional[dbmodels.UserSession]:
+        """Gets a session which isn't expired and records the activity in it.
+
+        Args:
+            session_id: session id (token).
+            time_now: the current time, which becomes the time of the last activity.
+
+        Returns:
+            The detached session, or None if it's not in the cache or is expired.
+        """
+        with self._lock:
+            cached = self._sessions.get(session_id)
+            if cached is None:
+                return None
+            if time_now - cached.time_last_activity > self.idle_time:
+                del self._sessions[session_id]
+                return None
+            cached.time_last_activity = time_now
+            cached.dirty = True
+            return cached.user_session
+
+    def put(self, user_session : dbmodels.UserSession, time_now : datetime) -> None:
+        """Adds a session to the cache and records the activity in it.
+
+        Args:
+            user_session: the session detached from the database session, with its user loaded.
+            time_now: the current time, which becomes the time of the last activity.
+        """
+        with self._lock:
+            self._sessions[user_session.session_id] = CachedSession(user_session, time_now, dirty=True)
+
+    def invalidate(self, session_id : str) -> None:
+        """Removes a session from the cache.
+
+        Args:
+            session_id: session id (token).
+        """
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def invalidate_user(self, user_id : int) -> None:
+        """Removes all sessions of a user from the cache.
+
+        Args:
+            user_id: id of the user.
+        """
+        with self._lock:
+            for session_id in [session_id for session_id, cached in self._sessions.items() if cached.user_session.user_id == user_id]:
+                del self._sessions[session_id]
+
+    def clear(self) -> None:
+        """Removes all sessions from the cache."""
+        with self._lock:
+            self._sessions.clear()
+
+    def flush(self, db : Session) -> None:
+        """Writes the times of the last activity which haven't been written yet to the database in one transaction.
+
+        Args:
+            db: a database session.
+        """
+        with self._lock:
+            dirty = [cached for cached in self._sessions.values() if cached.dirty]
+            activity = [{"session_db_id": cached.user_session.id, "activity": cached.time_last_activity} for cached in dirty]
+            for cached in dirty:
+                cached.dirty = False
+        if not activity:
+            return
+        table = dbmodels.UserSession.__table__
+        statement = table.update().where(table.c.id == bindparam("session_db_id")).values(time_last_activity=bindparam("activity"))
+        try:
+            db.execute(statement, activity)
+            db.commit()
+        except Exception:
+            db.rollback()
+            with self._lock:
+                for cached in dirty:
+                    cached.dirty = True
+            raise
+
+    async def start(self) -> None:
+        """Starts writing the times of the last activity to the database periodically."""
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stops the periodic writes and writes the remaining times of the last activity."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._flush()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                self._flush()
+            except Exception as err:
+                self.logger.error(f"Could not write the activity of the sessions to the database: {err}")
+
+    def _flush(self):
+        db = SessionLocal()
+        try:
+            self.flush(db)
+        finally:
+            db.close()
+
+session_cache = SessionCache(config.SESSION_IDLE_TIME, config.SESSION_ACTIVITY_FLUSH_INTERVAL)
+"""The session cache used by the webserver."""
@@ -0,0 +1,167 @@
+"""Generation of the tile pyramids of the map images.
+
+A large map image is cut into square tiles of :data:`TILE_SIZE` pixels at several zoom levels, so the map display
+downloads only the tiles which are visible at the current zoom, instead of the whole image.
+
+The tiles follow the grid of the Leaflet `CRS.Simple` coordinate system used by the map display, in which one map unit
+is one pixel of the image at zoom 0 and the image spans from (0, 0) to (height, width). Zoom 0 is the full resolution,
+each lower zoom level halves the image, down to the level at which the whole image fits into one tile.
+Because the y axis of the map points up, the rows of the tiles have negative numbers, from -1 at the bottom of the image.
+
+The tiles are stored in the :data:`~webserver.image_store.image_store` next to the image, in `{zoom}/{x}_{y}.png` files.
+The levels of the pyramid are kept in the mode of the image when possible, so an RGB or grayscale image doesn't take
+the memory of an RGBA one. Only the tiles at the right and bottom edges, which are padded with transparent pixels,
+are converted to RGBA.
+
+The images with more than `MAP_IMAGE_MAX_PIXELS` pixels are rejected before they are decoded.
+"""
+
+import logging, math, os, shutil, tempfile
+from pathlib import Path
+from typing import Optional
+from PIL import Image
+from . import config, dbmodels
+from .database import SessionLocal
+from .image_store import image_store
+
+TILE_SIZE = 256
+"""Size (in pixels) of the square tiles. The map display (`MapDisplay.vue`) uses the same size."""
+
+logger = logging.getLogger(__name__)
+
+Image.MAX_IMAGE_PIXELS = config.MAP_IMAGE_MAX_PIXELS
+
+# Modes which are reduced and saved into PNG without conversion.
+_LEVEL_MODES = ("L", "LA", "RGB", "RGBA")
+
+def min_zoom_for_size(width : int, height : int, tile_size : int) -> int:
+    """Returns the lowest zoom level of the pyramid of an image, at which the whole image fits into one tile.
+
+    Args:
+        width: width of the image at full resolution.
+        height: height of the image at full resolution.
+        tile_size: size of a tile in pixels.
+    """
+    largest = max(width, height, 1)
+    return -max(0, math.ceil(math.log2(largest / tile_size)))
+
+def tile_path(directory : Path, zoom : int, x : int, y : int) -> Path:
+    """Returns the path of a tile in the directory of a pyramid.
+
+    Args:
+        directory: the directory of the pyramid.
+        zoom: zoom level of the tile.
+        x: column of the tile.
+        y: row of the tile.
+    """
+    return directory / str(zoom) / f"{x}_{y}.png"
+
+def generate_tiles(image_path : Path, directory : Path, tile_size : int) -> int:
+    """Generates the tile pyramid of an image.
+
+    The tiles are written into a temporary directory, which is renamed to `directory` when all tiles are ready,
+    so an incomplete pyramid is never visible. If `directory` already exists, nothing is generated.
+
+    Args:
+        image_path: path of the image.
+        directory: the directory of the pyramid.
+        tile_size: size of a tile in pixels.
+
+    Returns:
+        The lowest zoom level of the pyramid.
+
+    Raises:
+        ValueError: when the image has more than `MAP_IMAGE_MAX_PIXELS` pixels.
+    """
+    with Image.open(image_path) as image:
+        if image.width * image.height > config.MAP_IMAGE_MAX_PIXELS:
+            raise ValueError(f"The image has {image.width}x{image.height} pixels, more than {config.MAP_IMAGE_MAX_PIXELS}.")
+        min_zoom = min_zoom_for_size(image.width, image.height, tile_size)
+        if directory.is_dir():
+            return min_zoom
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        temp_directory = Path(tempfile.mkdtemp(dir=directory.parent))
+        try:
+            level = _level_image(image)
+            for zoom in range(0, min_zoom - 1, -1):
+                if zoom < 0:
+                    level = level.reduce(2)
+                _save_level(level, temp_directory / str(zoom), tile_size)
+            try:
+                os.replace(temp_directory, directory)
+            except OSError:
+                # The same pyramid may have been generated by another task in the meantime.
+                if not directory.is_dir():
+                    raise
+                shutil.rmtree(temp_directory, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(temp_directory, ignore_errors=True)
+            raise
+    return min_zoom
+
+def _level_image(image : Image.Image) -> Image.Image:
+    # Returns the full resolution level, converted only if its mode can't be reduced or saved into PNG.
+    if image.mode in _LEVEL_MODES:
+        image.load()
+        return image
+    has_alpha = "A" in image.getbands() or "transparency" in image.info
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+def _save_level(level : Image.Image, directory : Path, tile_size : int):
+    directory.mkdir()
+    columns = math.ceil(level.width / tile_size)
+    rows = math.ceil(level.height / tile_size)
+    for x in range(columns):
+        for y in range(-rows, 0):
+            # The bottom edge of the image is at y = 0, so the image is shifted by its height.
+            top = y * tile_size + level.height
+            box = (x * tile_size, top, (x + 1) * tile_size, top + tile_size)
+            if box[0] >= 0 and box[1] >= 0 and box[2] <= level.width and box[3] <= level.height:
+                tile = level.crop(box)
+            else:
+                # The tile reaches beyond the image, the rest of it is transparent.
+                tile = Image.new("RGBA", (tile_size, tile_size))
+                part = level.crop((max(box[0], 0), max(box[1], 0), min(box[2], level.width), min(box[3], level.height)))
+                tile.paste(part.convert("RGBA"), (max(box[0], 0) - box[0], max(box[1], 0) - box[1]))
+            tile.save(directory / f"{x}_{y}.png")
+
+def generate_floor_tiles(floor_id : int, image_hash : str) -> Optional[int]:
+    """Generates the tile pyramid of the image of a map and records its lowest zoom level in the database.
+
+    It's intended to run in the background after the image is uploaded. If the image of the map is changed
+    in the meantime, the database isn't modified.
+
+    Args:
+        floor_id: id of the map.
+        image_hash: hash of the image in the :data:`~webserver.image_store.image_store`.
+
+    Returns:
+        The lowest zoom level of the pyramid, or None if the tiles couldn't be generated.
+    """
+    try:
+        min_zoom = generate_tiles(image_store.path(image_hash), image_store.tiles_directory(image_hash), TILE_SIZE)
+    except Exception as err:
+        logger.error(f"Could not generate the tiles of the image of map {floor_id}: {err}")
+        return None
+    db = SessionLocal()
+    try:
+        db_floor = db.query(dbmodels.Floor).get(floor_id)
+        if db_floor is not None and db_floor.image_hash == image_hash:
+            db_floor.tile_min_zoom = min_zoom
+            db.commit()
+    finally:
+        db.close()
+    return min_zoom
+
+def generate_missing_tiles() -> None:
+    """Generates the tile pyramids of the map images which don't have them yet (e.g. uploaded by the previous versions)."""
+    db = SessionLocal()
+    try:
+        floors = (db.query(dbmodels.Floor.id, dbmodels.Floor.image_hash)
+            .filter(dbmodels.Floor.image_hash.isnot(None))
+            .filter(dbmodels.Floor.tile_min_zoom.is_(None))
+            .all())
+    finally:
+        db.close()
+    for floor in floors:
+        generate_floor_tiles(floor.id, floor.image_hash)
@@ -0,0 +1,92 @@
+"""Module defining the :class:`~webserver.websocket_outbox.WebsocketOutbox` class."""
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Hashable, List, Optional
+
+class WebsocketOutbox:
+    """A bounded buffer of the serialized messages waiting to be sent to one websocket.
+
+    A message may have a coalescing key (e.g. the id of a periodic reading). When a message with the same key
+    is still waiting in the buffer, it is replaced by the new one, so a lagging client gets only the latest value
+    instead of all the values which arrived in the meantime. The replaced message keeps its position in the buffer.
+
+    When the buffer is full, `overflow_policy` decides what happens: `drop_oldest` drops the oldest message,
+    `disconnect` rejects the message, so the websocket should be closed.
+
+    Attributes:
+        limit (int): maximum number of the messages waiting in the buffer.
+        overflow_policy (str): what happens when the buffer is full (`drop_oldest` or `disconnect`).
+        dropped (int): number of the messages dropped because the buffer was full.
+        coalesced (int): number of the messages replaced by newer messages with the same key.
+    """
+
+    def __init__(self, limit : int, overflow_policy : str = "drop_oldest") -> None:
+        """Creates an empty buffer.
+
+        Args:
+            limit: maximum number of the messages waiting in the buffer.
+            overflow_policy: what happens when the buffer is full (`drop_oldest` or `disconnect`).
+        """
+        self.limit = max(1, limit)
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+        self.coalesced = 0
+        self._entries : Deque[list] = deque()
+        self._by_key : Dict[Hashable, list] = {}
+        self._ready = asyncio.Event()
+
+    def put(self, text : str, key : Optional[Hashable] = None) -> bool:
+        """Adds a message to the buffer.
+
+        Args:
+            text: the serialized message.
+            key: the coalescing key of the message. None means that the message is never replaced.
+
+        Returns:
+            False if the buffer is full and the overflow policy is `disconnect`, otherwise True.
+        """
+        if key is not None and key in self._by_key:
+            self._by_key[key][1] = text
+            self.coalesced += 1
+            return True
+        if len(self._entries) >= self.limit:
+            if self.overflow_policy == "disconnect":
+                return False
+            self._forget(self._entries.popleft())
+            self.dropped += 1
+        entry = [key, text]
+        self._entries.append(entry)
+        if key is not None:
+            self._by_key[key] = entry
+        self._ready.set()
+        return True
+
+    def take(self, max_count : int) -> List[str]:
+        """Removes the oldest messages from the buffer.
+
+        Args:
+            max_count: maximum number of the removed messages.
+
+        Returns:
+            The removed messages, from the oldest.
+        """
+        result = []
+        while self._entries and len(result) < max_count:
+            entry = self._entries.popleft()
+            self._forget(entry)
+            result.append(entry[1])
+        if not self._entries:
+            self._ready.clear()
+        return result
+
+    async def wait(self) -> None:
+        """Waits until the buffer is not empty."""
+        await self._ready.wait()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _forget(self, entry : list):
+        if entry[0] is not None and self._by_key.get(entry[0]) is entry:
+            del self._by_key[entry[0]]
@@ -1,13 +1,14 @@
 """Functions for communication with the coordinator handler."""
 
-import asyncio, json
+import asyncio, itertools, json, logging, time
 from asyncio.streams import StreamReader, StreamWriter
 from functools import wraps
-from typing import Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from fastapi.exceptions import HTTPException
 from starlette.websockets import WebSocket, WebSocketDisconnect
 from . import config, pydmodels
+from .websocket_outbox import WebsocketOutbox
 
 class XBeeServerError(Exception):
     """An error raised by the functions in the module whenever the communication with the coordinator handler fails."""
@@ -30,8 +31,12 @@ def unify_exceptions(func):
     return wrapper
 
 @unify_exceptions
-async def discover_network() -> pydmodels.DiscoveryResult:
+async def discover_network(max_age : Optional[float] = None) -> pydmodels.DiscoveryResult:
     """Makes a discovery request to the coordinator handler.
+
+    Args:
+        max_age: maximum age (in seconds) of a cached discovery result which may be returned.
+            If None, the default of the coordinator handler is used.
     
     Returns:
         ZigBee network discovery results received from the coordinator handler.
@@ -40,16 +45,20 @@ async def discover_network() -> pydmodels.DiscoveryResult:
         XBeeServerError: when an error occurs while communicating with the coordinator handler.
     """
     request = {"type":"request", "name":"discover"}
+    if max_age is not None:
+        request["data"] = {"max_age":max_age}
     response = await request_response(request)
     return pydmodels.DiscoveryResult.parse_obj(response["data"])
 
 @unify_exceptions
-async def send_b64_data(address64 : str, message : str) -> pydmodels.XBeeMessageResult:
+async def send_b64_data(address64 : str, message : str, priority : Optional[str] = None) -> pydmodels.XBeeMessageResult:
     """Makes a request to the coordinator handler to send a message to the given node in the ZigBee network.
 
     Args:
         address64: 64-bit addres of the node as hexadecimal string.
         message: base64-encoded message to send.
+        priority: priority class of the request (`interactive`, `polling` or `background`).
+            If None, the default of the coordinator handler is used.
     
     Returns:
         An object describing if the message was successfuly sent.
@@ -58,13 +67,15 @@ async def send_b64_data(address64 : str, message : str) -> pydmodels.XBeeMessage
         XBeeServerError: when an error occurs while communicating with the coordinator handler.
     """
     request = {"type":"request", "name":"send", "data":{"address64":address64, "message":message}}
+    _set_priority(request, priority)
     response = await request_response(request)
     return pydmodels.XBeeMessageResult(status=response["status"], message=response.get("message"))
 
 @unify_exceptions
 async def at_command(
         command_type: str, 
-        command: Union[pydmodels.AtCommandGetExecute, pydmodels.AtCommandSet]
+        command: Union[pydmodels.AtCommandGetExecute, pydmodels.AtCommandSet],
+        priority: Optional[str] = None
     ) -> pydmodels.AtCommandResult:
     """Makes a request to the coordinator handler to send an AT command to a device.
     
@@ -74,6 +85,8 @@ async def at_command(
             - `set_parameter` to set a parameter value
             - `execute_command` to execute a command unrelated to any parameter.
         command: object describing a the command to send.
+        priority: priority class of the request (`interactive`, `polling` or `background`).
+            If None, the default of the coordinator handler is used.
 
     Returns:
         An object describing if the AT command was successfuly sent.
@@ -91,15 +104,86 @@ async def at_command(
         "value": command.value,
         "apply_changes": command.apply_changes
     }}
+    _set_priority(request, priority)
     response = await request_response(request)
     return _make_at_command_response(response)
 
 @unify_exceptions
-async def wait(time : float) -> pydmodels.XBeeWaitingResult:
+async def batch(batch : pydmodels.XBeeBatch) -> pydmodels.XBeeBatchResult:
+    """Makes a request to the coordinator handler to execute several commands in one request.
+
+    The commands are executed in order and the execution stops at the first failed command.
+
+    Args:
+        batch: the commands to execute.
+
+    Returns:
+        An object with the results of the executed commands.
+
+    Raises:
+        XBeeServerError: when an error occurs while communicating with the coordinator handler.
+    """
+    request = {"type":"request", "name":"batch", "data":{"commands":[_make_batch_step(step) for step in batch.steps]}}
+    response = await request_response(request)
+    results = [_make_batch_step_result(result) for result in (response.get("data") or {}).get("results", [])]
+    return pydmodels.XBeeBatchResult(status=response["status"], results=results, error=response.get("message"))
+
+def _make_batch_step(step : pydmodels.BatchStep) -> dict:
+    # The command type and the required fields are validated by the model.
+    if step.command_type == "send":
+        return {"name":"send", "data":{"address64":step.address64, "message":step.message}}
+    return {"name":step.command_type, "data":{
+        "address64":step.address64,
+        "at_command": step.at_command,
+        "value": step.value,
+        "apply_changes": step.apply_changes
+    }}
+
+def _make_batch_step_result(result : dict) -> pydmodels.BatchStepResult:
+    if result["status"] == "ok":
+        return pydmodels.BatchStepResult(command_type=result["name"], status="ok", result=(result.get("data") or {}).get("result"))
+    else:
+        return pydmodels.BatchStepResult(command_type=result["name"], status="error", error=result.get("message"))
+
+@unify_exceptions
+async def at_fan_out(fan_out : pydmodels.AtFanOut) -> pydmodels.AtFanOutResult:
+    """Makes a request to the coordinator handler to read an AT parameter from many devices at once.
+
+    Args:
+        fan_out: the AT command and the devices to query.
+
+    Returns:
+        An object with the results received from the devices in time and the list of devices which didn't respond.
+
+    Raises:
+        XBeeServerError: when an error occurs while communicating with the coordinator handler.
+    """
+    data = {"at_command":fan_out.at_command, "value":fan_out.value}
+    if fan_out.addresses is not None:
+        data["addresses"] = fan_out.addresses
+    if fan_out.timeout is not None:
+        data["timeout"] = fan_out.timeout
+    request = {"type":"request", "name":"fan_out", "data":data}
+    response = await request_response(request)
+    if response["status"] != "ok":
+        return pydmodels.AtFanOutResult(status="error", error=response.get("message"))
+    results = {address: _make_fan_out_result(result) for address, result in response["data"]["results"].items()}
+    return pydmodels.AtFanOutResult(status="ok", results=results, missing=response["data"]["missing"])
+
+def _make_fan_out_result(result : dict) -> pydmodels.AtCommandResult:
+    if result["status"] == "ok":
+        return pydmodels.AtCommandResult(status="ok", result=result["result"])
+    else:
+        return pydmodels.AtCommandResult(status="error", error=result.get("message"))
+
+@unify_exceptions
+async def wait(time : float, barrier : bool = False) -> pydmodels.XBeeWaitingResult:
     """Makes a request to the coordinator handler to wait for some time. Used for testing purposes.
     
     Args:
         time: time the coordinator should wait. If the time is too long, a timeout may occur.
+        barrier: if True, the coordinator handler doesn't execute any other command while waiting.
+            Otherwise, only the response is delayed.
 
     Returns:
         An object describing if the request has been successfully executed.
@@ -107,10 +191,28 @@ async def wait(time : float) -> pydmodels.XBeeWaitingResult:
     Raises:
         XBeeServerError: when an error occurs while communicating with the coordinator handler.
     """
-    request = {"type":"request", "name":"wait", "data":{"time":time}}
+    request = {"type":"request", "name":"wait", "data":{"time":time, "barrier":barrier}}
     response = await request_response(request)
     return pydmodels.XBeeWaitingResult(time=time, status=response["status"], message=response.get("message"))
 
+@unify_exceptions
+async def get_stats() -> dict:
+    """Gets the counters describing the work of the coordinator handler.
+
+    Returns:
+        The counters and other statistics of the coordinator handler.
+
+    Raises:
+        XBeeServerError: when an error occurs while communicating with the coordinator handler.
+    """
+    request = {"type":"request", "name":"stats"}
+    response = await request_response(request)
+    return response["data"]
+
+def _set_priority(request : dict, priority : Optional[str]) -> None:
+    if priority is not None:
+        request["priority"] = priority
+
 async def request_response(request : dict) -> dict:
     """Makes a request to the coordinator handler and waits for the response.
 
@@ -125,20 +227,232 @@ async def request_response(request : dict) -> dict:
         asyncio.TimeoutError: when the time `DEVICE_TIMEOUT` was exceeded.
     
     """
+    request = {**request, "deadline": time.time() + config.DEVICE_TIMEOUT}
     return await asyncio.wait_for(_request_response_no_timeout(request), timeout=config.DEVICE_TIMEOUT)
 
 async def _request_response_no_timeout(request : dict) -> dict:
-    reader, writer = await asyncio.open_connection(
-        config.XBEE_IP_ADDRESS, config.XBEE_PORT_REQUEST)
-    request_json = _encode_command(request)
-    writer.write(request_json)
-    await writer.drain()
-    response_json = await reader.readline()
-    response_dict = _decode_command(response_json)
-    writer.close()
-    await writer.wait_closed()
-    return response_dict
-    
+    return await _get_connection_pool().request(request)
+
+class CoordinatorConnection:
+    """A long-lived connection to the request-response server of the coordinator handler.
+
+    Many requests may be in progress on the connection at once. Each request gets an `id`,
+    which the coordinator handler copies into the response, so the responses may arrive in any order.
+    When the connection breaks, all requests in progress fail with :class:`~webserver.xbeesrv.XBeeServerError`.
+    """
+
+    def __init__(self) -> None:
+        """Creates the connection object. The connection is opened by :meth:`open`."""
+        self._reader : Optional[StreamReader] = None
+        self._writer : Optional[StreamWriter] = None
+        self._pending : Dict[int, asyncio.Future] = {}
+        self._next_id = itertools.count(1)
+        self._reader_task : Optional[asyncio.Task] = None
+
+    @property
+    def is_open(self) -> bool:
+        """True if the connection is open and may be used for new requests."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    @property
+    def pending_count(self) -> int:
+        """The number of requests waiting for the response."""
+        return len(self._pending)
+
+    async def open(self) -> None:
+        """Opens the connection to the coordinator handler."""
+        self._reader, self._writer = await _open_coordinator_connection(config.XBEE_PORT_REQUEST, config.XBEE_UNIX_SOCKET_REQUEST)
+        self._reader_task = asyncio.create_task(self._read_responses())
+
+    async def request(self, request : dict) -> dict:
+        """Sends a request and waits for its response.
+
+        Args:
+            request: the object which will be sent to the coordinator handler. The `id` field is added automatically.
+
+        Returns:
+            The response of the coordinator handler.
+
+        Raises:
+            XBeeServerError: when the connection is closed or breaks before the response arrives.
+        """
+        if not self.is_open:
+            raise XBeeServerError("The connection to the coordinator handler is closed.")
+        request_id = next(self._next_id)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._writer.write(_encode_command({**request, "id": request_id}))
+            await self._writer.drain()
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def close(self) -> None:
+        """Closes the connection. The requests in progress fail."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+
+    async def _read_responses(self):
+        try:
+            while True:
+                response = await _read_message(self._reader)
+                future = self._pending.get(response.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as err:
+            error = err if isinstance(err, XBeeServerError) else XBeeServerError(err)
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+        finally:
+            self._writer.close()
+
+class CoordinatorConnectionPool:
+    """A pool of long-lived connections to the request-response server of the coordinator handler.
+
+    The connections are opened when they are needed, up to `size` connections. A request is sent over the open
+    connection with the fewest requests in progress. A new connection is opened only when all open connections are busy.
+
+    The pool periodically checks the connections by sending the `ping` request. A connection which doesn't answer
+    within `health_check_timeout` is closed, so it is replaced by a new one.
+
+    When the connection to the coordinator handler can't be opened, the next attempt is made after a delay,
+    which doubles after each failed attempt (from `backoff_min` up to `backoff_max`). Until then, the requests
+    which need a new connection fail immediately, so an unavailable coordinator handler isn't flooded with connection attempts.
+
+    Attributes:
+        size (int): maximum number of the connections.
+        health_check_interval (float): time (in seconds) between the health checks. 0 disables the health checks.
+        health_check_timeout (float): time (in seconds) in which the coordinator handler must answer the `ping` request.
+        backoff_min (float): delay (in seconds) after the first failed attempt to connect.
+        backoff_max (float): maximum delay (in seconds) between the attempts to connect.
+    """
+
+    def __init__(self, size : int, health_check_interval : float = 30, health_check_timeout : float = 5,
+            backoff_min : float = 0.1, backoff_max : float = 5) -> None:
+        """Creates an empty pool.
+
+        Args:
+            size: maximum number of the connections.
+            health_check_interval: time (in seconds) between the health checks. 0 disables the health checks.
+            health_check_timeout: time (in seconds) in which the coordinator handler must answer the `ping` request.
+            backoff_min: delay (in seconds) after the first failed attempt to connect.
+            backoff_max: maximum delay (in seconds) between the attempts to connect.
+        """
+        self.size = max(1, size)
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self._connections : List[CoordinatorConnection] = []
+        self._lock = asyncio.Lock()
+        self._failed_attempts = 0
+        self._next_attempt = 0.0
+        self._health_check_task : Optional[asyncio.Task] = None
+
+    async def request(self, request : dict) -> dict:
+        """Sends a request over one of the connections and waits for its response.
+
+        Args:
+            request: the object which will be sent to the coordinator handler.
+
+        Returns:
+            The response of the coordinator handler.
+
+        Raises:
+            XBeeServerError: when no connection can be opened, or the connection breaks before the response arrives.
+        """
+        connection = await self._acquire()
+        return await connection.request(request)
+
+    async def close(self) -> None:
+        """Stops the health checks and closes all connections. The requests in progress fail."""
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            self._health_check_task = None
+        connections, self._connections = self._connections, []
+        await asyncio.gather(*(connection.close() for connection in connections), return_exceptions=True)
+
+    async def _acquire(self) -> CoordinatorConnection:
+        async with self._lock:
+            self._connections = [connection for connection in self._connections if connection.is_open]
+            least_busy = min(self._connections, key=lambda connection: connection.pending_count, default=None)
+            if least_busy is not None and (least_busy.pending_count == 0 or len(self._connections) >= self.size):
+                return least_busy
+            try:
+                connection = await self._open_connection()
+            except XBeeServerError:
+                if least_busy is not None:
+                    return least_busy
+                raise
+            self._connections.append(connection)
+            self._start_health_checks()
+            return connection
+
+    async def _open_connection(self) -> CoordinatorConnection:
+        delay = self._next_attempt - time.monotonic()
+        if delay > 0:
+            raise XBeeServerError(f"The coordinator handler is unavailable, next attempt to connect in {delay:.1f} s.")
+        connection = CoordinatorConnection()
+        try:
+            await connection.open()
+        except Exception as err:
+            self._failed_attempts += 1
+            backoff = min(self.backoff_max, self.backoff_min * 2 ** (self._failed_attempts - 1))
+            self._next_attempt = time.monotonic() + backoff
+            raise XBeeServerError(f"Couldn't connect to the coordinator handler: {err}")
+        self._failed_attempts = 0
+        self._next_attempt = 0.0
+        return connection
+
+    def _start_health_checks(self):
+        if self.health_check_interval > 0 and (self._health_check_task is None or self._health_check_task.done()):
+            self._health_check_task = asyncio.create_task(self._health_check_loop())
+
+    async def _health_check_loop(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            connections = [connection for connection in self._connections if connection.is_open]
+            await asyncio.gather(*(self._check_connection(connection) for connection in connections))
+
+    async def _check_connection(self, connection : CoordinatorConnection):
+        try:
+            await asyncio.wait_for(connection.request({"type":"request", "name":"ping"}), timeout=self.health_check_timeout)
+        except Exception:
+            await connection.close()
+
+_connection_pool : Optional[CoordinatorConnectionPool] = None
+
+def _get_connection_pool() -> CoordinatorConnectionPool:
+    global _connection_pool
+    if _connection_pool is None:
+        _connection_pool = CoordinatorConnectionPool(config.XBEE_POOL_SIZE, config.XBEE_HEALTH_CHECK_INTERVAL,
+            config.XBEE_HEALTH_CHECK_TIMEOUT, config.XBEE_RECONNECT_BACKOFF_MIN, config.XBEE_RECONNECT_BACKOFF_MAX)
+    return _connection_pool
+
+async def close_connection_pool() -> None:
+    """Closes the connections to the request-response server of the coordinator handler. It should be called on shutdown."""
+    global _connection_pool
+    if _connection_pool is not None:
+        await _connection_pool.close()
+        _connection_pool = None
+
+async def _open_coordinator_connection(port : int, unix_path : Optional[str] = None) -> Tuple[StreamReader, StreamWriter]:
+    if unix_path is None:
+        reader, writer = await asyncio.open_connection(config.XBEE_IP_ADDRESS, port)
+    else:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    return reader, writer
+
+async def _read_message(reader : StreamReader) -> dict:
+    message_json = await reader.readline()
+    if not message_json:
+        raise XBeeServerError("The coordinator handler closed the connection.")
+    return _decode_command(message_json)
+
 def _encode_command(command : dict) -> bytes:
     return (json.dumps(command) + "\n").encode()
 
@@ -159,11 +473,155 @@ def _make_at_command_response(xbee_response) -> pydmodels.AtCommandResult:
     else:
         return pydmodels.AtCommandResult(status="error", error=xbee_response["message"])
 
+_websocket_senders = set()
+
+def broadcast_to_websockets(message : dict) -> None:
+    """Sends a message to all connected websockets.
+
+    The message is serialized once and put into the :class:`~webserver.websocket_outbox.WebsocketOutbox`
+    of each :class:`~webserver.xbeesrv.WebsocketMessageSender`, so the function doesn't wait for the clients.
+    The results of a periodic reading replace the older results of the same reading which are still waiting to be sent.
+    A websocket whose outbox is full is closed if `WEBSOCKET_OVERFLOW_POLICY` is `disconnect`.
+
+    Args:
+        message: the message to send.
+    """
+    text = json.dumps(message)
+    key = _coalescing_key(message)
+    for sender in list(_websocket_senders):
+        if not sender.outbox.put(text, key):
+            _websocket_senders.discard(sender)
+            asyncio.create_task(sender._close_websocket())
+
+def _coalescing_key(message : dict) -> Optional[tuple]:
+    if message.get("type") == "reading":
+        return ("reading", message.get("reading_config_id"))
+    return None
+
+class NotificationSubscriber:
+    """The subscriber of the notification server of the coordinator handler, shared by all websockets of the webserver.
+
+    It keeps one connection to the notification server, parses each notification once
+    and broadcasts it to the websockets by :func:`~webserver.xbeesrv.broadcast_to_websockets`.
+
+    When the connection breaks (e.g. the coordinator handler is restarted), the subscriber reconnects, waiting
+    between the failed attempts from `backoff_min` up to `backoff_max` seconds. After reconnecting it sends
+    the `resume` message with the `epoch` and `seq` of the last notification, so the notifications received
+    by the coordinator handler in the meantime are not lost. The notifications which were already broadcast are skipped.
+
+    Attributes:
+        backoff_min (float): delay (in seconds) before reconnecting after the connection is lost.
+        backoff_max (float): maximum delay (in seconds) between the attempts to connect.
+        epoch (Optional[str]): the epoch of the last received notification.
+        last_seq (Optional[int]): the sequence number of the last received notification.
+    """
+
+    def __init__(self, backoff_min : float = 0.1, backoff_max : float = 5) -> None:
+        """Creates the subscriber. It is started by :meth:`start`.
+
+        Args:
+            backoff_min: delay (in seconds) before reconnecting after the connection is lost.
+            backoff_max: maximum delay (in seconds) between the attempts to connect.
+        """
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.epoch : Optional[str] = None
+        self.last_seq : Optional[int] = None
+        self._task : Optional[asyncio.Task] = None
+        self.logger = logging.getLogger(__name__)
+
+    def start(self) -> None:
+        """Starts the subscriber if it's not running yet."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the subscriber and closes its connection."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        failed_attempts = 0
+        while True:
+            try:
+                reader, writer = await _open_coordinator_connection(config.XBEE_PORT_NOTIFY, config.XBEE_UNIX_SOCKET_NOTIFY)
+            except Exception as err:
+                failed_attempts += 1
+                delay = min(self.backoff_max, self.backoff_min * 2 ** (failed_attempts - 1))
+                if failed_attempts == 1:
+                    self.logger.error(f"Could not connect to the notification server of the coordinator handler: {err}")
+                await asyncio.sleep(delay)
+                continue
+            failed_attempts = 0
+            try:
+                await self._receive_notifications(reader, writer)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.logger.error(f"Connection to the notification server of the coordinator handler lost: {err}")
+            finally:
+                writer.close()
+            await asyncio.sleep(self.backoff_min)
+
+    async def _receive_notifications(self, reader : StreamReader, writer : StreamWriter):
+        # The notification server doesn't send any notifications until the first message.
+        if self.last_seq is not None:
+            writer.write(_encode_command({"type":"resume", "epoch":self.epoch, "since":self.last_seq}))
+        else:
+            writer.write(_encode_command({"type":"subscribe", "filters":[]}))
+        await writer.drain()
+        while True:
+            message = await _read_message(reader)
+            if message.get("type") == "resumed":
+                if message.get("gap"):
+                    self.logger.warning("Some notifications were lost while the webserver was disconnected from the coordinator handler.")
+            elif message.get("type") == "notify":
+                self._handle_notification(message)
+
+    def _handle_notification(self, notification : dict):
+        seq, epoch = notification.get("seq"), notification.get("epoch")
+        if isinstance(seq, int):
+            if epoch == self.epoch and self.last_seq is not None and seq <= self.last_seq:
+                return
+            self.epoch, self.last_seq = epoch, seq
+        try:
+            data = notification["data"]
+            websocket_message = {'type':'received', 'address64':data['address64'], 'message':data['message']}
+        except (KeyError, TypeError, ValueError):
+            return
+        broadcast_to_websockets(websocket_message)
+
+_notification_subscriber : Optional[NotificationSubscriber] = None
+
+def _get_notification_subscriber() -> NotificationSubscriber:
+    global _notification_subscriber
+    if _notification_subscriber is None:
+        _notification_subscriber = NotificationSubscriber(config.XBEE_RECONNECT_BACKOFF_MIN, config.XBEE_RECONNECT_BACKOFF_MAX)
+    return _notification_subscriber
+
+async def stop_notification_subscriber() -> None:
+    """Stops the subscriber of the notification server of the coordinator handler. It should be called on shutdown."""
+    global _notification_subscriber
+    if _notification_subscriber is not None:
+        await _notification_subscriber.stop()
+        _notification_subscriber = None
+
 class WebsocketMessageSender:
-    """Class for receiving notifications from the coordinator handler and sending them to the connected websockets.
-    
+    """Class for sending the notifications from the coordinator handler and the messages broadcast by the webserver to a websocket.
+
+    The notifications are received by the :class:`~webserver.xbeesrv.NotificationSubscriber` shared by all websockets,
+    which is started when the first websocket connects.
+
+    The messages wait in a bounded :class:`~webserver.websocket_outbox.WebsocketOutbox`, so a slow client doesn't make
+    the webserver use more and more memory. They are sent in batches: after the first message arrives, the sender waits
+    `WEBSOCKET_BATCH_TIME` seconds (unless `WEBSOCKET_BATCH_SIZE` messages are already waiting) and sends all waiting messages,
+    up to `WEBSOCKET_BATCH_SIZE`, in one frame `{"type":"batch", "messages":[...]}`. A single message is sent without the envelope.
+
     Attributes:
         websocket (starlette.websockets.WebSocket): the websocket to which the notifications are sent.
+        outbox (WebsocketOutbox): the buffer of the serialized messages which will be sent to the websocket.
     """
 
     def __init__(self, websocket : WebSocket):
@@ -173,47 +631,46 @@ class WebsocketMessageSender:
             websocket: the websockets where the messages will be sent.
         """
         self.websocket = websocket
+        self.outbox = WebsocketOutbox(config.WEBSOCKET_BUFFER_SIZE, config.WEBSOCKET_OVERFLOW_POLICY)
 
     async def run(self):
         """Starts the sender. The function returns when the socket if closed."""
 
         await self.websocket.accept()
-        self.send_messages_task = asyncio.create_task(self._send_messages())
-        await self._receive_messages()
+        _get_notification_subscriber().start()
+        self.send_broadcast_messages_task = asyncio.create_task(self._send_broadcast_messages())
+        _websocket_senders.add(self)
+        try:
+            await self._receive_messages()
+        finally:
+            _websocket_senders.discard(self)
+            self.send_broadcast_messages_task.cancel()
 
     async def _receive_messages(self):
         try:
             while True:
                 await self.websocket.receive_text()
         except WebSocketDisconnect as err:
-            self.send_messages_task.cancel()
+            pass
 
-    async def _send_messages(self):
-        reader, writer = await asyncio.open_connection(
-            config.XBEE_IP_ADDRESS, config.XBEE_PORT_NOTIFY)
+    async def _send_broadcast_messages(self):
         try:
-            await self._send_messages_loop(reader)
+            while True:
+                await self.outbox.wait()
+                if len(self.outbox) < config.WEBSOCKET_BATCH_SIZE and config.WEBSOCKET_BATCH_TIME > 0:
+                    await asyncio.sleep(config.WEBSOCKET_BATCH_TIME)
+                texts = self.outbox.take(config.WEBSOCKET_BATCH_SIZE)
+                if len(texts) == 1:
+                    await self.websocket.send_text(texts[0])
+                elif texts:
+                    await self.websocket.send_text('{"type":"batch","messages":[' + ",".join(texts) + ']}')
         except asyncio.CancelledError:
             raise
-        finally:
-            writer.close()
-            await writer.wait_closed()
+        except Exception:
             await self._close_websocket()
 
-    async def _send_messages_loop(self, reader : StreamReader):
-        while True:
-            await self._send_one_message(reader)
-
-    async def _send_one_message(self, reader : StreamReader):
+    async def _close_websocket(self):
         try:
-            response_json = await reader.readline()
-            response_dict = _decode_command(response_json)
-            websocket_message = {'type':'received', 'address64':response_dict['data']['address64'], 'message':response_dict['data']['message']}
-            await self.websocket.send_json(websocket_message)
-        except MessageParseError:
+            await self.websocket.close()
+        except Exception:
             pass
-    
-    async def _close_websocket(self):
-        await self.websocket.close()
-
-    